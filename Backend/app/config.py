@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+# ======================================================
+# Storage
+# ======================================================
+
+# "json" (default, files under STORAGE_DIR) or "sqlite"
+STORAGE_BACKEND = os.getenv("PMS_STORAGE_BACKEND", "json").lower()
+
+STORAGE_DIR = Path(os.getenv("PMS_STORAGE_DIR", "app/storage"))
+
+TASK_FILE = STORAGE_DIR / "tasks.json"
+PROJECT_FILE = STORAGE_DIR / "projects.json"
+SQLITE_FILE = Path(os.getenv("PMS_SQLITE_FILE", str(STORAGE_DIR / "pms.sqlite3")))
+
+# ======================================================
+# Caching
+# ======================================================
+
+# Entries kept by each in-process result cache (services/result_cache.py)
+RESULT_CACHE_SIZE = int(os.getenv("PMS_RESULT_CACHE_SIZE", "1024"))
+
+# List responses with more items than this are streamed in chunks
+# instead of being encoded into one body (app/responses.py)
+STREAM_MIN_ITEMS = int(os.getenv("PMS_STREAM_MIN_ITEMS", "2000"))
+
+# ======================================================
+# Notification stream (SSE)
+# ======================================================
+
+# Seconds between keep-alive comments on an idle stream; also how often
+# a stream checks the store for notifications created by other workers
+SSE_HEARTBEAT_SECONDS = float(os.getenv("PMS_SSE_HEARTBEAT_SECONDS", "15"))
+
+# ======================================================
+# Background maintenance
+# ======================================================
+
+# Seconds between runs of light housekeeping jobs (services/maintenance.py)
+MAINTENANCE_INTERVAL_SECONDS = float(os.getenv("PMS_MAINTENANCE_INTERVAL_SECONDS", "60"))
+
+# Notification retention (services/notifications.apply_retention):
+# read notifications older than NOTIFICATION_READ_MAX_AGE_DAYS, and the
+# oldest read ones beyond NOTIFICATION_MAX_PER_INBOX per employee, move
+# to the compressed archive. Unread notifications are never archived.
+# 0 disables a rule.
+NOTIFICATION_MAX_PER_INBOX = int(os.getenv("PMS_NOTIFICATION_MAX_PER_INBOX", "500"))
+NOTIFICATION_READ_MAX_AGE_DAYS = int(os.getenv("PMS_NOTIFICATION_READ_MAX_AGE_DAYS", "30"))
+RETENTION_INTERVAL_SECONDS = float(os.getenv("PMS_RETENTION_INTERVAL_SECONDS", "3600"))
+
+# ======================================================
+# Side-effect dispatcher
+# ======================================================
+
+# Notifications / history entries of task assignments are applied in the
+# background (services/dispatcher.py): DISPATCH_WORKERS queues, applied up
+# to DISPATCH_BATCH_SIZE per commit; assigning requests wait while a queue
+# holds DISPATCH_QUEUE_SIZE effects or more
+DISPATCH_WORKERS = int(os.getenv("PMS_DISPATCH_WORKERS", "4"))
+DISPATCH_QUEUE_SIZE = int(os.getenv("PMS_DISPATCH_QUEUE_SIZE", "1000"))
+DISPATCH_BATCH_SIZE = int(os.getenv("PMS_DISPATCH_BATCH_SIZE", "200"))
@@ -2,19 +2,31 @@
 
 from app.enums import TaskStatus
 from app.utils import get_availability_status
-from app.services.task_storage import get_all_tasks
+from app.services.task_storage import get_all_tasks, get_version as get_tasks_version
 
 # Re-export Database items (careful with mutable counters)
+import app.database as db
 from app.database import (
-    employees_db, managers_db, task_queue, notifications_db, 
+    employees_db, managers_db, task_queue,
     employee_task_history, task_counter, notification_counter
 )
 
+
+def __getattr__(name):
+    # `notifications_db` is rebound on every reload / reclaim, so a plain
+    # re-export would go stale; resolve it on each access instead. It is
+    # a {notificationId: NotificationRecord} dict in id order (was a list).
+    if name == "notifications_db":
+        return db.notifications_db
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Re-export Services
 from app.services.employees import (
     get_all_employees, get_employee_by_id, get_employees_ranked, 
-    update_employee_on_assignment, get_all_employee_profiles, 
-    get_employee_profile_by_id, map_employee_to_profile
+    update_employee_on_assignment, update_employee_on_completion,
+    get_all_employee_profiles, 
+    get_employee_profile_by_id, map_employee_to_profile,
+    get_version as get_employees_version
 )
 
 from app.services.managers import (
@@ -22,16 +34,25 @@ from app.services.managers import (
 )
 
 from app.services.tasks import (
-    create_task, get_task_by_id, get_manager_task_queue, 
-    get_task_details_with_employees, assign_task_to_employees
+    create_task, get_task_by_id, get_manager_task_queue, get_task_page,
+    get_manager_status_counts,
+    get_task_details_with_employees, assign_task_to_employees,
+    record_task_status
 )
 
 from app.services.notifications import (
     create_notification, get_employee_notifications, 
-    mark_notification_read, get_all_notifications, delete_notification
+    mark_notification_read, get_all_notifications, delete_notification,
+    get_employee_notifications_after, get_last_notification_id,
+    count_employee_notifications, count_notifications,
+    mark_all_notifications_read,
+    get_archived_notifications,
+    get_notification_by_id,
+    get_employee_version as get_notifications_version
 )
 
 from app.services.history import (
     add_task_to_employee_history, get_employee_task_history, 
-    update_task_status_in_history
+    get_employee_history_summary, update_task_status_in_history,
+    get_version as get_history_version
 )
\ No newline at end of file
@@ -1,5 +1,7 @@
 from typing import List, Dict
 
+from app.records import HistoryEntry, NotificationRecord
+
 # ===== IN-MEMORY DATABASES =====
 
 employees_db: List[Dict] = [
@@ -174,10 +176,10 @@ task_queue: List[Dict] = []
 task_counter: int = 0
 
 # Notifications Database
-notifications_db: List[Dict] = []
+notifications_db: Dict[int, NotificationRecord] = {}  # by notificationId, in id order
 notification_counter: int = 0
 
 # Employee Task History
-employee_task_history: Dict[str, List[Dict]] = {
+employee_task_history: Dict[str, List[HistoryEntry]] = {
     emp["employeeId"]: [] for emp in employees_db
 }
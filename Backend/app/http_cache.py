@@ -0,0 +1,49 @@
+import zlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Conditional GET support: ETags are built from data-version counters
+# (see task_storage.get_version & co.), so checking one costs a counter
+# lookup, not a load or a serialization.
+
+
+def make_etag(request: Request, *parts) -> str:
+    """
+    Weak ETag from version parts, e.g. ("tasks", "MGR001", 42).
+    The query string is folded in so each page / filter gets its own tag.
+    """
+    tag = "-".join(str(part) for part in parts)
+    if request.url.query:
+        tag += f"-{zlib.crc32(request.url.query.encode()):08x}"
+    return f'W/"{tag}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_etag(request: Request, response: Response, *parts) -> Optional[Response]:
+    """
+    Tag `response` with the ETag of `parts`. If the client's
+    If-None-Match already has it, return a 304 to send instead of
+    building the body; otherwise return None.
+
+    `Cache-Control: no-cache` lets browsers keep the body but revalidate
+    on every request, so unchanged dashboards get 304s transparently.
+    """
+    etag = make_etag(request, *parts)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
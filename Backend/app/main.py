@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -12,14 +15,48 @@ from app.routers.projects import router as projects_router
 
 
 
-# Database (single source of truth)
-from app import database
+from app import config
+from app.enums import TaskStatus
+from app.services import dispatcher, employees, history, maintenance, notifications
+from app.services.stats import get_stats
+
+# ======================================================
+# Startup / Shutdown
+# ======================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Restore persisted employees / history / notifications, then
+    # re-derive workloads from the task store so they cannot drift
+    employees.restore()
+    history.restore()
+    notifications.restore()
+    employees.recompute_workloads()
+
+    # Assignment side effects and housekeeping off the request path
+    dispatcher.start()
+    maintenance_task = asyncio.create_task(maintenance.run_periodically([
+        (notifications.apply_retention, config.RETENTION_INTERVAL_SECONDS),
+        (notifications.reclaim, config.MAINTENANCE_INTERVAL_SECONDS)
+    ]))
+
+    yield
+
+    maintenance_task.cancel()
+    # Apply queued notifications / history before the journals are folded
+    await dispatcher.stop()
+
+    # Fold journals into their snapshots for a fast next start
+    employees.compact()
+    history.compact()
+    notifications.compact()
 
 # ======================================================
 # Create FastAPI application
 # ======================================================
 
 app = FastAPI(
+    lifespan=lifespan,
     title="PMS Demo API",
     description="Performance Management System - Task & Employee Management",
     version="1.0.0",
@@ -65,28 +102,44 @@ app.include_router(projects_router)
 async def health_check():
     """
     Health check endpoint to verify API is running.
+    Stats come from maintained counters (constant time).
     """
+    stats = get_stats()
     return {
         "status": "healthy",
         "service": "PMS API",
         "version": "1.0.0",
         "stats": {
-            "totalEmployees": len(database.employees_db),
-            "totalManagers": len(database.managers_db),
-            "totalTasks": len(database.task_queue),
-            "pendingTasks": len(
-                [t for t in database.task_queue if t["status"] == "Pending"]
-            ),
-            "assignedTasks": len(
-                [t for t in database.task_queue if t["status"] == "Assigned"]
-            ),
-            "totalNotifications": len(database.notifications_db),
-            "unreadNotifications": len(
-                [n for n in database.notifications_db if not n["isRead"]]
-            )
+            "totalEmployees": stats["employees"],
+            "totalManagers": stats["managers"],
+            "totalTasks": stats["tasks"]["total"],
+            "pendingTasks": stats["tasks"]["byStatus"][TaskStatus.PENDING.value],
+            "assignedTasks": stats["tasks"]["byStatus"][TaskStatus.ASSIGNED.value],
+            "totalNotifications": stats["notifications"]["total"],
+            "unreadNotifications": stats["notifications"]["unread"]
         }
     }
 
+
+@app.get("/api/health/live", tags=["System"])
+async def liveness():
+    """
+    Liveness probe for load balancers: no storage access at all.
+    """
+    return {"status": "healthy"}
+
+
+@app.get("/api/health/stats", tags=["System"])
+async def detailed_stats():
+    """
+    Detailed counters: tasks per status, notifications read / unread,
+    employees and managers.
+    """
+    return {
+        "success": True,
+        "stats": get_stats()
+    }
+
 # ======================================================
 # Run Server (Dev Only)
 # ======================================================
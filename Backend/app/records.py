@@ -0,0 +1,262 @@
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Collection, Dict, NamedTuple, Optional, Tuple
+
+# Internal record types used by services/*.
+#
+# Slotted dataclasses instead of free-form dicts: no per-instance
+# __dict__ and no repeated key strings. Low-cardinality values (IDs,
+# names, statuses, priorities) are interned so every record shares one
+# string object per distinct value.
+#
+# Routers convert records to the JSON (camelCase) shape with
+# `to_dict()` / `to_json()`; storage files keep that same shape.
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, Enum):  # e.g. TaskStatus from a request model
+        value = value.value
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def parse_fields(spec: Optional[str], allowed: Collection[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a `fields=a,b,c` projection: the requested JSON keys in order
+    (duplicates dropped), or None for "all fields" when `spec` is empty.
+    Raises ValueError naming any key not in `allowed`.
+    """
+    if not spec:
+        return None
+    fields = tuple(dict.fromkeys(name.strip() for name in spec.split(",") if name.strip()))
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return fields or None
+
+
+def _project(record: Any, getters: Dict[str, Callable], fields: Tuple[str, ...]) -> Dict:
+    return {name: getters[name](record) for name in fields}
+
+
+# ==============================
+# TASKS
+# ==============================
+
+class Assignee(NamedTuple):
+    employee_id: str
+    employee_name: str
+
+    def to_dict(self) -> Dict:
+        return {"employeeId": self.employee_id, "employeeName": self.employee_name}
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    title: str
+    description: str
+    priority: str
+    status: str
+    manager_id: str
+    manager_name: str
+    created_at: str
+    deadline: Optional[str] = None
+    metadata: Optional[Dict] = None      # None when empty
+    assigned_employees: Tuple[Assignee, ...] = ()
+    assigned_at: Optional[str] = None
+    task_id: int = 0                     # set by task_storage on create
+    version: int = 0                     # set by task_storage on create / update
+
+    @property
+    def project_name(self) -> Optional[str]:
+        return self.metadata.get("projectName") if self.metadata else None
+
+    @property
+    def employee_ids(self) -> Tuple[str, ...]:
+        return tuple(emp.employee_id for emp in self.assigned_employees)
+
+    @property
+    def sort_key(self) -> Tuple[str, int]:
+        """Position in newest-first listings: createdAt, then taskId."""
+        return (self.created_at or "", self.task_id)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TaskRecord":
+        return cls(
+            title=data["title"],
+            description=data["description"],
+            priority=_intern(data.get("priority")),
+            status=_intern(data.get("status")),
+            manager_id=_intern(data.get("managerId")),
+            manager_name=_intern(data.get("managerName")),
+            created_at=data.get("createdAt"),
+            deadline=_intern(data.get("deadline")),
+            metadata=data.get("metadata") or None,
+            assigned_employees=tuple(
+                Assignee(_intern(emp.get("employeeId")), _intern(emp.get("employeeName")))
+                for emp in data.get("assignedEmployees") or []
+            ),
+            assigned_at=data.get("assignedAt"),
+            task_id=data.get("taskId", 0),
+            version=data.get("version", 0)
+        )
+
+    def to_dict(self, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """JSON shape; only the `fields` keys (see `parse_fields`) if given."""
+        if fields is not None:
+            return _project(self, _TASK_GETTERS, fields)
+        return {
+            "title": self.title,
+            "description": self.description,
+            "priority": self.priority,
+            "deadline": self.deadline,
+            "metadata": self.metadata or {},
+            "status": self.status,
+            "managerId": self.manager_id,
+            "managerName": self.manager_name,
+            "assignedEmployees": [emp.to_dict() for emp in self.assigned_employees],
+            "createdAt": self.created_at,
+            "assignedAt": self.assigned_at,
+            "taskId": self.task_id,
+            "version": self.version
+        }
+
+
+# JSON key -> value, for projected `to_dict(fields)` (same keys, same order)
+_TASK_GETTERS: Dict[str, Callable[[TaskRecord], Any]] = {
+    "title": attrgetter("title"),
+    "description": attrgetter("description"),
+    "priority": attrgetter("priority"),
+    "deadline": attrgetter("deadline"),
+    "metadata": lambda task: task.metadata or {},
+    "status": attrgetter("status"),
+    "managerId": attrgetter("manager_id"),
+    "managerName": attrgetter("manager_name"),
+    "assignedEmployees": lambda task: [emp.to_dict() for emp in task.assigned_employees],
+    "createdAt": attrgetter("created_at"),
+    "assignedAt": attrgetter("assigned_at"),
+    "taskId": attrgetter("task_id"),
+    "version": attrgetter("version")
+}
+TASK_FIELDS = tuple(_TASK_GETTERS)
+
+
+# ==============================
+# NOTIFICATIONS
+# ==============================
+
+@dataclass(slots=True)
+class NotificationRecord:
+    notification_id: int
+    employee_id: str
+    employee_name: str
+    manager_id: str
+    manager_name: str
+    task_id: int
+    message: str
+    is_read: bool
+    created_at: str
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NotificationRecord":
+        return cls(
+            notification_id=data["notificationId"],
+            employee_id=_intern(data.get("employeeId")),
+            employee_name=_intern(data.get("employeeName")),
+            manager_id=_intern(data.get("managerId")),
+            manager_name=_intern(data.get("managerName")),
+            task_id=data.get("taskId"),
+            message=data.get("message"),
+            is_read=data.get("isRead", False),
+            created_at=data.get("createdAt")
+        )
+
+    def to_dict(self, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """JSON shape; only the `fields` keys (see `parse_fields`) if given."""
+        if fields is not None:
+            return _project(self, _NOTIFICATION_GETTERS, fields)
+        return {
+            "notificationId": self.notification_id,
+            "employeeId": self.employee_id,
+            "employeeName": self.employee_name,
+            "managerId": self.manager_id,
+            "managerName": self.manager_name,
+            "taskId": self.task_id,
+            "message": self.message,
+            "isRead": self.is_read,
+            "createdAt": self.created_at
+        }
+
+
+_NOTIFICATION_GETTERS: Dict[str, Callable[[NotificationRecord], Any]] = {
+    "notificationId": attrgetter("notification_id"),
+    "employeeId": attrgetter("employee_id"),
+    "employeeName": attrgetter("employee_name"),
+    "managerId": attrgetter("manager_id"),
+    "managerName": attrgetter("manager_name"),
+    "taskId": attrgetter("task_id"),
+    "message": attrgetter("message"),
+    "isRead": attrgetter("is_read"),
+    "createdAt": attrgetter("created_at")
+}
+NOTIFICATION_FIELDS = tuple(_NOTIFICATION_GETTERS)
+
+
+# ==============================
+# TASK HISTORY
+# ==============================
+
+@dataclass(slots=True)
+class HistoryEntry:
+    task_id: int
+    task_title: str
+    manager_id: str
+    manager_name: str
+    assigned_at: str
+    status: str
+    completed_at: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HistoryEntry":
+        return cls(
+            task_id=data["taskId"],
+            task_title=data.get("taskTitle"),
+            manager_id=_intern(data.get("managerId")),
+            manager_name=_intern(data.get("managerName")),
+            assigned_at=data.get("assignedAt"),
+            status=_intern(data.get("status")),
+            completed_at=data.get("completedAt")
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "taskId": self.task_id,
+            "taskTitle": self.task_title,
+            "managerId": self.manager_id,
+            "managerName": self.manager_name,
+            "assignedAt": self.assigned_at,
+            "status": self.status,
+            "completedAt": self.completed_at
+        }
+
+
+# ==============================
+# ROUTER BOUNDARY
+# ==============================
+
+_RECORD_TYPES = (TaskRecord, NotificationRecord, HistoryEntry, Assignee)
+
+
+def to_json(value: Any) -> Any:
+    """
+    JSON shape of `value`: records (also inside lists / dicts) become
+    dicts, everything else is returned unchanged.
+    """
+    if isinstance(value, _RECORD_TYPES):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    return value
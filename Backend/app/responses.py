@@ -0,0 +1,121 @@
+import json
+from itertools import islice
+from typing import Any, Callable, Collection, Dict, Iterable, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app import config
+from app.records import parse_fields
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+# Opt-in fast path for large list endpoints. Routes return these
+# responses directly, which skips FastAPI's `jsonable_encoder` pass, so
+# content must already be plain JSON data (records -> `to_dict()`).
+
+# Items encoded per chunk of a streamed list
+STREAM_CHUNK_ITEMS = 500
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, the same bytes Starlette's JSONResponse makes."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fields_query(allowed: Collection[str]) -> Callable:
+    """
+    FastAPI dependency for a `fields=a,b,c` projection parameter: the
+    requested keys (None for all), or 400 on an unknown key.
+    """
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description="Comma-separated keys to return for each item"
+        )
+    ) -> Optional[Tuple[str, ...]]:
+        try:
+            return parse_fields(fields, allowed)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "success": False,
+                    "message": str(e)
+                }
+            )
+
+    return dependency
+
+
+def _extra_headers(response: Optional[Response]) -> Dict[str, str]:
+    """
+    Headers routes set on FastAPI's injected `response` (e.g. ETag from
+    `check_etag`), which are dropped when a route returns its own
+    Response.
+    """
+    if response is None:
+        return {}
+    return {
+        key: value for key, value in response.headers.items()
+        if key not in ("content-length", "content-type")
+    }
+
+
+def json_list_response(
+    head: Dict,
+    key: str,
+    items: Iterable,
+    count: int,
+    encode: Callable[[Any], Any] = lambda item: item.to_dict(),
+    response: Optional[Response] = None
+) -> Response:
+    """
+    `{**head, key: [encode(item) for item in items]}` as a response.
+
+    Lists longer than `config.STREAM_MIN_ITEMS` (`count` items) are
+    streamed chunk by chunk, so the encoded body is never held in memory
+    as a whole; shorter ones are rendered in one go.
+    """
+    headers = _extra_headers(response)
+
+    if count <= config.STREAM_MIN_ITEMS:
+        content = {**head, key: [encode(item) for item in items]}
+        return FastJSONResponse(content, headers=headers)
+
+    return StreamingResponse(
+        _stream_object(head, key, items, encode),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def _stream_object(head: Dict, key: str, items: Iterable, encode: Callable):
+    opening = dumps(head)[:-1]
+    if head:
+        opening += b","
+    yield opening + dumps(key) + b":["
+
+    items = iter(items)
+    separator = b""
+    while True:
+        chunk = list(islice(items, STREAM_CHUNK_ITEMS))
+        if not chunk:
+            break
+        yield separator + b",".join(dumps(encode(item)) for item in chunk)
+        separator = b","
+
+    yield b"]}"
@@ -1,5 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import Optional, Tuple
 from app import data
+from app.http_cache import check_etag
+from app.responses import fields_query, json_list_response
+from app.records import NOTIFICATION_FIELDS, to_json
+from app.services.employees import EMPLOYEE_FIELDS
 
 router = APIRouter(prefix="/api/employees", tags=["Employees"])
 
@@ -48,32 +53,61 @@ async def get_employee_profile(employee_id: str):
 # =========================================================
 
 @router.get("/", summary="Get all employees")
-async def get_all_employees():
-    """Returns all employees with their current data"""
-    employees = data.get_all_employees()
-
-    employees_with_history = []
-    for emp in employees:
-        history = data.get_employee_task_history(emp["employeeId"])
-        employees_with_history.append({
-            **emp,
-            "taskHistorySummary": {
-                "totalTasks": history["totalTasks"],
-                "activeTasks": history["activeCount"],
-                "completedTasks": history["completedCount"]
+async def get_all_employees(
+    request: Request,
+    response: Response,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(EMPLOYEE_FIELDS))
+):
+    """
+    Returns all employees with their current data.
+    `fields` limits the keys of each employee.
+    """
+    not_modified = check_etag(
+        request, response, "employees",
+        data.get_employees_version(), data.get_history_version()
+    )
+    if not_modified:
+        return not_modified
+
+    employees = list(data.get_all_employees())
+
+    def with_history(emp):
+        if fields is not None:
+            return {
+                name: (
+                    data.get_employee_history_summary(emp["employeeId"])
+                    if name == "taskHistorySummary" else emp.get(name)
+                )
+                for name in fields
             }
-        })
+        return {
+            **emp,
+            "taskHistorySummary": data.get_employee_history_summary(emp["employeeId"])
+        }
 
-    return {
-        "success": True,
-        "count": len(employees_with_history),
-        "data": employees_with_history
-    }
+    return json_list_response(
+        {"success": True, "count": len(employees)},
+        "data", employees, count=len(employees),
+        encode=with_history,
+        response=response
+    )
 
 
 @router.get("/ranking", summary="Get employees ranked by availability")
-async def get_employee_ranking():
-    ranking = data.get_employees_ranked()
+async def get_employee_ranking(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1)
+):
+    """
+    `limit` returns only the top-k least-loaded employees.
+    Supports `If-None-Match`: 304 while no employee changed.
+    """
+    not_modified = check_etag(request, response, "ranking", data.get_employees_version())
+    if not_modified:
+        return not_modified
+
+    ranking = data.get_employees_ranked(limit)
     return {
         "success": True,
         "description": "Employees ranked by availability (fewer projects = higher rank)",
@@ -107,7 +141,13 @@ async def get_employee(employee_id: str):
 
 
 @router.get("/{employee_id}/notifications", summary="Get employee notifications")
-async def get_employee_notifications(employee_id: str, unread_only: bool = False):
+async def get_employee_notifications(
+    request: Request,
+    response: Response,
+    employee_id: str,
+    unread_only: bool = False,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(NOTIFICATION_FIELDS))
+):
     employee = data.get_employee_by_id(employee_id)
 
     if not employee:
@@ -119,6 +159,13 @@ async def get_employee_notifications(employee_id: str, unread_only: bool = False
             }
         )
 
+    not_modified = check_etag(
+        request, response, "notifications", employee_id,
+        data.get_notifications_version(employee_id), data.get_employees_version()
+    )
+    if not_modified:
+        return not_modified
+
     notifications = data.get_employee_notifications(employee_id, unread_only)
 
     return {
@@ -129,7 +176,7 @@ async def get_employee_notifications(employee_id: str, unread_only: bool = False
         },
         "unreadOnly": unread_only,
         "count": len(notifications),
-        "notifications": notifications
+        "notifications": [n.to_dict(fields) for n in notifications]
     }
 
 
@@ -156,7 +203,7 @@ async def get_employee_task_history(employee_id: str):
             "currentTaskDetails": employee["currentTaskDetails"],
             "noOfActiveProjects": employee["noOfActiveProjects"]
         },
-        "taskHistory": history,
+        "taskHistory": to_json(history),
         "summary": {
             "totalTasksAssigned": history["totalTasks"],
             "currentlyActive": history["activeCount"],
@@ -1,11 +1,82 @@
-from fastapi import APIRouter
-from app.services.task_storage import get_all_tasks
+from typing import Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from app.records import TaskRecord
+from app.services.task_storage import query_tasks
+from app.services.tasks import get_active_tasks_by_employee
 
 router = APIRouter(
     prefix="/api/tasks",
     tags=["Tasks"]
 )
 
+# Upper bound for the number of employee IDs in one batch request
+MAX_BATCH_EMPLOYEES = 500
+
+
+def _employee_task(task: TaskRecord) -> Dict:
+    return {
+        "taskId": task.task_id,
+        "title": task.title,
+        "description": task.description,
+        "projectName": task.project_name,
+        "priority": task.priority,
+        "deadline": task.deadline,
+        "status": task.status,
+        "managerName": task.manager_name,
+        "assignedAt": task.assigned_at
+    }
+
+
+@router.get(
+    "/employees/active",
+    summary="Get active tasks of several employees"
+)
+def get_tasks_for_employees(
+    ids: Optional[str] = Query(None, description="Comma-separated employee IDs"),
+    managerId: Optional[str] = None
+):
+    """
+    Active tasks grouped by employee, in one request (instead of one
+    `/employee/{employee_id}` call per team member).
+
+    - `ids`: the employees to include (each gets an entry, maybe empty)
+    - `managerId`: only that manager's tasks; without `ids`, every
+      employee holding one of them is included
+    """
+    employee_ids = None
+    if ids is not None:
+        employee_ids = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+
+    if not employee_ids and not managerId:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "message": "Provide 'ids' and/or 'managerId'"
+            }
+        )
+    if employee_ids and len(employee_ids) > MAX_BATCH_EMPLOYEES:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "message": f"At most {MAX_BATCH_EMPLOYEES} employee IDs per request"
+            }
+        )
+
+    groups = get_active_tasks_by_employee(employee_ids or None, managerId)
+
+    return {
+        "success": True,
+        "count": len(groups),
+        "tasksByEmployee": {
+            employee_id: [_employee_task(task) for task in tasks]
+            for employee_id, tasks in groups.items()
+        }
+    }
+
+
 @router.get(
     "/employee/{employee_id}",
     summary="Get tasks assigned to an employee"
@@ -15,27 +86,12 @@ def get_tasks_for_employee(employee_id: str):
     Returns active tasks assigned to a specific employee.
     """
 
-    tasks = get_all_tasks()  # returns LIST
-
-    employee_tasks = []
-
-    for task in tasks:
-        if task.get("status") not in ["Assigned", "In Progress"]:
-            continue
-
-        for emp in task.get("assignedEmployees", []):
-            if emp.get("employeeId") == employee_id:
-                employee_tasks.append({
-                    "taskId": task["taskId"],
-                    "title": task["title"],
-                    "description": task["description"],
-                    "projectName": task.get("metadata", {}).get("projectName"),
-                    "priority": task["priority"],
-                    "deadline": task["deadline"],
-                    "status": task["status"],
-                    "managerName": task["managerName"],
-                    "assignedAt": task["assignedAt"]
-                })
+    tasks = query_tasks(
+        employee_id=employee_id,
+        status=["Assigned", "In Progress"]
+    )
+
+    employee_tasks = [_employee_task(task) for task in tasks]
 
     return {
         "success": True,
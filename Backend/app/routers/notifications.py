@@ -1,40 +1,55 @@
-from fastapi import APIRouter, HTTPException
-from typing import Optional
-from app import data
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Optional, Tuple
+from app import config, data
+from app.http_cache import check_etag
+from app.records import NOTIFICATION_FIELDS
+from app.responses import dumps, fields_query, json_list_response
+from app.services import notification_stream
 
 router = APIRouter(prefix="/api/notifications", tags=["Notifications"])
 
+# Reconnect delay suggested to EventSource clients
+SSE_RETRY_MS = 3000
+
+# Upper bound for the `limit` of archive pages
+MAX_ARCHIVE_PAGE_SIZE = 500
+
 
 @router.get("/", summary="Get all notifications")
-async def get_all_notifications():
+async def get_all_notifications(
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(NOTIFICATION_FIELDS))
+):
     """
     Get all notifications in the system.
     
     Useful for testing and admin purposes.
     Returns notifications sorted by date (newest first).
+    `fields` limits the keys of each notification.
     """
     notifications = data.get_all_notifications()
     
-    # Count stats
-    total = len(notifications)
-    unread = len([n for n in notifications if not n["isRead"]])
-    read = total - unread
+    # Maintained counters, no scan
+    stats = data.count_notifications()
     
-    return {
-        "success": True,
-        "stats": {
-            "total": total,
-            "unread": unread,
-            "read": read
+    return json_list_response(
+        {
+            "success": True,
+            "stats": stats
         },
-        "notifications": notifications
-    }
+        "notifications", notifications, count=len(notifications),
+        encode=lambda notification: notification.to_dict(fields)
+    )
 
 
 @router.get("/employee/{employee_id}", summary="Get notifications for employee")
 async def get_notifications_for_employee(
+    request: Request,
+    response: Response,
     employee_id: str, 
-    unread_only: bool = False
+    unread_only: bool = False,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(NOTIFICATION_FIELDS))
 ):
     """
     Get all notifications for a specific employee.
@@ -43,10 +58,14 @@ async def get_notifications_for_employee(
     
     **Query Parameters:**
     - `unread_only`: If true, only returns unread notifications
+    - `fields`: Comma-separated keys to return per notification
     
     **Example:**
     - GET /api/notifications/employee/EMP003
     - GET /api/notifications/employee/EMP003?unread_only=true
+    
+    Supports `If-None-Match`: 304 while the employee's notifications
+    are unchanged.
     """
     # Validate employee exists
     employee = data.get_employee_by_id(employee_id)
@@ -60,13 +79,18 @@ async def get_notifications_for_employee(
             }
         )
     
+    not_modified = check_etag(
+        request, response, "notifications", employee_id,
+        data.get_notifications_version(employee_id), data.get_employees_version()
+    )
+    if not_modified:
+        return not_modified
+    
     # Get notifications
     notifications = data.get_employee_notifications(employee_id, unread_only)
     
-    # Get counts
-    all_notifications = data.get_employee_notifications(employee_id, unread_only=False)
-    unread_count = len([n for n in all_notifications if not n["isRead"]])
-    read_count = len(all_notifications) - unread_count
+    # Get counts (maintained per inbox, no scan)
+    stats = data.count_employee_notifications(employee_id)
     
     return {
         "success": True,
@@ -75,13 +99,144 @@ async def get_notifications_for_employee(
             "employeeName": employee["employeeName"]
         },
         "filter": "unread" if unread_only else "all",
-        "stats": {
-            "total": len(all_notifications),
-            "unread": unread_count,
-            "read": read_count
-        },
+        "stats": stats,
+        "count": len(notifications),
+        "notifications": [n.to_dict(fields) for n in notifications]
+    }
+
+
+def _sse_event(notification) -> str:
+    body = dumps(notification.to_dict()).decode()
+    return f"id: {notification.notification_id}\nevent: notification\ndata: {body}\n\n"
+
+
+async def _notification_events(request: Request, employee_id: str, last_id: int):
+    subscriber = notification_stream.subscribe(employee_id)
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+
+        # Subscribed first, so nothing created from here on is missed
+        version = data.get_notifications_version(employee_id)
+        for notification in data.get_employee_notifications_after(employee_id, last_id):
+            yield _sse_event(notification)
+            last_id = notification.notification_id
+
+        while True:
+            try:
+                notification = await asyncio.wait_for(
+                    subscriber.queue.get(), config.SSE_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                notification = None
+
+            if notification is not None:
+                if notification.notification_id > last_id:
+                    yield _sse_event(notification)
+                    last_id = notification.notification_id
+                if not subscriber.lagged:
+                    continue
+            elif await request.is_disconnected():
+                break
+
+            # Idle or overflowed: catch up from the store, which also
+            # picks up notifications created by other worker processes
+            current = data.get_notifications_version(employee_id)
+            if subscriber.lagged or current != version:
+                subscriber.lagged = False
+                version = current
+                for missed in data.get_employee_notifications_after(employee_id, last_id):
+                    yield _sse_event(missed)
+                    last_id = missed.notification_id
+
+            if notification is None:
+                yield ": heartbeat\n\n"
+    finally:
+        notification_stream.unsubscribe(subscriber)
+
+
+@router.get("/employee/{employee_id}/stream", summary="Stream new notifications (SSE)")
+async def stream_notifications(
+    request: Request,
+    employee_id: str,
+    after: Optional[int] = None
+):
+    """
+    Server-Sent Events stream of the employee's new notifications,
+    instead of polling `/employee/{employee_id}`.
+
+    Each event has `id` = notificationId and `data` = the notification.
+    Resumes after the `Last-Event-ID` header (sent by EventSource on
+    reconnect) or the `after` notificationId; with neither, only
+    notifications created from now on are sent.
+    A comment line is sent when idle, as a keep-alive.
+    """
+    employee = data.get_employee_by_id(employee_id)
+
+    if not employee:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "success": False,
+                "message": f"Employee '{employee_id}' not found"
+            }
+        )
+
+    last_event_id = request.headers.get("last-event-id", "")
+    if last_event_id.isdigit():
+        after = int(last_event_id)
+    if after is None:
+        after = data.get_last_notification_id()
+
+    return StreamingResponse(
+        _notification_events(request, employee_id, after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/employee/{employee_id}/archive", summary="Get archived notifications")
+async def get_archived_notifications(
+    employee_id: str,
+    limit: int = Query(50, ge=1, le=MAX_ARCHIVE_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(NOTIFICATION_FIELDS))
+):
+    """
+    Read notifications moved out of the inbox by the retention policy,
+    most recently archived first. Pass the response's `nextCursor` as
+    `cursor` for the next page (null on the last).
+    """
+    employee = data.get_employee_by_id(employee_id)
+
+    if not employee:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "success": False,
+                "message": f"Employee '{employee_id}' not found"
+            }
+        )
+
+    try:
+        notifications, next_cursor, total = data.get_archived_notifications(
+            employee_id, limit, cursor
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "message": "Invalid cursor"
+            }
+        )
+
+    return {
+        "success": True,
+        "employeeId": employee_id,
+        "total": total,
         "count": len(notifications),
-        "notifications": notifications
+        "nextCursor": next_cursor,
+        "notifications": [n.to_dict(fields) for n in notifications]
     }
 
 
@@ -135,14 +290,8 @@ async def mark_all_as_read(employee_id: str):
             }
         )
     
-    # Get all unread notifications for this employee
-    notifications = data.get_employee_notifications(employee_id, unread_only=True)
-    
-    # Mark each as read
-    marked_count = 0
-    for notification in notifications:
-        if data.mark_notification_read(notification["notificationId"]):
-            marked_count += 1
+    # Mark the employee's unread notifications read (one commit)
+    marked_count = data.mark_all_notifications_read(employee_id)
     
     return {
         "success": True,
@@ -160,15 +309,13 @@ async def get_notification(notification_id: int):
     **Example:**
     - GET /api/notifications/1
     """
-    # Find notification
-    all_notifications = data.get_all_notifications()
+    notification = data.get_notification_by_id(notification_id)
     
-    for notification in all_notifications:
-        if notification["notificationId"] == notification_id:
-            return {
-                "success": True,
-                "notification": notification
-            }
+    if notification:
+        return {
+            "success": True,
+            "notification": notification.to_dict()
+        }
     
     raise HTTPException(
         status_code=404,
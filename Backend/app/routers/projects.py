@@ -1,6 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Tuple
+
+from app.records import TASK_FIELDS
+from app.responses import fields_query
 
 from app.services.projects import (
     get_projects_for_manager,
@@ -9,7 +12,8 @@ from app.services.projects import (
 from app.services.project_tasks import (
     get_tasks_by_project,
     get_projects_summary_for_manager,
-    get_employee_projects
+    get_employee_projects,
+    get_employee_tasks_in_project
 )
 
 router = APIRouter(
@@ -72,13 +76,16 @@ def manager_project_summary(manager_id: str):
     "/{project_name}/tasks",
     summary="Get all tasks under a project"
 )
-def get_project_tasks(project_name: str):
+def get_project_tasks(
+    project_name: str,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(TASK_FIELDS))
+):
     tasks = get_tasks_by_project(project_name)
 
     return {
         "success": True,
         "count": len(tasks),
-        "tasks": tasks
+        "tasks": [t.to_dict(fields) for t in tasks]
     }
 
 
@@ -97,17 +104,15 @@ def get_employee_project_list(employee_id: str):
     "/employee/{employee_id}/{project_name}",
     summary="Get employee tasks inside a project"
 )
-def get_employee_project_tasks(employee_id: str, project_name: str):
-    tasks = get_tasks_by_project(project_name)
-
-    employee_tasks = []
-    for task in tasks:
-        for emp in task.get("assignedEmployees", []):
-            if emp["employeeId"] == employee_id:
-                employee_tasks.append(task)
+def get_employee_project_tasks(
+    employee_id: str,
+    project_name: str,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(TASK_FIELDS))
+):
+    employee_tasks = get_employee_tasks_in_project(employee_id, project_name)
 
     return {
         "success": True,
         "count": len(employee_tasks),
-        "tasks": employee_tasks
+        "tasks": [t.to_dict(fields) for t in employee_tasks]
     }
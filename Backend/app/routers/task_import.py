@@ -3,11 +3,11 @@ from pydantic import BaseModel
 from typing import List, Dict
 import pandas as pd
 
+from app.services import dispatcher
 from app.services.managers import get_manager_by_id
 from app.services.employees import get_employee_by_id
 from app.services.tasks import (
-    create_task,
-    assign_task_to_employees,
+    create_and_assign_tasks,
     get_manager_task_queue
 )
 
@@ -132,12 +132,13 @@ async def confirm_task_import(payload: ConfirmImportRequest):
             detail="Manager not found"
         )
 
-    existing_tasks = get_manager_task_queue(payload.managerId)
+    existing_keys = {
+        (t.title, t.project_name)
+        for t in get_manager_task_queue(payload.managerId)
+    }
 
-    created = 0
-    assigned = 0
     failed = []
-    created_tasks = []
+    to_create = []
 
     for task in payload.tasks:
 
@@ -162,12 +163,10 @@ async def confirm_task_import(payload: ConfirmImportRequest):
             continue
 
         # 🛡 Prevent duplicate task import
-        is_duplicate = any(
-            t["title"] == task["title"] and
-            t.get("metadata", {}).get("projectName") ==
+        is_duplicate = (
+            task["title"],
             task.get("metadata", {}).get("projectName")
-            for t in existing_tasks
-        )
+        ) in existing_keys
 
         if is_duplicate:
             failed.append({
@@ -177,38 +176,29 @@ async def confirm_task_import(payload: ConfirmImportRequest):
             })
             continue
 
-        # 1️⃣ Create task
-        new_task = create_task(
-            manager_id=payload.managerId,
-            title=task["title"],
-            description=task["description"],
-            priority=task.get("priority", "Medium"),
-            deadline=task.get("deadline"),
-            metadata=task.get("metadata", {})
-        )
-
-        if not new_task:
-            failed.append({
-                "title": task["title"],
-                "reason": "Task creation failed"
-            })
-            continue
-
-        created += 1
-        created_tasks.append({
-            "taskId": new_task["taskId"],
-            "title": new_task["title"],
-            "employeeId": employee_id
+        to_create.append({
+            "title": task["title"],
+            "description": task["description"],
+            "priority": task.get("priority", "Medium"),
+            "deadline": task.get("deadline"),
+            "metadata": task.get("metadata", {}),
+            "employeeIds": [employee_id]
         })
 
-        # 2️⃣ Auto assign
-        assign_task_to_employees(
-            task_id=new_task["taskId"],
-            employee_ids=[employee_id],
-            manager_id=payload.managerId
-        )
-
-        assigned += 1
+    # 1️⃣ Create + 2️⃣ auto assign, persisted in one commit
+    new_tasks = create_and_assign_tasks(payload.managerId, to_create)
+    # Backpressure: let the side-effect queues catch up if they are full
+    await dispatcher.wait_for_room()
+
+    created_tasks = [
+        {
+            "taskId": new_task.task_id,
+            "title": new_task.title,
+            "employeeId": item["employeeIds"][0]
+        }
+        for new_task, item in zip(new_tasks, to_create)
+    ]
+    created = assigned = len(created_tasks)
 
     return {
         "success": True,
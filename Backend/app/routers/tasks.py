@@ -1,14 +1,21 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from app.enums import TaskStatus 
-from app.services.task_storage import update_task
+from app.http_cache import check_etag
+from app.records import TASK_FIELDS, to_json
+from app.responses import fields_query, json_list_response
+from app.services import dispatcher
+from app.services.task_storage import TaskConflictError, update_task
 
 from app import data
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
+# Upper bound for the `limit` query parameter of paginated listings
+MAX_PAGE_SIZE = 500
+
 
 # ===== Pydantic Models =====
 
@@ -87,22 +94,47 @@ async def create_task(request: CreateTaskRequest):
     return {
         "success": True,
         "message": "Task created and added to queue",
-        "task": task
+        "task": task.to_dict()
     }
 
 
+def _invalid_cursor():
+    return HTTPException(
+        status_code=400,
+        detail={
+            "success": False,
+            "message": "Invalid cursor"
+        }
+    )
+
+
 @router.get("/queue/{manager_id}", summary="Get manager's task queue")
-async def get_task_queue(manager_id: str, status: Optional[str] = None):
+async def get_task_queue(
+    request: Request,
+    response: Response,
+    manager_id: str,
+    status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(TASK_FIELDS))
+):
     """
     **Step 2 of Workflow**: Manager views their task queue
     
-    Returns all tasks created by the manager.
+    Returns all tasks created by the manager, newest first.
     
     Optional filter by status:
     - `Pending` - Tasks not yet assigned
     - `Assigned` - Tasks already assigned to employees
     - `In Progress` - Tasks being worked on
     - `Completed` - Finished tasks
+    
+    **Pagination:** pass `limit` to get one page; the response's
+    `nextCursor` goes into `after` for the next page (null on the last).
+    
+    `fields` (e.g. `taskId,title,status`) limits the keys of each task.
+    
+    Supports `If-None-Match`: 304 while the manager's tasks are unchanged.
     """
     manager = data.get_manager_by_id(manager_id)
     if not manager:
@@ -114,16 +146,21 @@ async def get_task_queue(manager_id: str, status: Optional[str] = None):
             }
         )
     
-    tasks = data.get_manager_task_queue(manager_id, status)
+    not_modified = check_etag(
+        request, response, "queue", manager_id, data.get_tasks_version(manager_id)
+    )
+    if not_modified:
+        return not_modified
     
-    # Count by status
-    all_tasks = data.get_manager_task_queue(manager_id)
-    status_counts = {
-        "Pending": len([t for t in all_tasks if t["status"] == "Pending"]),
-        "Assigned": len([t for t in all_tasks if t["status"] == "Assigned"]),
-        "In Progress": len([t for t in all_tasks if t["status"] == "In Progress"]),
-        "Completed": len([t for t in all_tasks if t["status"] == "Completed"])
-    }
+    try:
+        tasks, next_cursor = data.get_task_page(
+            limit=limit, after=after, manager_id=manager_id, status_filter=status
+        )
+    except ValueError:
+        raise _invalid_cursor()
+    
+    # Count by status (maintained counters, no scan)
+    status_counts = data.get_manager_status_counts(manager_id)
     
     return {
         "success": True,
@@ -131,12 +168,13 @@ async def get_task_queue(manager_id: str, status: Optional[str] = None):
         "filter": status or "All",
         "statusCounts": status_counts,
         "count": len(tasks),
-        "tasks": tasks
+        "nextCursor": next_cursor,
+        "tasks": [t.to_dict(fields) for t in tasks]
     }
 
 
 @router.get("/{task_id}", summary="Get task details with available employees")
-async def get_task_details(task_id: int):
+async def get_task_details(task_id: int, limit: Optional[int] = Query(None, ge=1)):
     """
     **Step 3 of Workflow**: Manager clicks on a task
     
@@ -146,8 +184,9 @@ async def get_task_details(task_id: int):
     - Employees with fewer active projects appear first
     
     This is the interface where manager selects employees to assign.
+    `limit` returns only the top-k least-loaded employees.
     """
-    result = data.get_task_details_with_employees(task_id)
+    result = data.get_task_details_with_employees(task_id, ranking_limit=limit)
     
     if not result:
         raise HTTPException(
@@ -160,12 +199,16 @@ async def get_task_details(task_id: int):
     
     return {
         "success": True,
-        "data": result
+        "data": to_json(result)
     }
 
 
 @router.post("/{task_id}/assign", summary="Assign task to employees")
-async def assign_task(task_id: int, request: AssignTaskRequest):
+async def assign_task(
+    task_id: int,
+    request: AssignTaskRequest,
+    limit: Optional[int] = Query(None, ge=1)
+):
     """
     **Step 4 & 5 of Workflow**: Manager assigns task to employee(s)
     
@@ -178,6 +221,7 @@ async def assign_task(task_id: int, request: AssignTaskRequest):
     5. Return updated ranking
     
     **Note**: Multiple employees can be assigned to a single task.
+    `limit` (query) trims the returned ranking to the top-k.
     """
     task = data.get_task_by_id(task_id)
     
@@ -190,16 +234,16 @@ async def assign_task(task_id: int, request: AssignTaskRequest):
             }
         )
     
-    if task["status"] != "Pending":
+    if task.status != "Pending":
         raise HTTPException(
             status_code=400,
             detail={
                 "success": False,
-                "message": f"Task is already '{task['status']}'. Only 'Pending' tasks can be assigned."
+                "message": f"Task is already '{task.status}'. Only 'Pending' tasks can be assigned."
             }
         )
     
-    if task["managerId"] != request.managerId:
+    if task.manager_id != request.managerId:
         raise HTTPException(
             status_code=403,
             detail={
@@ -224,29 +268,61 @@ async def assign_task(task_id: int, request: AssignTaskRequest):
         )
     
     # Perform assignment
-    result = data.assign_task_to_employees(
-        task_id=task_id,
-        employee_ids=request.employeeIds,
-        manager_id=request.managerId
-    )
+    try:
+        result = data.assign_task_to_employees(
+            task_id=task_id,
+            employee_ids=request.employeeIds,
+            manager_id=request.managerId
+        )
+    except TaskConflictError:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "success": False,
+                "message": f"Task {task_id} was modified by another request. Reload and retry."
+            }
+        )
+    
+    # Backpressure: let the side-effect queues catch up if they are full
+    await dispatcher.wait_for_room()
     
     return {
         "success": True,
         "message": f"Task assigned to {len(result['assignedTo'])} employee(s). Notifications sent.",
-        "data": result,
-        "updatedEmployeeRanking": data.get_employees_ranked()
+        "data": to_json(result),
+        "updatedEmployeeRanking": data.get_employees_ranked(limit)
     }
 
 
 @router.get("/", summary="Get all tasks")
-async def get_all_tasks():
-    tasks = data.get_all_tasks()   # comes from task_storage via services
-
-    return {
-        "success": True,
-        "count": len(tasks),
-        "tasks": list(reversed(tasks))
-    }
+async def get_all_tasks(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = Depends(fields_query(TASK_FIELDS))
+):
+    """
+    All tasks, newest first. Pass `limit` (and then `after` =
+    previous `nextCursor`) to page through them; `fields` limits the
+    keys of each task.
+    Supports `If-None-Match`: 304 while no task changed.
+    """
+    not_modified = check_etag(request, response, "tasks", data.get_tasks_version())
+    if not_modified:
+        return not_modified
+
+    try:
+        tasks, next_cursor = data.get_task_page(limit=limit, after=after)
+    except ValueError:
+        raise _invalid_cursor()
+
+    return json_list_response(
+        {"success": True, "count": len(tasks), "nextCursor": next_cursor},
+        "tasks", tasks, count=len(tasks),
+        encode=lambda task: task.to_dict(fields),
+        response=response
+    )
 
 
 @router.patch("/{task_id}/status", summary="Update task status")
@@ -278,29 +354,34 @@ async def update_task_status(task_id: int, new_status: str):
             }
         )
     
-    # Update task status
-    task["status"] = new_status
+    # Update task status, persisted before any side effect
+    task.status = new_status
+    try:
+        update_task(task)
+    except TaskConflictError:
+        raise HTTPException(
+            status_code=409,
+            detail="Task was modified by another request. Reload and retry."
+        )
     
     # If marking as completed, update employee history
     if new_status == "Completed":
         completed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        for assigned_emp in task["assignedEmployees"]:
-            data.update_task_status_in_history(
-                employee_id=assigned_emp["employeeId"],
+        for employee_id in task.employee_ids:
+            data.record_task_status(
+                employee_id=employee_id,
                 task_id=task_id,
                 new_status="Completed",
                 completed_at=completed_at
             )
             
             # Decrement active project count
-            employee = data.get_employee_by_id(assigned_emp["employeeId"])
-            if employee and employee["noOfActiveProjects"] > 0:
-                employee["noOfActiveProjects"] -= 1
+            data.update_employee_on_completion(employee_id)
     
     return {
         "success": True,
         "message": f"Task status updated to '{new_status}'",
-        "task": task
+        "task": task.to_dict()
     }
 
 
@@ -328,12 +409,7 @@ async def update_task_status_by_employee(
         )
 
     # 2️⃣ Validate employee is assigned to this task
-    assigned_employee_ids = [
-        emp["employeeId"]
-        for emp in task.get("assignedEmployees", [])
-    ]
-
-    if request.employeeId not in assigned_employee_ids:
+    if request.employeeId not in task.employee_ids:
         raise HTTPException(
             status_code=403,
             detail="You are not assigned to this task"
@@ -349,16 +425,22 @@ async def update_task_status_by_employee(
         )
 
     # 4️⃣ Update task status (ROLLBACK ALLOWED)
-    old_status = task["status"]
-    task["status"] = request.newStatus
+    old_status = task.status
+    task.status = request.newStatus
 
     # 5️⃣ Persist task
-    update_task(task)
+    try:
+        update_task(task)
+    except TaskConflictError:
+        raise HTTPException(
+            status_code=409,
+            detail="Task was modified by another request. Reload and retry."
+        )
 
     # 6️⃣ Update employee history (if exists)
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    data.update_task_status_in_history(
+    data.record_task_status(
         employee_id=request.employeeId,
         task_id=task_id,
         new_status=request.newStatus,
@@ -369,8 +451,8 @@ async def update_task_status_by_employee(
         "success": True,
         "message": f"Task status updated from '{old_status}' to '{request.newStatus}'",
         "task": {
-            "taskId": task["taskId"],
-            "status": task["status"],
+            "taskId": task.task_id,
+            "status": task.status,
             "updatedAt": now
         }
     }
@@ -0,0 +1,47 @@
+from app import config
+from app.services.backends.base import ProjectStore, TaskStore
+
+_sqlite_db = None
+
+
+def _get_sqlite_db():
+    """
+    Open the SQLite database once per process, importing the JSON
+    files on first use.
+    """
+    global _sqlite_db
+
+    if _sqlite_db is None:
+        from app.services.backends.sqlite_backend import (
+            SqliteDatabase,
+            migrate_from_json
+        )
+
+        _sqlite_db = SqliteDatabase(config.SQLITE_FILE)
+        migrate_from_json(_sqlite_db, config.TASK_FILE, config.PROJECT_FILE)
+
+    return _sqlite_db
+
+
+def create_task_store() -> TaskStore:
+    if config.STORAGE_BACKEND == "sqlite":
+        from app.services.backends.sqlite_backend import SqliteTaskStore
+        return SqliteTaskStore(_get_sqlite_db())
+
+    if config.STORAGE_BACKEND == "json":
+        from app.services.backends.json_backend import JsonTaskStore
+        return JsonTaskStore(config.TASK_FILE)
+
+    raise ValueError(f"Unknown storage backend '{config.STORAGE_BACKEND}'")
+
+
+def create_project_store() -> ProjectStore:
+    if config.STORAGE_BACKEND == "sqlite":
+        from app.services.backends.sqlite_backend import SqliteProjectStore
+        return SqliteProjectStore(_get_sqlite_db())
+
+    if config.STORAGE_BACKEND == "json":
+        from app.services.backends.json_backend import JsonProjectStore
+        return JsonProjectStore(config.PROJECT_FILE)
+
+    raise ValueError(f"Unknown storage backend '{config.STORAGE_BACKEND}'")
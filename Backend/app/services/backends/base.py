@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from app.records import TaskRecord
+
+
+class TaskConflictError(Exception):
+    """
+    Raised by `update_task(s)` when the task changed since it was read
+    (its `version` no longer matches the stored one).
+    """
+
+
+class TaskStore(ABC):
+    """
+    Storage contract behind `services/task_storage.py`.
+    """
+
+    @abstractmethod
+    def get_all_tasks(self) -> List[TaskRecord]:
+        """All tasks in creation order."""
+
+    @abstractmethod
+    def get_task_by_id(self, task_id: int) -> Optional[TaskRecord]:
+        """A copy of the task, safe to modify and pass to `update_task`."""
+
+    @abstractmethod
+    def query_tasks(
+        self,
+        manager_id: Optional[str] = None,
+        status: Union[str, Iterable[str], None] = None,
+        project_name: Optional[str] = None,
+        employee_id: Union[str, Iterable[str], None] = None
+    ) -> List[TaskRecord]:
+        """
+        Tasks matching every given filter, in creation order. `status`
+        and `employee_id` may list several values (any of them matches).
+        """
+
+    @abstractmethod
+    def page_tasks(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[str, int]] = None,
+        manager_id: Optional[str] = None,
+        status: Union[str, Iterable[str], None] = None
+    ) -> List[TaskRecord]:
+        """
+        Tasks matching the filters, newest first by `sort_key`
+        (createdAt, taskId), starting strictly after the `after` key.
+        """
+
+    @abstractmethod
+    def count_by_status(self, manager_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Number of tasks per status (maintained counters), for one
+        manager or, with no manager, for all tasks.
+        """
+
+    @abstractmethod
+    def get_version(
+        self,
+        manager_id: Optional[str] = None,
+        employee_id: Optional[str] = None,
+        project_name: Optional[str] = None
+    ) -> int:
+        """
+        Monotonic data version of the tasks of one manager, employee
+        (assignee) or project -- give at most one -- or of all tasks:
+        changes whenever one of them is created or updated.
+        """
+
+    @abstractmethod
+    def get_next_task_id(self) -> int:
+        """Increment and return the task ID high-water mark."""
+
+    @abstractmethod
+    def create_task(self, task: TaskRecord) -> TaskRecord:
+        """Assign `task_id` and persist a new task."""
+
+    @abstractmethod
+    def create_tasks(self, tasks: List[TaskRecord]) -> List[TaskRecord]:
+        """Assign IDs to and persist several new tasks in one commit."""
+
+    @abstractmethod
+    def update_task(self, updated_task: TaskRecord) -> TaskRecord:
+        """
+        Replace an existing task and bump its `version`.
+        Raises ValueError if unknown, TaskConflictError if stale.
+        """
+
+    @abstractmethod
+    def update_tasks(self, updated_tasks: List[TaskRecord]) -> List[TaskRecord]:
+        """Replace several existing tasks in one commit (all or nothing)."""
+
+    def compact(self):
+        """Fold any pending log into the main store (no-op by default)."""
+
+
+class ProjectStore(ABC):
+    """
+    Storage contract behind `services/project_storage.py`.
+    """
+
+    @abstractmethod
+    def get_all_projects(self) -> List[Dict]:
+        """All projects in creation order."""
+
+    @abstractmethod
+    def get_projects_for_manager(self, manager_id: str) -> List[Dict]:
+        """Projects of one manager, in creation order."""
+
+    @abstractmethod
+    def create_project(self, project: Dict) -> Dict:
+        """
+        Assign `projectId` and persist a new project.
+        Raises ValueError if the manager already has a project with the
+        same name (case-insensitive).
+        """
@@ -0,0 +1,473 @@
+import heapq
+from bisect import bisect_left, insort
+from dataclasses import replace
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from app.records import TaskRecord
+from app.services.backends.base import ProjectStore, TaskConflictError, TaskStore
+from app.services.id_allocator import IdAllocator
+from app.services.journal import JournaledState
+
+# Fold the journal into tasks.json after this many records
+COMPACT_EVERY = 500
+
+# Task IDs reserved per `seq` record
+ID_BLOCK_SIZE = 16
+
+# Secondary indexes: field -> value -> {taskId}
+INDEXED_FIELDS = ("managerId", "status", "projectName", "employeeId")
+
+# Ordered listings: name -> ascending [(createdAt, taskId)]
+SortKey = Tuple[str, int]
+
+
+# ==============================
+# INTERNAL HELPERS
+# ==============================
+
+def _index_values(task: TaskRecord) -> Dict[str, Tuple]:
+    """
+    Indexed values of a task, per field.
+    """
+    return {
+        "managerId": (task.manager_id,),
+        "status": (task.status,),
+        "projectName": (task.project_name,),
+        "employeeId": task.employee_ids
+    }
+
+
+def _index_task(indexes: Dict, task: TaskRecord):
+    for field, values in _index_values(task).items():
+        for value in values:
+            if isinstance(value, (str, int)):
+                indexes[field].setdefault(value, set()).add(task.task_id)
+
+
+def _unindex_task(indexes: Dict, task: TaskRecord):
+    for field, values in _index_values(task).items():
+        for value in values:
+            if not isinstance(value, (str, int)):
+                continue
+            ids = indexes[field].get(value)
+            if ids is None:
+                continue
+            ids.discard(task.task_id)
+            if not ids:
+                del indexes[field][value]
+
+
+def _order_names(task: TaskRecord) -> List[Tuple]:
+    """
+    Ordered listings a task appears in.
+    """
+    return [
+        ("all",),
+        ("manager", task.manager_id),
+        ("status", task.status),
+        ("managerStatus", task.manager_id, task.status)
+    ]
+
+
+def _order_task(orders: Dict, task: TaskRecord):
+    key = task.sort_key
+    for name in _order_names(task):
+        insort(orders.setdefault(name, []), key)
+
+
+def _unorder_task(orders: Dict, task: TaskRecord):
+    key = task.sort_key
+    for name in _order_names(task):
+        keys = orders.get(name)
+        if not keys:
+            continue
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            del keys[i]
+            if not keys:
+                del orders[name]
+
+
+def _bump(counter: Dict, key, delta: int):
+    count = counter.get(key, 0) + delta
+    if count:
+        counter[key] = count
+    else:
+        counter.pop(key, None)
+
+
+def _count_task(data: Dict, task: TaskRecord, delta: int):
+    """
+    Adjust the managerId -> status -> count and status -> count counters.
+    """
+    _bump(data["counts"].setdefault(task.manager_id, {}), task.status, delta)
+    _bump(data["statusTotals"], task.status, delta)
+
+
+def _touch(data: Dict, task: TaskRecord, rev: int):
+    """
+    Record `rev` as the version of every scope the task belongs to.
+    """
+    data["revs"]["manager"][task.manager_id] = rev
+    for employee_id in task.employee_ids:
+        data["revs"]["employee"][employee_id] = rev
+    if isinstance(task.project_name, (str, int)):
+        data["revs"]["project"][task.project_name] = rev
+
+
+def _iter_desc(keys: List[SortKey], before: Optional[SortKey]) -> Iterator[SortKey]:
+    """
+    Keys of an ascending list from the end, strictly below `before`.
+    """
+    end = bisect_left(keys, before) if before is not None else len(keys)
+    return (keys[i] for i in range(end - 1, -1, -1))
+
+
+# ==============================
+# TASKS
+# ==============================
+
+class JsonTaskStore(JournaledState, TaskStore):
+    """
+    tasks.json snapshot + append-only journal, with a process-wide
+    cache of `TaskRecord`s, secondary indexes, sorted listings for
+    pagination, per-manager status counters and per-manager / employee /
+    project versions (journal rev of the last change to a task in that
+    scope).
+
+    Safe across uvicorn workers: every read-modify-write runs under an
+    exclusive lock on tasks.lock and starts by catching up with the
+    journal, and each task carries a `version` checked on update.
+    """
+
+    def __init__(self, task_file: Path, compact_every: int = COMPACT_EVERY):
+        super().__init__(task_file, compact_every=compact_every)
+        self.task_file = task_file
+        self._data: Dict = {}
+        self._ids = IdAllocator(self._reserve_ids, block_size=ID_BLOCK_SIZE)
+
+    # ---------- journal hooks ----------
+
+    def _load_snapshot(self, snapshot: Optional[Dict]):
+        """
+        Tasks are keyed by taskId, in creation order.
+        """
+        snapshot = snapshot or {"lastTaskId": 0, "tasks": []}
+
+        self._data = {
+            "lastTaskId": snapshot["lastTaskId"],
+            "tasks": {
+                task["taskId"]: TaskRecord.from_dict(task)
+                for task in snapshot["tasks"]
+            },
+            "indexes": {field: {} for field in INDEXED_FIELDS},
+            "orders": {},
+            "counts": {},
+            "statusTotals": {},
+            "revs": {"manager": {}, "employee": {}, "project": {}}
+        }
+
+        orders = self._data["orders"]
+        for task in self._data["tasks"].values():
+            _index_task(self._data["indexes"], task)
+            _count_task(self._data, task, 1)
+            for name in _order_names(task):
+                orders.setdefault(name, []).append(task.sort_key)
+
+        # Snapshot order is nearly sorted already
+        for keys in orders.values():
+            keys.sort()
+
+    def _dump_snapshot(self) -> Dict:
+        """
+        On-disk shape of tasks.json.
+        """
+        return {
+            "lastTaskId": self._data["lastTaskId"],
+            "tasks": [task.to_dict() for task in self._data["tasks"].values()]
+        }
+
+    def _apply(self, record: Dict):
+        """
+        Apply one journal record to the in-memory store and its indexes.
+
+        - `put`: full task body (insert or replace)
+        - `seq`: lastTaskId high-water mark
+        """
+        data = self._data
+        if record["op"] == "put":
+            task = TaskRecord.from_dict(record["task"])
+            old = data["tasks"].get(task.task_id)
+            if old is not None:
+                _unindex_task(data["indexes"], old)
+                _unorder_task(data["orders"], old)
+                _count_task(data, old, -1)
+            data["tasks"][task.task_id] = task
+            _index_task(data["indexes"], task)
+            _order_task(data["orders"], task)
+            _count_task(data, task, 1)
+            _touch(data, task, record.get("rev", 0))
+            if old is not None:
+                _touch(data, old, record.get("rev", 0))
+            data["lastTaskId"] = max(data["lastTaskId"], task.task_id)
+        elif record["op"] == "seq":
+            data["lastTaskId"] = max(data["lastTaskId"], record["lastTaskId"])
+
+    # ---------- internals ----------
+
+    def _load_data(self) -> Dict:
+        """
+        The cached store, refreshed only if the files changed.
+        """
+        with self._lock:
+            self.refresh()
+            return self._data
+
+    def _reserve_ids(self, count: int) -> int:
+        """
+        Persist a new lastTaskId high-water mark covering `count` IDs
+        and return the first of them.
+        """
+        with self.writing():
+            first_id = self._data["lastTaskId"] + 1
+            self.commit([{"op": "seq", "lastTaskId": first_id + count - 1}])
+            return first_id
+
+    # ---------- public ----------
+
+    def get_all_tasks(self) -> List[TaskRecord]:
+        data = self._load_data()
+        return list(data["tasks"].values())
+
+    def get_task_by_id(self, task_id: int) -> Optional[TaskRecord]:
+        data = self._load_data()
+        task = data["tasks"].get(task_id)
+        return replace(task) if task else None
+
+    def query_tasks(
+        self,
+        manager_id: Optional[str] = None,
+        status: Union[str, Iterable[str], None] = None,
+        project_name: Optional[str] = None,
+        employee_id: Union[str, Iterable[str], None] = None
+    ) -> List[TaskRecord]:
+        """
+        Served from the secondary indexes: cost is proportional to the
+        matching id sets, not to the number of stored tasks.
+        """
+        filters = {
+            "managerId": manager_id,
+            "status": status,
+            "projectName": project_name,
+            "employeeId": employee_id
+        }
+
+        with self._lock:
+            data = self._load_data()
+
+            id_sets: List[Set[int]] = []
+            for field, wanted in filters.items():
+                if wanted is None:
+                    continue
+                values = [wanted] if isinstance(wanted, str) else list(wanted)
+                index = data["indexes"][field]
+                ids: Set[int] = set()
+                for value in values:
+                    ids |= index.get(value, set())
+                id_sets.append(ids)
+
+            if not id_sets:
+                return list(data["tasks"].values())
+
+            id_sets.sort(key=len)
+            matched = set(id_sets[0])
+            for ids in id_sets[1:]:
+                matched &= ids
+                if not matched:
+                    break
+
+            return [data["tasks"][task_id] for task_id in sorted(matched)]
+
+    def page_tasks(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[SortKey] = None,
+        manager_id: Optional[str] = None,
+        status: Union[str, Iterable[str], None] = None
+    ) -> List[TaskRecord]:
+        """
+        Walks the pre-sorted listings backwards from `after`: a page
+        costs O(log n + limit), independent of the number of tasks.
+        Several statuses are merged lazily.
+        """
+        if status is None:
+            names = [("manager", manager_id) if manager_id is not None else ("all",)]
+        else:
+            statuses = [status] if isinstance(status, str) else list(dict.fromkeys(status))
+            names = [
+                ("managerStatus", manager_id, s) if manager_id is not None else ("status", s)
+                for s in statuses
+            ]
+
+        with self._lock:
+            data = self._load_data()
+            runs = [_iter_desc(data["orders"].get(name, []), after) for name in names]
+            keys = runs[0] if len(runs) == 1 else heapq.merge(*runs, reverse=True)
+            return [data["tasks"][task_id] for _, task_id in islice(keys, limit)]
+
+    def count_by_status(self, manager_id: Optional[str] = None) -> Dict[str, int]:
+        with self._lock:
+            data = self._load_data()
+            if manager_id is None:
+                return dict(data["statusTotals"])
+            return dict(data["counts"].get(manager_id, {}))
+
+    def get_version(
+        self,
+        manager_id: Optional[str] = None,
+        employee_id: Optional[str] = None,
+        project_name: Optional[str] = None
+    ) -> int:
+        scopes = {"manager": manager_id, "employee": employee_id, "project": project_name}
+        with self._lock:
+            data = self._load_data()
+            for scope, key in scopes.items():
+                if key is not None:
+                    return data["revs"][scope].get(key, self.base_rev)
+            return self.rev
+
+    def get_next_task_id(self) -> int:
+        # Store lock first: `_reserve_ids` takes it under the allocator lock
+        with self._lock:
+            return self._ids.next_id()
+
+    def create_task(self, task: TaskRecord) -> TaskRecord:
+        return self.create_tasks([task])[0]
+
+    def create_tasks(self, tasks: List[TaskRecord]) -> List[TaskRecord]:
+        """
+        One cached read + one journal append for the whole batch. IDs
+        come from the in-memory block; a `seq` record is only written
+        when a new block has to be reserved.
+        """
+        if not tasks:
+            return tasks
+
+        with self.writing():
+            for task, task_id in zip(tasks, self._ids.next_ids(len(tasks))):
+                task.task_id = task_id
+                task.version = 1
+
+            self.commit([
+                {"op": "put", "task": task.to_dict()} for task in tasks
+            ])
+
+            return tasks
+
+    def update_task(self, updated_task: TaskRecord) -> TaskRecord:
+        return self.update_tasks([updated_task])[0]
+
+    def update_tasks(self, updated_tasks: List[TaskRecord]) -> List[TaskRecord]:
+        with self.writing():
+            data = self._data
+
+            new_versions = []
+            for task in updated_tasks:
+                current = data["tasks"].get(task.task_id)
+                if current is None:
+                    raise ValueError(f"Task with ID {task.task_id} not found")
+                if task.version != current.version:
+                    raise TaskConflictError(
+                        f"Task with ID {task.task_id} was modified concurrently"
+                    )
+                new_versions.append(current.version + 1)
+
+            for task, version in zip(updated_tasks, new_versions):
+                task.version = version
+
+            self.commit([
+                {"op": "put", "task": task.to_dict()} for task in updated_tasks
+            ])
+            return updated_tasks
+
+
+
+# ==============================
+# PROJECTS
+# ==============================
+
+class JsonProjectStore(JournaledState, ProjectStore):
+    """
+    projects.json snapshot + journal, cached in memory with a
+    managerId -> projects index and a (managerId, lower(name))
+    uniqueness index. Creating a project appends one record.
+    """
+
+    def __init__(self, project_file: Path, compact_every: int = COMPACT_EVERY):
+        super().__init__(project_file, compact_every=compact_every)
+        self.project_file = project_file
+        self._last_project_id = 0
+        self._projects: List[Dict] = []
+        self._by_manager: Dict[str, List[Dict]] = {}
+        self._names: Set[Tuple[str, str]] = set()
+
+    # ---------- journal hooks ----------
+
+    def _load_snapshot(self, snapshot: Optional[Dict]):
+        snapshot = snapshot or {"lastProjectId": 0, "projects": []}
+        self._last_project_id = snapshot["lastProjectId"]
+        self._projects = []
+        self._by_manager = {}
+        self._names = set()
+        for project in snapshot["projects"]:
+            self._add(project)
+
+    def _dump_snapshot(self) -> Dict:
+        return {
+            "lastProjectId": self._last_project_id,
+            "projects": self._projects
+        }
+
+    def _apply(self, record: Dict):
+        """
+        - `put`: new project (ignored if its projectId is already known)
+        """
+        if record["op"] == "put":
+            project = record["project"]
+            if project["projectId"] > self._last_project_id:
+                self._add(project)
+
+    def _add(self, project: Dict):
+        self._projects.append(project)
+        self._by_manager.setdefault(project["managerId"], []).append(project)
+        self._names.add((project["managerId"], project["projectName"].lower()))
+        self._last_project_id = max(self._last_project_id, project["projectId"])
+
+    def _load_data(self) -> Dict:
+        with self._lock:
+            self.refresh()
+            return self._dump_snapshot()
+
+    # ---------- public ----------
+
+    def get_all_projects(self) -> List[Dict]:
+        with self._lock:
+            self.refresh()
+            return list(self._projects)
+
+    def get_projects_for_manager(self, manager_id: str) -> List[Dict]:
+        with self._lock:
+            self.refresh()
+            return list(self._by_manager.get(manager_id, []))
+
+    def create_project(self, project: Dict) -> Dict:
+        with self.writing():
+            key = (project["managerId"], project["projectName"].lower())
+            if key in self._names:
+                raise ValueError("Project with same name already exists")
+
+            project["projectId"] = self._last_project_id + 1
+            self.commit([{"op": "put", "project": project}])
+        return project
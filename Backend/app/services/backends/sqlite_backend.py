@@ -0,0 +1,524 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from app.records import TaskRecord
+from app.services.backends.base import ProjectStore, TaskConflictError, TaskStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id      INTEGER PRIMARY KEY,
+    manager_id   TEXT,
+    status       TEXT,
+    project_name TEXT,
+    created_at   TEXT,
+    body         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_manager_status ON tasks (manager_id, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks (project_name);
+CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_manager_created
+    ON tasks (manager_id, created_at, task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_manager_status_created
+    ON tasks (manager_id, status, created_at, task_id);
+
+-- Per-manager status counters, kept in step with `tasks` by triggers
+CREATE TABLE IF NOT EXISTS task_counts (
+    manager_id TEXT NOT NULL,
+    status     TEXT NOT NULL,
+    n          INTEGER NOT NULL,
+    PRIMARY KEY (manager_id, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO task_counts (manager_id, status, n)
+    VALUES (COALESCE(NEW.manager_id, ''), COALESCE(NEW.status, ''), 1)
+    ON CONFLICT (manager_id, status) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_update
+AFTER UPDATE OF manager_id, status ON tasks
+BEGIN
+    UPDATE task_counts SET n = n - 1
+    WHERE manager_id = COALESCE(OLD.manager_id, '') AND status = COALESCE(OLD.status, '');
+    INSERT INTO task_counts (manager_id, status, n)
+    VALUES (COALESCE(NEW.manager_id, ''), COALESCE(NEW.status, ''), 1)
+    ON CONFLICT (manager_id, status) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_delete AFTER DELETE ON tasks
+BEGIN
+    UPDATE task_counts SET n = n - 1
+    WHERE manager_id = COALESCE(OLD.manager_id, '') AND status = COALESCE(OLD.status, '');
+END;
+
+-- Per-manager data versions, bumped by every task insert / update
+CREATE TABLE IF NOT EXISTS task_versions (
+    manager_id TEXT PRIMARY KEY,
+    v          INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_version_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO task_versions (manager_id, v) VALUES (COALESCE(NEW.manager_id, ''), 1)
+    ON CONFLICT (manager_id) DO UPDATE SET v = v + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_version_update AFTER UPDATE ON tasks
+BEGIN
+    INSERT INTO task_versions (manager_id, v) VALUES (COALESCE(NEW.manager_id, ''), 1)
+    ON CONFLICT (manager_id) DO UPDATE SET v = v + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS task_assignees (
+    employee_id TEXT NOT NULL,
+    task_id     INTEGER NOT NULL,
+    PRIMARY KEY (employee_id, task_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_task_assignees_task ON task_assignees (task_id);
+
+-- Per-project / per-assignee data versions (same idea as task_versions)
+CREATE TABLE IF NOT EXISTS project_versions (
+    project_name TEXT PRIMARY KEY,
+    v            INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_project_version_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO project_versions (project_name, v) VALUES (COALESCE(NEW.project_name, ''), 1)
+    ON CONFLICT (project_name) DO UPDATE SET v = v + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_project_version_update AFTER UPDATE ON tasks
+BEGIN
+    INSERT INTO project_versions (project_name, v) VALUES (COALESCE(OLD.project_name, ''), 1)
+    ON CONFLICT (project_name) DO UPDATE SET v = v + 1;
+    INSERT INTO project_versions (project_name, v) VALUES (COALESCE(NEW.project_name, ''), 1)
+    ON CONFLICT (project_name) DO UPDATE SET v = v + 1;
+END;
+
+-- `_write_task` rewrites a task's assignee rows on every write, so
+-- these fire for every change to a task the employee is assigned to
+CREATE TABLE IF NOT EXISTS employee_versions (
+    employee_id TEXT PRIMARY KEY,
+    v           INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_assignees_version_insert AFTER INSERT ON task_assignees
+BEGIN
+    INSERT INTO employee_versions (employee_id, v) VALUES (NEW.employee_id, 1)
+    ON CONFLICT (employee_id) DO UPDATE SET v = v + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_assignees_version_delete AFTER DELETE ON task_assignees
+BEGIN
+    INSERT INTO employee_versions (employee_id, v) VALUES (OLD.employee_id, 1)
+    ON CONFLICT (employee_id) DO UPDATE SET v = v + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS projects (
+    project_id   INTEGER PRIMARY KEY,
+    manager_id   TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    body         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_manager ON projects (manager_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_manager_name
+    ON projects (manager_id, lower(project_name));
+"""
+
+# Statements are constant strings so sqlite3's statement cache keeps
+# them prepared per connection.
+SQL_SELECT_ALL_TASKS = "SELECT body FROM tasks ORDER BY task_id"
+SQL_SELECT_TASK = "SELECT body FROM tasks WHERE task_id = ?"
+SQL_UPSERT_TASK = """
+    INSERT INTO tasks (task_id, manager_id, status, project_name, created_at, body)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (task_id) DO UPDATE SET
+        manager_id = excluded.manager_id,
+        status = excluded.status,
+        project_name = excluded.project_name,
+        created_at = excluded.created_at,
+        body = excluded.body
+"""
+SQL_DELETE_ASSIGNEES = "DELETE FROM task_assignees WHERE task_id = ?"
+SQL_INSERT_ASSIGNEE = "INSERT OR IGNORE INTO task_assignees (employee_id, task_id) VALUES (?, ?)"
+SQL_SELECT_ALL_PROJECTS = "SELECT body FROM projects ORDER BY project_id"
+SQL_SELECT_MANAGER_PROJECTS = """
+    SELECT body FROM projects WHERE manager_id = ? ORDER BY project_id
+"""
+SQL_PROJECT_NAME_EXISTS = """
+    SELECT 1 FROM projects WHERE manager_id = ? AND lower(project_name) = lower(?)
+"""
+SQL_INSERT_PROJECT = """
+    INSERT INTO projects (project_id, manager_id, project_name, body)
+    VALUES (?, ?, ?, ?)
+"""
+SQL_COUNT_BY_STATUS = "SELECT status, n FROM task_counts WHERE manager_id = ? AND n > 0"
+SQL_COUNT_ALL_BY_STATUS = """
+    SELECT status, SUM(n) FROM task_counts WHERE n > 0 GROUP BY status
+"""
+SQL_REBUILD_TASK_COUNTS = """
+    INSERT INTO task_counts (manager_id, status, n)
+    SELECT COALESCE(manager_id, ''), COALESCE(status, ''), COUNT(*)
+    FROM tasks GROUP BY 1, 2
+"""
+SQL_GET_VERSION = "SELECT v FROM task_versions WHERE manager_id = ?"
+SQL_GET_EMPLOYEE_VERSION = "SELECT v FROM employee_versions WHERE employee_id = ?"
+SQL_GET_PROJECT_VERSION = "SELECT v FROM project_versions WHERE project_name = ?"
+SQL_GET_TOTAL_VERSION = "SELECT COALESCE(SUM(v), 0) FROM task_versions"
+SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+SQL_SET_META = """
+    INSERT INTO meta (key, value) VALUES (?, ?)
+    ON CONFLICT (key) DO UPDATE SET value = MAX(value, excluded.value)
+"""
+
+
+# ==============================
+# CONNECTION
+# ==============================
+
+class SqliteDatabase:
+    """
+    One connection per thread on a shared WAL-mode database file.
+    WAL lets readers (other threads / uvicorn workers) proceed while a
+    writer holds the lock.
+    """
+
+    def __init__(self, db_file: Path):
+        self.db_file = db_file
+        self._local = threading.local()
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = self.connection()
+        conn.executescript(SCHEMA)
+        self._build_task_counts()
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_file,
+                isolation_level=None,  # explicit BEGIN / COMMIT below
+                cached_statements=256,
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def _build_task_counts(self):
+        """
+        Fill `task_counts` once for databases created before it existed;
+        from then on the triggers maintain it.
+        """
+        with self.write() as conn:
+            if self.get_meta(conn, "taskCountsBuilt"):
+                return
+            conn.execute("DELETE FROM task_counts")
+            conn.execute(SQL_REBUILD_TASK_COUNTS)
+            self.set_meta(conn, "taskCountsBuilt", 1)
+
+    def write(self):
+        """
+        Context manager for a write transaction (BEGIN IMMEDIATE).
+        """
+        return _WriteTransaction(self.connection())
+
+    def get_meta(self, conn: sqlite3.Connection, key: str) -> int:
+        row = conn.execute(SQL_GET_META, (key,)).fetchone()
+        return row[0] if row else 0
+
+    def set_meta(self, conn: sqlite3.Connection, key: str, value: int):
+        conn.execute(SQL_SET_META, (key, value))
+
+
+class _WriteTransaction:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+# ==============================
+# TASKS
+# ==============================
+
+def _task_row(task: TaskRecord) -> Tuple:
+    project_name = task.project_name
+    return (
+        task.task_id,
+        task.manager_id,
+        task.status,
+        project_name if isinstance(project_name, (str, int)) else None,
+        task.sort_key[0],
+        json.dumps(task.to_dict(), separators=(",", ":"))
+    )
+
+
+def _load_task(body: str) -> TaskRecord:
+    return TaskRecord.from_dict(json.loads(body))
+
+
+def _write_task(conn: sqlite3.Connection, task: TaskRecord):
+    conn.execute(SQL_UPSERT_TASK, _task_row(task))
+    conn.execute(SQL_DELETE_ASSIGNEES, (task.task_id,))
+    conn.executemany(SQL_INSERT_ASSIGNEE, [
+        (employee_id, task.task_id)
+        for employee_id in task.employee_ids
+        if employee_id
+    ])
+
+
+def _task_filters(
+    manager_id: Optional[str] = None,
+    status: Union[str, Iterable[str], None] = None,
+    project_name: Optional[str] = None,
+    employee_id: Union[str, Iterable[str], None] = None,
+    after: Optional[Tuple[str, int]] = None
+) -> Tuple[str, List]:
+    """
+    WHERE clause + parameters for the task filters.
+    """
+    clauses = []
+    params: List = []
+
+    if manager_id is not None:
+        clauses.append("manager_id = ?")
+        params.append(manager_id)
+    if status is not None:
+        statuses = [status] if isinstance(status, str) else list(status)
+        clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+        params.extend(statuses)
+    if project_name is not None:
+        clauses.append("project_name = ?")
+        params.append(project_name)
+    if employee_id is not None:
+        employee_ids = [employee_id] if isinstance(employee_id, str) else list(employee_id)
+        clauses.append(
+            "task_id IN (SELECT task_id FROM task_assignees "
+            f"WHERE employee_id IN ({', '.join('?' * len(employee_ids))}))"
+        )
+        params.extend(employee_ids)
+    if after is not None:
+        clauses.append("(created_at, task_id) < (?, ?)")
+        params.extend(after)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+class SqliteTaskStore(TaskStore):
+    """
+    Tasks as JSON bodies with the filterable fields broken out into
+    indexed columns; assignments live in `task_assignees`.
+    """
+
+    def __init__(self, db: SqliteDatabase):
+        self.db = db
+
+    def get_all_tasks(self) -> List[TaskRecord]:
+        rows = self.db.connection().execute(SQL_SELECT_ALL_TASKS)
+        return [_load_task(body) for (body,) in rows]
+
+    def get_task_by_id(self, task_id: int) -> Optional[TaskRecord]:
+        row = self.db.connection().execute(SQL_SELECT_TASK, (task_id,)).fetchone()
+        return _load_task(row[0]) if row else None
+
+    def query_tasks(
+        self,
+        manager_id: Optional[str] = None,
+        status: Union[str, Iterable[str], None] = None,
+        project_name: Optional[str] = None,
+        employee_id: Union[str, Iterable[str], None] = None
+    ) -> List[TaskRecord]:
+        where, params = _task_filters(manager_id, status, project_name, employee_id)
+        rows = self.db.connection().execute(
+            f"SELECT body FROM tasks {where} ORDER BY task_id", params
+        )
+        return [_load_task(body) for (body,) in rows]
+
+    def page_tasks(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[str, int]] = None,
+        manager_id: Optional[str] = None,
+        status: Union[str, Iterable[str], None] = None
+    ) -> List[TaskRecord]:
+        """
+        Keyset pagination on the (manager_id, [status,] created_at,
+        task_id) indexes: no OFFSET scan, no sort.
+        """
+        where, params = _task_filters(manager_id, status, after=after)
+        rows = self.db.connection().execute(
+            f"SELECT body FROM tasks {where} "
+            "ORDER BY created_at DESC, task_id DESC LIMIT ?",
+            [*params, -1 if limit is None else limit]
+        )
+        return [_load_task(body) for (body,) in rows]
+
+    def count_by_status(self, manager_id: Optional[str] = None) -> Dict[str, int]:
+        conn = self.db.connection()
+        if manager_id is None:
+            return dict(conn.execute(SQL_COUNT_ALL_BY_STATUS).fetchall())
+        return dict(conn.execute(SQL_COUNT_BY_STATUS, (manager_id,)).fetchall())
+
+    def get_version(
+        self,
+        manager_id: Optional[str] = None,
+        employee_id: Optional[str] = None,
+        project_name: Optional[str] = None
+    ) -> int:
+        """
+        Per-manager counters only grow, so their sum is a version too.
+        """
+        conn = self.db.connection()
+        if manager_id is not None:
+            row = conn.execute(SQL_GET_VERSION, (manager_id,)).fetchone()
+        elif employee_id is not None:
+            row = conn.execute(SQL_GET_EMPLOYEE_VERSION, (employee_id,)).fetchone()
+        elif project_name is not None:
+            row = conn.execute(SQL_GET_PROJECT_VERSION, (project_name,)).fetchone()
+        else:
+            row = conn.execute(SQL_GET_TOTAL_VERSION).fetchone()
+        return row[0] if row else 0
+
+    def get_next_task_id(self) -> int:
+        with self.db.write() as conn:
+            next_id = self.db.get_meta(conn, "lastTaskId") + 1
+            self.db.set_meta(conn, "lastTaskId", next_id)
+        return next_id
+
+    def create_task(self, task: TaskRecord) -> TaskRecord:
+        return self.create_tasks([task])[0]
+
+    def create_tasks(self, tasks: List[TaskRecord]) -> List[TaskRecord]:
+        if not tasks:
+            return tasks
+
+        with self.db.write() as conn:
+            first_id = self.db.get_meta(conn, "lastTaskId") + 1
+            for offset, task in enumerate(tasks):
+                task.task_id = first_id + offset
+                task.version = 1
+                _write_task(conn, task)
+            self.db.set_meta(conn, "lastTaskId", first_id + len(tasks) - 1)
+        return tasks
+
+    def update_task(self, updated_task: TaskRecord) -> TaskRecord:
+        return self.update_tasks([updated_task])[0]
+
+    def update_tasks(self, updated_tasks: List[TaskRecord]) -> List[TaskRecord]:
+        """
+        Version check and write happen inside one BEGIN IMMEDIATE
+        transaction, so concurrent workers cannot interleave.
+        """
+        with self.db.write() as conn:
+            new_versions = []
+            for task in updated_tasks:
+                row = conn.execute(SQL_SELECT_TASK, (task.task_id,)).fetchone()
+                if not row:
+                    raise ValueError(f"Task with ID {task.task_id} not found")
+                current_version = json.loads(row[0]).get("version", 0)
+                if task.version != current_version:
+                    raise TaskConflictError(
+                        f"Task with ID {task.task_id} was modified concurrently"
+                    )
+                new_versions.append(current_version + 1)
+
+            for task, version in zip(updated_tasks, new_versions):
+                task.version = version
+                _write_task(conn, task)
+        return updated_tasks
+
+
+# ==============================
+# PROJECTS
+# ==============================
+
+class SqliteProjectStore(ProjectStore):
+
+    def __init__(self, db: SqliteDatabase):
+        self.db = db
+
+    def get_all_projects(self) -> List[Dict]:
+        rows = self.db.connection().execute(SQL_SELECT_ALL_PROJECTS)
+        return [json.loads(body) for (body,) in rows]
+
+    def get_projects_for_manager(self, manager_id: str) -> List[Dict]:
+        rows = self.db.connection().execute(SQL_SELECT_MANAGER_PROJECTS, (manager_id,))
+        return [json.loads(body) for (body,) in rows]
+
+    def create_project(self, project: Dict) -> Dict:
+        with self.db.write() as conn:
+            exists = conn.execute(
+                SQL_PROJECT_NAME_EXISTS, (project["managerId"], project["projectName"])
+            ).fetchone()
+            if exists:
+                raise ValueError("Project with same name already exists")
+
+            project["projectId"] = self.db.get_meta(conn, "lastProjectId") + 1
+            self.db.set_meta(conn, "lastProjectId", project["projectId"])
+            _insert_project(conn, project)
+        return project
+
+
+def _insert_project(conn: sqlite3.Connection, project: Dict):
+    conn.execute(SQL_INSERT_PROJECT, (
+        project["projectId"],
+        project["managerId"],
+        project["projectName"],
+        json.dumps(project, separators=(",", ":"))
+    ))
+
+
+# ==============================
+# ONE-SHOT MIGRATION
+# ==============================
+
+def migrate_from_json(db: SqliteDatabase, task_file: Path, project_file: Path) -> bool:
+    """
+    Import tasks.json (+ its journal) and projects.json into an empty
+    database. Runs once: a `migratedFromJson` marker is stored in `meta`.
+    Returns True if a migration happened.
+    """
+    from app.services.backends.json_backend import JsonProjectStore, JsonTaskStore
+
+    if db.get_meta(db.connection(), "migratedFromJson"):
+        return False
+
+    task_data = JsonTaskStore(task_file)._load_data()
+    project_data = JsonProjectStore(project_file)._load_data()
+
+    with db.write() as conn:
+        # Re-check under the write lock: another worker may have won
+        if db.get_meta(conn, "migratedFromJson"):
+            return False
+
+        for task in task_data["tasks"].values():
+            _write_task(conn, task)
+        for project in project_data["projects"]:
+            _insert_project(conn, project)
+
+        db.set_meta(conn, "lastTaskId", task_data["lastTaskId"])
+        db.set_meta(conn, "lastProjectId", project_data["lastProjectId"])
+        db.set_meta(conn, "migratedFromJson", 1)
+
+    return True
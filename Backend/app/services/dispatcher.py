@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app import config
+from app.services import history, notifications
+
+logger = logging.getLogger(__name__)
+
+# Side effects of task assignment (notifications, history entries),
+# applied in batches off the request path. Started / drained from the
+# app lifespan; without a running dispatcher (scripts, tests without
+# lifespan) effects are applied at once, as before.
+#
+# Effects are sharded by employee: one queue and one worker per shard,
+# so an employee's effects are applied in submission order. Only the
+# worker applies effects, in a thread; nothing here blocks the loop.
+
+Effect = Tuple[str, Dict]
+
+# kind -> function applying a list of payloads in one commit
+_HANDLERS = {
+    "notification": notifications.create_notifications,
+    # Entries and status changes share a kind: they stay in order
+    "history": history.apply_history_changes,
+}
+
+
+class _Shard:
+    def __init__(self):
+        self.pending: Deque[Effect] = deque()
+        self.wakeup = asyncio.Event()  # effects were queued
+        self.room = asyncio.Event()    # fewer than DISPATCH_QUEUE_SIZE queued
+        self.idle = asyncio.Event()    # nothing queued or being applied
+        self.room.set()
+        self.idle.set()
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_shards: List[_Shard] = []
+_workers: List[asyncio.Task] = []
+
+
+def _apply(effects: List[Effect]):
+    for kind, handler in _HANDLERS.items():
+        payloads = [payload for effect_kind, payload in effects if effect_kind == kind]
+        if not payloads:
+            continue
+        try:
+            handler(payloads)
+        except Exception:
+            # The assignment itself is already stored; keep going
+            logger.exception("Applying %d %s effect(s) failed", len(payloads), kind)
+
+
+def _enqueue(shard: _Shard, effect: Effect):
+    # On the loop thread
+    shard.pending.append(effect)
+    shard.idle.clear()
+    shard.wakeup.set()
+    if len(shard.pending) >= config.DISPATCH_QUEUE_SIZE:
+        shard.room.clear()
+
+
+async def _work(shard: _Shard):
+    while True:
+        if not shard.pending:
+            shard.idle.set()
+            shard.wakeup.clear()
+            await shard.wakeup.wait()
+            continue
+
+        batch = [
+            shard.pending.popleft()
+            for _ in range(min(len(shard.pending), config.DISPATCH_BATCH_SIZE))
+        ]
+        if len(shard.pending) < config.DISPATCH_QUEUE_SIZE:
+            shard.room.set()
+        await asyncio.to_thread(_apply, batch)
+
+
+def submit(employee_id: str, kind: str, payload: Dict):
+    """
+    Queue one side effect of `kind` for an employee. From the event
+    loop this never waits (callers there apply backpressure with
+    `wait_for_room`); from another thread it waits for room.
+    """
+    loop = _loop
+    if loop is None:
+        _apply([(kind, payload)])
+        return
+
+    shard = _shards[hash(employee_id) % len(_shards)]
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        _enqueue(shard, (kind, payload))
+    else:
+        # Scheduled in call order, so a thread's effects keep their order
+        loop.call_soon_threadsafe(_enqueue, shard, (kind, payload))
+        asyncio.run_coroutine_threadsafe(shard.room.wait(), loop).result()
+
+
+async def wait_for_room():
+    """
+    Wait until no queue holds DISPATCH_QUEUE_SIZE effects or more
+    (backpressure for requests that queue many effects).
+    """
+    for shard in _shards:
+        await shard.room.wait()
+
+
+def start():
+    """Start the workers on the running loop (startup)."""
+    global _loop, _shards, _workers
+    _shards = [_Shard() for _ in range(max(1, config.DISPATCH_WORKERS))]
+    _workers = [asyncio.create_task(_work(shard)) for shard in _shards]
+    _loop = asyncio.get_running_loop()
+
+
+async def drain():
+    """Wait until every queued effect has been applied."""
+    for shard in _shards:
+        await shard.idle.wait()
+
+
+async def stop():
+    """Apply everything still queued, then stop the workers (shutdown)."""
+    global _loop
+    await drain()
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _loop = None
+    _workers.clear()
+    _shards.clear()
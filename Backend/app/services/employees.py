@@ -1,27 +1,150 @@
-from typing import List, Dict, Optional
+import copy
+from bisect import bisect_left, insort
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import app.database as db
+from app import config
+from app.enums import TaskStatus
+from app.services.journal import JournaledState
+from app.services.task_storage import query_tasks
 from app.utils import get_availability_status
 
+EMPLOYEE_FILE = config.STORAGE_DIR / "employees.json"
+
+# Seed data from app/database.py, used until employees.json exists
+_SEED_EMPLOYEES = copy.deepcopy(db.employees_db)
+
+ACTIVE_STATUSES = [TaskStatus.ASSIGNED.value, TaskStatus.IN_PROGRESS.value]
+
+# Keys of an employee in GET /api/employees/ (valid `fields=` values)
+EMPLOYEE_FIELDS = (*_SEED_EMPLOYEES[0], "taskHistorySummary")
+
+# ===== PERSISTENCE =====
+
+class _EmployeeState(JournaledState):
+    """
+    `db.employees_db` mirrored to employees.json + journal.
+    Records: {"op": "put", "employee": {...}} (upsert by employeeId).
+
+    `ranking` keeps (noOfActiveProjects, position, employeeId) keys
+    sorted, so least-loaded employees come first (ties in list order).
+    A key is moved only when an employee's workload changes.
+    """
+
+    def __init__(self):
+        super().__init__(EMPLOYEE_FILE, indent=None)
+        self.by_id: Dict[str, Dict] = {}
+        self.position: Dict[str, int] = {}
+        self.ranking: List[Tuple[int, int, str]] = []
+
+    def _rank_key(self, employee: Dict) -> Tuple[int, int, str]:
+        emp_id = employee["employeeId"]
+        return (employee["noOfActiveProjects"], self.position[emp_id], emp_id)
+
+    def _load_snapshot(self, snapshot: Optional[Dict]):
+        loaded = snapshot["employees"] if snapshot else copy.deepcopy(_SEED_EMPLOYEES)
+
+        # Refill the dicts of known employees in place, as `_apply` does:
+        # callers may hold a reference across a reload
+        employees = []
+        for employee in loaded:
+            existing = self.by_id.get(employee["employeeId"])
+            if existing is None:
+                employees.append(employee)
+                continue
+            existing.update(employee)
+            for key in [key for key in existing if key not in employee]:
+                del existing[key]
+            employees.append(existing)
+
+        db.employees_db[:] = employees
+        self.by_id = {emp["employeeId"]: emp for emp in db.employees_db}
+        self.position = {emp["employeeId"]: i for i, emp in enumerate(db.employees_db)}
+        self.ranking = sorted(self._rank_key(emp) for emp in db.employees_db)
+
+    def _dump_snapshot(self) -> Dict:
+        return {"employees": db.employees_db}
+
+    def _apply(self, record: Dict):
+        if record["op"] == "put":
+            employee = record["employee"]
+            existing = self.by_id.get(employee["employeeId"])
+            if existing is None:
+                db.employees_db.append(employee)
+                self.by_id[employee["employeeId"]] = employee
+                self.position[employee["employeeId"]] = len(db.employees_db) - 1
+                insort(self.ranking, self._rank_key(employee))
+                return
+
+            old_key = self._rank_key(existing)
+            # Update in place: callers may hold a reference
+            existing.update(employee)
+            new_key = self._rank_key(existing)
+            if new_key != old_key:
+                del self.ranking[bisect_left(self.ranking, old_key)]
+                insort(self.ranking, new_key)
+
+
+_state = _EmployeeState()
+
+
+def restore():
+    """Load persisted employees (startup)."""
+    _state.reload()
+
+
+def compact():
+    """Fold the employees journal into its snapshot (shutdown)."""
+    _state.compact()
+
+
+def recompute_workloads() -> int:
+    """
+    Re-derive every employee's `noOfActiveProjects` from the task store
+    (tasks assigned / in progress). Returns how many employees changed.
+    """
+    with _state.writing():
+        records = []
+        for emp in db.employees_db:
+            active = len(query_tasks(employee_id=emp["employeeId"], status=ACTIVE_STATUSES))
+            if emp["noOfActiveProjects"] != active:
+                records.append({"op": "put", "employee": {**emp, "noOfActiveProjects": active}})
+        _state.commit(records)
+        return len(records)
+
 # ===== CORE FUNCTIONS =====
 
 def get_all_employees() -> List[Dict]:
     """Get all employees with full details"""
+    _state.refresh()
     return db.employees_db
 
+def get_version() -> int:
+    """Data version of the employee collection (changes on every write)."""
+    _state.refresh()
+    return _state.rev
+
+def count_employees() -> int:
+    _state.refresh()
+    return len(db.employees_db)
+
 def get_employee_by_id(employee_id: str) -> Optional[Dict]:
     """Get employee by ID"""
-    for emp in db.employees_db:
-        if emp["employeeId"] == employee_id:
-            return emp
-    return None
-
-def get_employees_ranked() -> List[Dict]:
-    """Get employees ranked by availability"""
-    sorted_employees = sorted(db.employees_db, key=lambda x: x["noOfActiveProjects"])
+    _state.refresh()
+    return _state.by_id.get(employee_id)
+
+def get_employees_ranked(limit: Optional[int] = None) -> List[Dict]:
+    """
+    Get employees ranked by availability (fewest active projects
+    first). `limit` returns only the top-k; the ranking itself is
+    maintained on write, so only the returned entries are built.
+    """
+    _state.refresh()
+    top_keys = _state.ranking[:limit]
     
     ranked_list = []
-    for rank, emp in enumerate(sorted_employees, 1):
+    for rank, (_, _, emp_id) in enumerate(top_keys, 1):
+        emp = _state.by_id[emp_id]
         ranked_list.append({
             "rank": rank,
             "employeeId": emp["employeeId"],
@@ -35,13 +158,45 @@ def get_employees_ranked() -> List[Dict]:
 
 def update_employee_on_assignment(employee_id: str, task_title: str) -> bool:
     """Update employee when task is assigned"""
-    employee = get_employee_by_id(employee_id)
-    if employee:
-        employee["noOfActiveProjects"] += 1
-        employee["currentTaskDetails"] = task_title
-        employee["date"] = datetime.now().strftime("%Y-%m-%d")
-        return True
-    return False
+    return update_employees_on_assignment([(employee_id, task_title)]) == 1
+
+def update_employees_on_assignment(assignments: List[Tuple[str, str]]) -> int:
+    """
+    Apply several (employeeId, task title) assignments in one commit:
+    one record per employee, counting all of its new tasks. Unknown
+    employees are skipped. Returns how many assignments were applied.
+    """
+    with _state.writing():
+        today = datetime.now().strftime("%Y-%m-%d")
+        updated: Dict[str, Dict] = {}
+        applied = 0
+        for employee_id, task_title in assignments:
+            employee = updated.get(employee_id) or _state.by_id.get(employee_id)
+            if not employee:
+                continue
+            updated[employee_id] = {
+                **employee,
+                "noOfActiveProjects": employee["noOfActiveProjects"] + 1,
+                "currentTaskDetails": task_title,
+                "date": today
+            }
+            applied += 1
+
+        if updated:
+            _state.commit([{"op": "put", "employee": emp} for emp in updated.values()])
+        return applied
+
+def update_employee_on_completion(employee_id: str) -> bool:
+    """Decrement active project count when a task is completed"""
+    with _state.writing():
+        employee = _state.by_id.get(employee_id)
+        if employee and employee["noOfActiveProjects"] > 0:
+            _state.commit([{"op": "put", "employee": {
+                **employee,
+                "noOfActiveProjects": employee["noOfActiveProjects"] - 1
+            }}])
+            return True
+        return False
 
 # ===== PROFILE MAPPING FUNCTIONS =====
 
@@ -55,8 +210,8 @@ def map_employee_to_profile(emp: Dict) -> Dict:
     }
 
 def get_all_employee_profiles() -> List[Dict]:
-    return [map_employee_to_profile(emp) for emp in db.employees_db]
+    return [map_employee_to_profile(emp) for emp in get_all_employees()]
 
 def get_employee_profile_by_id(employee_id: str) -> Optional[Dict]:
     emp = get_employee_by_id(employee_id)
-    return map_employee_to_profile(emp) if emp else None
\ No newline at end of file
+    return map_employee_to_profile(emp) if emp else None
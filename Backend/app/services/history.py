@@ -1,27 +1,183 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 import app.database as db
+from app.records import HistoryEntry
+from app import config
+from app.enums import TaskStatus
+from app.services.journal import JournaledState
+
+HISTORY_FILE = config.STORAGE_DIR / "task_history.json"
+
+# Seed employees get an empty history until task_history.json exists
+_SEED_EMPLOYEE_IDS = list(db.employee_task_history)
+
+ACTIVE_STATUSES = (TaskStatus.ASSIGNED.value, TaskStatus.IN_PROGRESS.value)
+
+
+def _empty_summary() -> Dict[str, int]:
+    return {"totalTasks": 0, "activeTasks": 0, "completedTasks": 0}
+
+
+def _count(summary: Dict[str, int], entry: HistoryEntry, sign: int):
+    summary["totalTasks"] += sign
+    if entry.status in ACTIVE_STATUSES:
+        summary["activeTasks"] += sign
+    elif entry.status == TaskStatus.COMPLETED.value:
+        summary["completedTasks"] += sign
+
+# ===== PERSISTENCE =====
+
+class _HistoryState(JournaledState):
+    """
+    `db.employee_task_history` (lists of `HistoryEntry`) mirrored to
+    task_history.json + journal. Records:
+    {"op": "put", "employeeId": ..., "entry": {...}}
+    (upsert by taskId within the employee's history).
+
+    `summaries` keeps total / active / completed counts per employee,
+    adjusted by every applied record; `positions` maps each employee's
+    taskIds to their index in the history list, so a put never scans it.
+    """
+
+    def __init__(self):
+        super().__init__(HISTORY_FILE, indent=None)
+        self.summaries: Dict[str, Dict[str, int]] = {}
+        self.positions: Dict[str, Dict[int, int]] = {}
+
+    def _load_snapshot(self, snapshot: Optional[Dict]):
+        db.employee_task_history.clear()
+        db.employee_task_history.update({emp_id: [] for emp_id in _SEED_EMPLOYEE_IDS})
+        if snapshot:
+            db.employee_task_history.update({
+                emp_id: [HistoryEntry.from_dict(entry) for entry in entries]
+                for emp_id, entries in snapshot["history"].items()
+            })
+
+        self.summaries = {}
+        self.positions = {}
+        for emp_id, history in db.employee_task_history.items():
+            summary = self.summaries[emp_id] = _empty_summary()
+            for entry in history:
+                _count(summary, entry, 1)
+            self.positions[emp_id] = {entry.task_id: idx for idx, entry in enumerate(history)}
+
+    def _dump_snapshot(self) -> Dict:
+        return {
+            "history": {
+                emp_id: [entry.to_dict() for entry in entries]
+                for emp_id, entries in db.employee_task_history.items()
+            }
+        }
+
+    def _apply(self, record: Dict):
+        if record["op"] == "put":
+            history = db.employee_task_history.setdefault(record["employeeId"], [])
+            summary = self.summaries.setdefault(record["employeeId"], _empty_summary())
+            positions = self.positions.setdefault(record["employeeId"], {})
+            entry = HistoryEntry.from_dict(record["entry"])
+            idx = positions.get(entry.task_id)
+            if idx is not None:
+                _count(summary, history[idx], -1)
+                history[idx] = entry
+            else:
+                positions[entry.task_id] = len(history)
+                history.append(entry)
+            _count(summary, entry, 1)
+
+    def find(self, employee_id: str, task_id: int) -> Optional[HistoryEntry]:
+        idx = self.positions.get(employee_id, {}).get(task_id)
+        return None if idx is None else db.employee_task_history[employee_id][idx]
+
+
+_state = _HistoryState()
+
+
+def restore():
+    """Load persisted task history (startup)."""
+    _state.reload()
+
+
+def compact():
+    """Fold the task history journal into its snapshot (shutdown)."""
+    _state.compact()
+
 
 def add_task_to_employee_history(
     employee_id: str, task_id: int, task_title: str, 
     manager_id: str, manager_name: str, assigned_at: str, status: str = "Assigned"
 ) -> None:
     """Add a task assignment to employee's history"""
-    if employee_id not in db.employee_task_history:
-        db.employee_task_history[employee_id] = []
-    
-    history_entry = {
-        "taskId": task_id,
-        "taskTitle": task_title,
-        "managerId": manager_id,
-        "managerName": manager_name,
-        "assignedAt": assigned_at,
-        "status": status,
-        "completedAt": None
-    }
-    
-    db.employee_task_history[employee_id].append(history_entry)
+    apply_history_changes([{
+        "op": "add",
+        "employee_id": employee_id,
+        "task_id": task_id,
+        "task_title": task_title,
+        "manager_id": manager_id,
+        "manager_name": manager_name,
+        "assigned_at": assigned_at,
+        "status": status
+    }])
+
+def apply_history_changes(changes: List[Dict]) -> List[bool]:
+    """
+    Apply several history changes in order, in one commit:
+    - {"op": "add", ...}: `add_task_to_employee_history` arguments
+    - {"op": "status", ...}: `update_task_status_in_history` arguments
+
+    A status change sees the adds before it in the same list. Returns,
+    per change, whether it applied (False: no history entry for the task).
+    """
+    with _state.writing():
+        records = []
+        applied = []
+        # Entries written earlier in this list, by (employeeId, taskId)
+        pending: Dict[tuple, Dict] = {}
+
+        for change in changes:
+            key = (change["employee_id"], change["task_id"])
+            if change["op"] == "add":
+                entry = HistoryEntry(
+                    task_id=change["task_id"],
+                    task_title=change["task_title"],
+                    manager_id=change["manager_id"],
+                    manager_name=change["manager_name"],
+                    assigned_at=change["assigned_at"],
+                    status=change.get("status", "Assigned")
+                ).to_dict()
+            else:
+                current = pending.get(key)
+                if current is None:
+                    existing = _state.find(*key)
+                    current = existing.to_dict() if existing is not None else None
+                if current is None:
+                    applied.append(False)
+                    continue
+                entry = {**current, "status": change["new_status"]}
+                if change.get("completed_at"):
+                    entry["completedAt"] = change["completed_at"]
+
+            pending[key] = entry
+            records.append({"op": "put", "employeeId": change["employee_id"], "entry": entry})
+            applied.append(True)
+
+        if records:
+            _state.commit(records)
+        return applied
+
+def get_version() -> int:
+    """Data version of the task history (changes on every write)."""
+    _state.refresh()
+    return _state.rev
+
+def get_employee_history_summary(employee_id: str) -> Dict[str, int]:
+    """
+    Total / active / completed task counts of an employee, read from
+    maintained counters (no scan of the history).
+    """
+    _state.refresh()
+    return dict(_state.summaries.get(employee_id) or _empty_summary())
 
 def get_employee_task_history(employee_id: str) -> Dict:
+    _state.refresh()
     if employee_id not in db.employee_task_history:
         return {
             "employeeId": employee_id, "totalTasks": 0,
@@ -29,27 +185,24 @@ def get_employee_task_history(employee_id: str) -> Dict:
         }
     
     history = db.employee_task_history[employee_id]
-    active = [h for h in history if h["status"] in ["Assigned", "In Progress"]]
-    completed = [h for h in history if h["status"] == "Completed"]
+    active = [h for h in history if h.status in ACTIVE_STATUSES]
+    completed = [h for h in history if h.status == "Completed"]
     
     return {
         "employeeId": employee_id,
         "totalTasks": len(history),
         "activeTasks": active, "activeCount": len(active),
         "completedTasks": completed, "completedCount": len(completed),
-        "fullHistory": sorted(history, key=lambda x: x["assignedAt"], reverse=True)
+        "fullHistory": sorted(history, key=lambda x: x.assigned_at, reverse=True)
     }
 
 def update_task_status_in_history(
     employee_id: str, task_id: int, new_status: str, completed_at: str = None
 ) -> bool:
-    if employee_id not in db.employee_task_history:
-        return False
-    
-    for entry in db.employee_task_history[employee_id]:
-        if entry["taskId"] == task_id:
-            entry["status"] = new_status
-            if completed_at:
-                entry["completedAt"] = completed_at
-            return True
-    return False
\ No newline at end of file
+    return apply_history_changes([{
+        "op": "status",
+        "employee_id": employee_id,
+        "task_id": task_id,
+        "new_status": new_status,
+        "completed_at": completed_at
+    }])[0]
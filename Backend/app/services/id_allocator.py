@@ -0,0 +1,35 @@
+import threading
+from typing import Callable, List
+
+
+class IdAllocator:
+    """
+    Hands out increasing integer IDs from blocks reserved up front.
+
+    `reserve(count)` must durably record that `count` IDs starting at the
+    returned value are taken (e.g. by persisting a new high-water mark)
+    before returning. IDs are then served from memory until the block
+    runs out, so most allocations cost no I/O. A restart skips whatever
+    was left of the block: IDs can have gaps but are never reused.
+    """
+
+    def __init__(self, reserve: Callable[[int], int], block_size: int = 16):
+        self._reserve = reserve
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0  # exclusive
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        return self.next_ids(1)[0]
+
+    def next_ids(self, count: int) -> List[int]:
+        with self._lock:
+            if self._end - self._next < count:
+                size = max(count, self.block_size)
+                self._next = self._reserve(size)
+                self._end = self._next + size
+
+            ids = list(range(self._next, self._next + count))
+            self._next += count
+            return ids
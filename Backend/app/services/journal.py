@@ -0,0 +1,269 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.services.file_lock import FileLock
+
+
+class Journal:
+    """
+    Append-only record log kept next to a JSON snapshot.
+
+    Every mutation is appended to `<name>.journal` as one compact JSON
+    line, so a write costs O(record size). `compact` folds the current
+    state back into the snapshot file and truncates the log.
+
+    Records must be idempotent (full puts, monotonic counters): a crash
+    between replacing the snapshot and truncating the log only means
+    some records are replayed twice on the next load.
+
+    Writers from several processes must hold `lock` (exclusive) around
+    their read-modify-write; full reloads take it shared.
+    """
+
+    def __init__(
+        self,
+        snapshot_file: Path,
+        compact_every: int = 500,
+        indent: Optional[int] = 2
+    ):
+        self.snapshot_file = snapshot_file
+        self.log_file = snapshot_file.with_suffix(".journal")
+        self.lock = FileLock(snapshot_file.with_suffix(".lock"))
+        self.compact_every = compact_every
+        self.indent = indent  # None: compact single-line snapshot
+        self.pending = 0      # records appended since the last compaction
+
+    # ==============================
+    # READ
+    # ==============================
+
+    def read_snapshot(self) -> Optional[Dict]:
+        if not self.snapshot_file.exists():
+            return None
+
+        with open(self.snapshot_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def read_records(self, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Return records appended after byte `offset` and the new end offset.
+        A trailing line without newline (write still in flight) is left
+        for the next read; a corrupt line in the middle is skipped.
+        """
+        if not self.log_file.exists():
+            if offset == 0:
+                self.pending = 0
+            return [], 0
+
+        with open(self.log_file, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+
+        records = []
+        end = offset
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+        self.pending = (0 if offset == 0 else self.pending) + len(records)
+        return records, end
+
+    # ==============================
+    # WRITE
+    # ==============================
+
+    def append(self, records: List[Dict]) -> None:
+        if not records:
+            return
+
+        payload = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n"
+            for record in records
+        )
+
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+        self.pending += len(records)
+
+    def needs_compaction(self) -> bool:
+        return self.pending >= self.compact_every
+
+    def compact(self, snapshot: Dict) -> None:
+        """
+        Atomically replace the snapshot, then truncate the log.
+        """
+        self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.snapshot_file.with_suffix(".tmp")
+
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            if self.indent is None:
+                json.dump(snapshot, f, separators=(",", ":"))
+            else:
+                json.dump(snapshot, f, indent=self.indent)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_file, self.snapshot_file)
+        open(self.log_file, "w").close()
+        self.pending = 0
+
+
+def _file_signature(path: Path) -> Optional[Tuple]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class JournaledState:
+    """
+    In-memory state mirrored to a `Journal` and kept in sync with
+    other processes writing the same files.
+
+    Subclasses hold their state in attributes and implement:
+    - `_load_snapshot(snapshot)`: reset state from a snapshot (None = empty)
+    - `_dump_snapshot()`: current state in snapshot shape
+    - `_apply(record)`: apply one journal record (must be idempotent)
+
+    Reads call `refresh()` first (two stat calls when nothing changed).
+    Writes run inside `with state.writing():` and end with `commit()`.
+
+    Every committed record carries a `rev` one above the last one, and
+    the snapshot stores the rev it covers, so `rev` is a persistent,
+    monotonic data version shared by all processes. `base_rev` is the
+    rev of the loaded snapshot: the version of anything no record has
+    touched since.
+    """
+
+    def __init__(
+        self,
+        snapshot_file: Path,
+        compact_every: int = 500,
+        indent: Optional[int] = 2
+    ):
+        self._journal = Journal(snapshot_file, compact_every=compact_every, indent=indent)
+        self._loaded = False
+        self._signature: Optional[Tuple] = None  # stat of snapshot when loaded
+        self._offset = 0                         # journal bytes applied
+        self._lock = threading.RLock()
+        self.rev = 0
+        self.base_rev = 0
+
+    # ---------- hooks ----------
+
+    def _load_snapshot(self, snapshot: Optional[Dict]):
+        raise NotImplementedError
+
+    def _dump_snapshot(self) -> Dict:
+        raise NotImplementedError
+
+    def _apply(self, record: Dict):
+        raise NotImplementedError
+
+    # ---------- sync ----------
+
+    def reload(self):
+        """
+        Full load: snapshot + journal replay.
+        Holds the lock shared so no compaction swaps files mid-read.
+        """
+        with self._lock, self._journal.lock.hold(shared=True):
+            self._signature = _file_signature(self._journal.snapshot_file)
+            snapshot = self._journal.read_snapshot()
+            records, self._offset = self._journal.read_records()
+
+            self.rev = self.base_rev = (snapshot or {}).get("rev", 0)
+            self._load_snapshot(snapshot)
+            for record in records:
+                self._apply_record(record)
+            self._loaded = True
+
+    def refresh(self):
+        """
+        Catch up with the files, only if they changed.
+
+        - snapshot replaced (compaction elsewhere) -> full reload
+        - journal grew -> replay just the new tail
+
+        Lock-free: readers never wait for writers of other processes.
+        """
+        with self._lock:
+            signature = _file_signature(self._journal.snapshot_file)
+            if not self._loaded or signature != self._signature:
+                self.reload()
+                return
+
+            journal_signature = _file_signature(self._journal.log_file)
+            journal_size = journal_signature[2] if journal_signature else 0
+
+            if journal_size < self._offset:
+                self.reload()
+            elif journal_size > self._offset:
+                records, offset = self._journal.read_records(self._offset)
+                # A compaction elsewhere may have truncated and regrown
+                # the log since the check above. It replaces the snapshot
+                # before truncating, so a snapshot unchanged after the
+                # read means the tail came from the log we had
+                if _file_signature(self._journal.snapshot_file) != self._signature:
+                    self.reload()
+                    return
+                self._offset = offset
+                for record in records:
+                    self._apply_record(record)
+
+    @contextmanager
+    def writing(self):
+        """
+        Thread lock + exclusive inter-process lock, with state caught up.
+        """
+        with self._lock, self._journal.lock.hold():
+            self.refresh()
+            yield
+
+    def commit(self, records: List[Dict]):
+        """
+        Apply records in memory and append them to the journal; compact
+        once enough records piled up. Call inside `writing()`.
+
+        The journal offset is not advanced here: our own records are
+        re-read with the next tail, which keeps ordering with records
+        other processes appended in between (records are idempotent).
+        """
+        for record in records:
+            record["rev"] = self.rev + 1
+            self._apply_record(record)
+
+        self._journal.append(records)
+
+        if self._journal.needs_compaction():
+            self._compact()
+
+    def compact(self):
+        with self.writing():
+            self._compact()
+
+    def _apply_record(self, record: Dict):
+        self._apply(record)
+        self.rev = max(self.rev, record.get("rev", 0))
+
+    def _compact(self):
+        snapshot = self._dump_snapshot()
+        snapshot["rev"] = self.rev
+        self._journal.compact(snapshot)
+        self._signature = _file_signature(self._journal.snapshot_file)
+        self._offset = 0
@@ -0,0 +1,23 @@
+import asyncio
+import logging
+from typing import Callable, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Periodic housekeeping, off the request path. Started from the app
+# lifespan; jobs are blocking functions and run in a worker thread.
+
+
+async def _every(job: Callable[[], None], interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(job)
+        except Exception:
+            # A failing run must not stop later ones
+            logger.exception("Maintenance job %s failed", job.__qualname__)
+
+
+async def run_periodically(jobs: Sequence[Tuple[Callable[[], None], float]]):
+    """Run each (job, interval in seconds) on its own schedule until cancelled."""
+    await asyncio.gather(*(_every(job, interval) for job, interval in jobs))
@@ -0,0 +1,168 @@
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from app import config
+from app.records import NotificationRecord
+from app.services.file_lock import FileLock
+
+# Cold storage for notifications moved out of the hot store by the
+# retention pass (`notifications.apply_retention`).
+#
+# Each employee has a directory with gzip'd JSON-lines segments (oldest
+# first) and an index.json:
+# {"lastSegment": n, "segments": [{"file", "count", "minId", "maxId"}]}.
+# A pass appends to the employee's newest segment until it holds
+# SEGMENT_MAX_ITEMS, then starts a new one, so a pass costs at most one
+# segment rewrite per employee plus the new items, and reads only touch
+# that employee's index. Segment files and indexes are replaced
+# atomically (segment first: an index never counts lines a segment
+# lacks), so readers need no lock; writers hold `writing()`.
+
+ARCHIVE_DIR = config.STORAGE_DIR / "notification_archive"
+
+# Notifications per segment file
+SEGMENT_MAX_ITEMS = 1000
+
+_lock = FileLock(ARCHIVE_DIR / "archive.lock")
+
+
+def _employee_dir(employee_id: str) -> Path:
+    return ARCHIVE_DIR / quote(employee_id, safe="")
+
+
+def _read_index(employee_id: str) -> Dict:
+    index_file = _employee_dir(employee_id) / "index.json"
+    if not index_file.exists():
+        return {"lastSegment": 0, "segments": []}
+    with open(index_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _replace(path, write):
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def _segment_number(segment: Dict) -> int:
+    # "segment-000042.jsonl.gz" -> 42
+    return int(segment["file"].split("-", 1)[1].split(".", 1)[0])
+
+
+def _read_lines(employee_id: str, segment: Dict) -> List[str]:
+    """The segment's lines, oldest first, as far as the index counts them."""
+    with gzip.open(_employee_dir(employee_id) / segment["file"], "rt", encoding="utf-8") as f:
+        return [line for line in f if line.strip()][:segment["count"]]
+
+
+def _write_segment(employee_id: str, segment: Dict, lines: List[str]):
+    payload = gzip.compress("".join(lines).encode("utf-8"))
+    _replace(_employee_dir(employee_id) / segment["file"], lambda f: f.write(payload))
+    segment["count"] = len(lines)
+
+
+def writing():
+    """Exclusive hold on the archive (one retention pass at a time)."""
+    return _lock.hold()
+
+
+def write_segments(by_employee: Dict[str, List[NotificationRecord]]):
+    """
+    Archive each employee's notifications (oldest first), after the
+    ones already archived. Caller holds `writing()`.
+    """
+    for employee_id, notifications in by_employee.items():
+        _employee_dir(employee_id).mkdir(parents=True, exist_ok=True)
+        index = _read_index(employee_id)
+        segments = index["segments"]
+        new_lines = [
+            json.dumps(n.to_dict(), separators=(",", ":")) + "\n" for n in notifications
+        ]
+        new_ids = [n.notification_id for n in notifications]
+
+        # Top up the newest segment, then start new ones
+        if segments and segments[-1]["count"] < SEGMENT_MAX_ITEMS:
+            segment = segments[-1]
+            room = SEGMENT_MAX_ITEMS - segment["count"]
+            _write_segment(employee_id, segment, _read_lines(employee_id, segment) + new_lines[:room])
+            segment["maxId"] = new_ids[:room][-1]
+            new_lines, new_ids = new_lines[room:], new_ids[room:]
+
+        for start in range(0, len(new_lines), SEGMENT_MAX_ITEMS):
+            index["lastSegment"] += 1
+            segment = {
+                "file": f"segment-{index['lastSegment']:06d}.jsonl.gz",
+                "count": 0,
+                "minId": new_ids[start],
+                "maxId": new_ids[start:start + SEGMENT_MAX_ITEMS][-1]
+            }
+            _write_segment(employee_id, segment, new_lines[start:start + SEGMENT_MAX_ITEMS])
+            segments.append(segment)
+
+        _replace(
+            _employee_dir(employee_id) / "index.json",
+            lambda f: f.write(json.dumps(index, separators=(",", ":")).encode("utf-8"))
+        )
+
+
+def count_archived(employee_id: str) -> int:
+    return sum(segment["count"] for segment in _read_index(employee_id)["segments"])
+
+
+def page_archived(
+    employee_id: str,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[NotificationRecord], Optional[str]]:
+    """
+    One page of the employee's archived notifications, newest first,
+    and the cursor of the next page (None on the last). Only the
+    segments the page spans are decompressed.
+
+    The cursor is "<segment number>:<end>": the page continues with the
+    items before position `end` (counted oldest first) of that segment.
+    Later retention passes only add newer items after those, so a cursor
+    stays valid (new items show up on the next first page). Raises
+    ValueError if the cursor is malformed or names no segment of the
+    employee.
+    """
+    segments = _read_index(employee_id)["segments"][::-1]
+
+    position = 0
+    end = segments[0]["count"] if segments else 0
+    if cursor:
+        try:
+            number, end = (int(part) for part in cursor.split(":"))
+        except ValueError:
+            raise ValueError("Invalid cursor")
+        numbers = [_segment_number(segment) for segment in segments]
+        if number not in numbers:
+            raise ValueError("Invalid cursor")
+        position = numbers.index(number)
+        if not 0 <= end <= segments[position]["count"]:
+            raise ValueError("Invalid cursor")
+
+    page: List[NotificationRecord] = []
+    while position < len(segments) and len(page) < limit:
+        if end > 0:
+            lines = _read_lines(employee_id, segments[position])
+            taken = min(end, limit - len(page))
+            page.extend(
+                NotificationRecord.from_dict(json.loads(line))
+                for line in reversed(lines[end - taken:end])
+            )
+            end -= taken
+        if end == 0:
+            position += 1
+            end = segments[position]["count"] if position < len(segments) else 0
+
+    if position >= len(segments):
+        return page, None
+    return page, f"{_segment_number(segments[position])}:{end}"
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from typing import Dict, Set
+
+from app.records import NotificationRecord
+
+# In-process fan-out of new notifications to open SSE streams
+# (GET /api/notifications/employee/{id}/stream).
+#
+# `publish` is called from `create_notifications`, which may run on the
+# event loop or in a worker thread, so delivery goes through
+# `loop.call_soon_threadsafe`. Streams treat the queue as a fast path
+# only: the notification store stays the source of truth (resume after
+# a reconnect, overflow, writes made by other worker processes).
+
+# Pending notifications per stream before it falls back to the store
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class Subscriber:
+    """One open stream: a bounded queue of new notifications."""
+
+    def __init__(self, employee_id: str):
+        self.employee_id = employee_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: "asyncio.Queue[NotificationRecord]" = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        # Set when a notification could not be queued: the stream must
+        # re-read the store
+        self.lagged = False
+
+    def _put(self, notification: NotificationRecord):
+        try:
+            self.queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+
+_subscribers: Dict[str, Set[Subscriber]] = {}
+_lock = threading.Lock()
+
+
+def subscribe(employee_id: str) -> Subscriber:
+    """Register a stream; must be called on the event loop."""
+    subscriber = Subscriber(employee_id)
+    with _lock:
+        _subscribers.setdefault(employee_id, set()).add(subscriber)
+    return subscriber
+
+
+def unsubscribe(subscriber: Subscriber):
+    with _lock:
+        streams = _subscribers.get(subscriber.employee_id)
+        if streams is not None:
+            streams.discard(subscriber)
+            if not streams:
+                del _subscribers[subscriber.employee_id]
+
+
+def publish(notification: NotificationRecord):
+    """Hand a new notification to the employee's open streams (any thread)."""
+    with _lock:
+        streams = list(_subscribers.get(notification.employee_id, ()))
+
+    for subscriber in streams:
+        try:
+            subscriber.loop.call_soon_threadsafe(subscriber._put, notification)
+        except RuntimeError:  # event loop already closed
+            unsubscribe(subscriber)
+
+
+def count_subscribers() -> int:
+    with _lock:
+        return sum(len(streams) for streams in _subscribers.values())
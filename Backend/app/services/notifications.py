@@ -1,55 +1,364 @@
-from typing import List, Dict
-from datetime import datetime
+from bisect import bisect_right
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta
 import app.database as db
+from app import config
+from app.records import NotificationRecord
+from app.services import notification_archive, notification_stream
 from app.services.employees import get_employee_by_id
+from app.services.journal import JournaledState
 from app.services.managers import get_manager_by_id
 
-def create_notification(employee_id: str, manager_id: str, task_id: int, message: str) -> Dict:
+NOTIFICATION_FILE = config.STORAGE_DIR / "notifications.json"
+
+# Notifications are written often; fold the journal less eagerly
+COMPACT_EVERY = 2000
+
+_notification_id = attrgetter("notification_id")
+
+# ===== PERSISTENCE =====
+
+class _NotificationState(JournaledState):
+    """
+    `db.notifications_db` ({notificationId: `NotificationRecord`}, in id
+    order) / `db.notification_counter` mirrored to notifications.json +
+    journal. Lookups, replacements and deletes by id are O(1).
+
+    Records:
+    - {"op": "put", "notification": {...}}: new (id above the counter)
+      or replaced notification; a put for a known-deleted id is ignored
+    - {"op": "del", "notificationId": ...}
+
+    Kept in step with every applied record:
+    - `unread`: number of unread notifications
+    - `inboxes`: each employee's notifications by id, in id (= creation)
+      order
+    - `inbox_unread`: each employee's unread notifications by id
+    - `employee_revs`: rev of the last record that touched each
+      employee's notifications
+    - `deleted`: deletes since the maps were last rebuilt (see `reclaim`)
+
+    Readers take C-level copies (`list(d.values())`) rather than looping
+    over the live maps, which a writer thread may be changing.
+    """
+
+    def __init__(self):
+        super().__init__(NOTIFICATION_FILE, compact_every=COMPACT_EVERY, indent=None)
+        self.unread = 0
+        self.inboxes: Dict[str, Dict[int, NotificationRecord]] = {}
+        self.inbox_unread: Dict[str, Dict[int, NotificationRecord]] = {}
+        self.employee_revs: Dict[str, int] = {}
+        self.deleted = 0
+
+    def _file(self, notification: NotificationRecord, replaces: Optional[NotificationRecord] = None):
+        employee_id = notification.employee_id
+        notification_id = notification.notification_id
+
+        if replaces is not None and replaces.employee_id != employee_id:
+            self._unfile(replaces)
+            replaces = None
+
+        inbox = self.inboxes.setdefault(employee_id, {})
+        # New ids are the highest so far: appending keeps id order, and
+        # a replacement keeps its slot
+        inbox[notification_id] = notification
+        if replaces is None and next(reversed(inbox)) != notification_id:
+            self.inboxes[employee_id] = dict(sorted(inbox.items()))
+
+        unread = self.inbox_unread.setdefault(employee_id, {})
+        if notification.is_read:
+            unread.pop(notification_id, None)
+        else:
+            unread[notification_id] = notification
+        if not unread:
+            del self.inbox_unread[employee_id]
+
+    def _unfile(self, notification: NotificationRecord):
+        employee_id = notification.employee_id
+        notification_id = notification.notification_id
+
+        inbox = self.inboxes.get(employee_id, {})
+        if inbox.pop(notification_id, None) is not None and not inbox:
+            del self.inboxes[employee_id]
+
+        unread = self.inbox_unread.get(employee_id)
+        if unread is not None:
+            unread.pop(notification_id, None)
+            if not unread:
+                del self.inbox_unread[employee_id]
+
+    def reclaim(self):
+        """
+        Rebuild the id maps if many entries were deleted since the last
+        rebuild: dicts keep the slots of deleted keys (tombstones) until
+        they next grow, so after bulk deletes this gives memory back.
+        Readers holding the old maps keep a consistent view.
+        """
+        if self.deleted <= max(1024, len(db.notifications_db) // 2):
+            return
+        db.notifications_db = dict(db.notifications_db)
+        self.inboxes = {emp: dict(inbox) for emp, inbox in self.inboxes.items()}
+        self.inbox_unread = {emp: dict(unread) for emp, unread in self.inbox_unread.items()}
+        self.deleted = 0
+
+    def _load_snapshot(self, snapshot: Optional[Dict]):
+        snapshot = snapshot or {"lastNotificationId": 0, "notifications": []}
+        notifications = sorted(
+            (NotificationRecord.from_dict(n) for n in snapshot["notifications"]),
+            key=_notification_id
+        )
+        db.notifications_db = {n.notification_id: n for n in notifications}
+        db.notification_counter = snapshot["lastNotificationId"]
+        self.unread = sum(1 for n in notifications if not n.is_read)
+        self.inboxes = {}
+        self.inbox_unread = {}
+        for notification in notifications:
+            self._file(notification)
+        self.employee_revs = {}
+        self.deleted = 0
+
+    def _dump_snapshot(self) -> Dict:
+        return {
+            "lastNotificationId": db.notification_counter,
+            "notifications": [n.to_dict() for n in db.notifications_db.values()]
+        }
+
+    def _apply(self, record: Dict):
+        if record["op"] == "put":
+            notification = NotificationRecord.from_dict(record["notification"])
+            notification_id = notification.notification_id
+            self.employee_revs[notification.employee_id] = record.get("rev", 0)
+
+            if notification_id > db.notification_counter:
+                db.notifications_db[notification_id] = notification
+                db.notification_counter = notification_id
+                self._file(notification)
+                if not notification.is_read:
+                    self.unread += 1
+                return
+
+            existing = db.notifications_db.get(notification_id)
+            if existing is not None:
+                db.notifications_db[notification_id] = notification
+                self._file(notification, replaces=existing)
+                self.unread += int(existing.is_read) - int(notification.is_read)
+
+        elif record["op"] == "del":
+            existing = db.notifications_db.pop(record["notificationId"], None)
+            if existing is not None:
+                self._unfile(existing)
+                self.employee_revs[existing.employee_id] = record.get("rev", 0)
+                self.deleted += 1
+                if not existing.is_read:
+                    self.unread -= 1
+
+
+_state = _NotificationState()
+
+
+def restore():
+    """Load persisted notifications (startup)."""
+    _state.reload()
+
+
+def apply_retention() -> int:
+    """
+    Move read notifications past the retention policy to the archive
+    (background task). Returns how many were moved.
+
+    Per employee, in id order: read notifications created more than
+    `NOTIFICATION_READ_MAX_AGE_DAYS` ago, and the oldest read ones while
+    the inbox holds more than `NOTIFICATION_MAX_PER_INBOX`. Unread
+    notifications stay.
+
+    The store's write lock is held only to pick the notifications and
+    to delete them, not while the archive is written; ones changed or
+    deleted in between stay where they are.
+    """
+    max_age = config.NOTIFICATION_READ_MAX_AGE_DAYS
+    max_per_inbox = config.NOTIFICATION_MAX_PER_INBOX
+    cutoff = (datetime.now() - timedelta(days=max_age)).strftime("%Y-%m-%d %H:%M:%S")
+
+    with notification_archive.writing():
+        with _state.writing():
+            expired: Dict[str, List[NotificationRecord]] = {}
+            for employee_id, inbox in _state.inboxes.items():
+                excess = len(inbox) - max_per_inbox if max_per_inbox else 0
+                chosen = []
+                for notification in inbox.values():
+                    if not notification.is_read:
+                        continue
+                    if excess > 0 or (max_age and notification.created_at < cutoff):
+                        chosen.append(notification)
+                        excess -= 1
+                if chosen:
+                    expired[employee_id] = chosen
+
+        if not expired:
+            return 0
+
+        # Archive first: a crash in between leaves a copy in both
+        # places rather than losing notifications
+        notification_archive.write_segments(expired)
+
+        with _state.writing():
+            records = [
+                {"op": "del", "notificationId": notification.notification_id}
+                for chosen in expired.values()
+                for notification in chosen
+                if db.notifications_db.get(notification.notification_id) == notification
+            ]
+            if records:
+                _state.commit(records)
+            return len(records)
+
+
+def reclaim():
+    """Give back memory held by deleted notifications (background task)."""
+    with _state.writing():
+        _state.reclaim()
+
+
+def compact():
+    """Fold the notifications journal into its snapshot (shutdown)."""
+    _state.compact()
+
+
+def create_notification(employee_id: str, manager_id: str, task_id: int, message: str) -> NotificationRecord:
     """Create a notification for an employee"""
-    # Accessing the module directly to update the global counter
-    db.notification_counter += 1
-    
-    employee = get_employee_by_id(employee_id)
-    manager = get_manager_by_id(manager_id)
-    
-    notification = {
-        "notificationId": db.notification_counter,
-        "employeeId": employee_id,
-        "employeeName": employee["employeeName"] if employee else "Unknown",
-        "managerId": manager_id,
-        "managerName": manager["managerName"] if manager else "Unknown",
-        "taskId": task_id,
-        "message": message,
-        "isRead": False,
-        "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
-    
-    db.notifications_db.append(notification)
-    return notification
-
-def get_employee_notifications(employee_id: str, unread_only: bool = False) -> List[Dict]:
-    """Get notifications for an employee"""
-    notifications = [n for n in db.notifications_db if n["employeeId"] == employee_id]
-    
+    return create_notifications([{
+        "employee_id": employee_id,
+        "manager_id": manager_id,
+        "task_id": task_id,
+        "message": message
+    }])[0]
+
+def create_notifications(items: List[Dict]) -> List[NotificationRecord]:
+    """
+    Create several notifications (`create_notification` arguments per
+    item) in one commit, with ids in item order.
+    """
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    names = []
+    for item in items:
+        employee = get_employee_by_id(item["employee_id"])
+        manager = get_manager_by_id(item["manager_id"])
+        names.append((
+            employee["employeeName"] if employee else "Unknown",
+            manager["managerName"] if manager else "Unknown"
+        ))
+
+    with _state.writing():
+        created = []
+        for offset, (item, (employee_name, manager_name)) in enumerate(zip(items, names), start=1):
+            created.append(NotificationRecord(
+                notification_id=db.notification_counter + offset,
+                employee_id=item["employee_id"],
+                employee_name=employee_name,
+                manager_id=item["manager_id"],
+                manager_name=manager_name,
+                task_id=item["task_id"],
+                message=item["message"],
+                is_read=False,
+                created_at=now
+            ))
+
+        _state.commit([{"op": "put", "notification": n.to_dict()} for n in created])
+        # Still under the write lock, so streams receive ids in order
+        for notification in created:
+            notification_stream.publish(notification)
+        return created
+
+def get_employee_notifications(employee_id: str, unread_only: bool = False) -> List[NotificationRecord]:
+    """Get notifications for an employee, newest first (from their inbox)"""
+    _state.refresh()
     if unread_only:
-        notifications = [n for n in notifications if not n["isRead"]]
-    
-    notifications.sort(key=lambda x: x["createdAt"], reverse=True)
-    return notifications
+        unread = list(_state.inbox_unread.get(employee_id, {}).values())
+        return sorted(unread, key=_notification_id, reverse=True)
+    return list(reversed(_state.inboxes.get(employee_id, {}).values()))
+
+def count_employee_notifications(employee_id: str) -> Dict[str, int]:
+    """Total / unread / read counts of one inbox (maintained, no scan)."""
+    _state.refresh()
+    total = len(_state.inboxes.get(employee_id, []))
+    unread = len(_state.inbox_unread.get(employee_id, {}))
+    return {"total": total, "unread": unread, "read": total - unread}
+
+def get_employee_notifications_after(employee_id: str, after_id: int) -> List[NotificationRecord]:
+    """
+    The employee's notifications with an id above `after_id`, oldest
+    first (resume point of a notification stream).
+    """
+    _state.refresh()
+    inbox = list(_state.inboxes.get(employee_id, {}).values())
+    return inbox[bisect_right(inbox, after_id, key=_notification_id):]
+
+def get_last_notification_id() -> int:
+    _state.refresh()
+    return db.notification_counter
+
+def get_notification_by_id(notification_id: int) -> Optional[NotificationRecord]:
+    _state.refresh()
+    return db.notifications_db.get(notification_id)
 
 def mark_notification_read(notification_id: int) -> bool:
-    for notification in db.notifications_db:
-        if notification["notificationId"] == notification_id:
-            notification["isRead"] = True
-            return True
-    return False
+    with _state.writing():
+        notification = db.notifications_db.get(notification_id)
+        if notification is None:
+            return False
+        if not notification.is_read:
+            _state.commit([{"op": "put", "notification": {**notification.to_dict(), "isRead": True}}])
+        return True
+
+def mark_all_notifications_read(employee_id: str) -> int:
+    """
+    Mark every unread notification of the employee as read, in one
+    commit; only that employee's unread set is visited. Returns how many
+    were marked.
+    """
+    with _state.writing():
+        unread = list(_state.inbox_unread.get(employee_id, {}).values())
+        if unread:
+            _state.commit([
+                {"op": "put", "notification": {**notification.to_dict(), "isRead": True}}
+                for notification in unread
+            ])
+        return len(unread)
+
+def get_archived_notifications(
+    employee_id: str,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[NotificationRecord], Optional[str], int]:
+    """
+    One page of the employee's archived notifications, the next page's
+    cursor and the archived total. Raises ValueError for a bad cursor.
+    """
+    page, next_cursor = notification_archive.page_archived(employee_id, limit, cursor)
+    return page, next_cursor, notification_archive.count_archived(employee_id)
+
+def get_employee_version(employee_id: str) -> int:
+    """
+    Data version of one employee's notifications: grows whenever one
+    of them is created, changed or deleted.
+    """
+    _state.refresh()
+    return _state.employee_revs.get(employee_id, _state.base_rev)
+
+def count_notifications() -> Dict[str, int]:
+    """Total / unread / read notification counts (maintained, no scan)."""
+    _state.refresh()
+    total = len(db.notifications_db)
+    return {"total": total, "unread": _state.unread, "read": total - _state.unread}
 
-def get_all_notifications() -> List[Dict]:
-    return list(reversed(db.notifications_db))
+def get_all_notifications() -> List[NotificationRecord]:
+    _state.refresh()
+    return list(reversed(db.notifications_db.values()))
 
 def delete_notification(notification_id: int) -> bool:
-    for i, notification in enumerate(db.notifications_db):
-        if notification["notificationId"] == notification_id:
-            db.notifications_db.pop(i)
-            return True
-    return False
\ No newline at end of file
+    with _state.writing():
+        if notification_id not in db.notifications_db:
+            return False
+        _state.commit([{"op": "del", "notificationId": notification_id}])
+        return True
@@ -1,24 +1,53 @@
 from typing import List, Dict
-from app.services.task_storage import get_all_tasks
+from app import config
+from app.records import TaskRecord
+from app.services.result_cache import VersionedLRUCache
+from app.services.task_storage import get_version, query_tasks
 
+# Results are cached per (function, scope) and tagged with the task
+# store's version of that scope (manager / employee / project), so a
+# task write only invalidates the entries it can affect.
+# Cached lists are shared: callers must not modify them.
+_cache = VersionedLRUCache(config.RESULT_CACHE_SIZE)
 
-def get_tasks_by_project(project_name: str) -> List[Dict]:
-    tasks = get_all_tasks()
-    return [
-        t for t in tasks
-        if t.get("metadata", {}).get("projectName") == project_name
-    ]
+
+def get_tasks_by_project(project_name: str) -> List[TaskRecord]:
+    return _cache.get_or_compute(
+        ("project", project_name),
+        get_version(project_name=project_name),
+        lambda: query_tasks(project_name=project_name)
+    )
+
+
+def get_employee_tasks_in_project(employee_id: str, project_name: str) -> List[TaskRecord]:
+    return _cache.get_or_compute(
+        ("employeeProject", employee_id, project_name),
+        get_version(employee_id=employee_id),
+        lambda: query_tasks(employee_id=employee_id, project_name=project_name)
+    )
 
 
 def get_projects_summary_for_manager(manager_id: str) -> List[Dict]:
-    tasks = get_all_tasks()
+    return _cache.get_or_compute(
+        ("managerSummary", manager_id),
+        get_version(manager_id=manager_id),
+        lambda: _projects_summary(query_tasks(manager_id=manager_id))
+    )
+
+
+def get_employee_projects(employee_id: str) -> List[Dict]:
+    return _cache.get_or_compute(
+        ("employeeProjects", employee_id),
+        get_version(employee_id=employee_id),
+        lambda: _employee_projects(query_tasks(employee_id=employee_id))
+    )
+
+
+def _projects_summary(tasks: List[TaskRecord]) -> List[Dict]:
     projects = {}
 
     for task in tasks:
-        if task["managerId"] != manager_id:
-            continue
-
-        project = task.get("metadata", {}).get("projectName")
+        project = task.project_name
         if not project:
             continue
 
@@ -29,29 +58,26 @@ def get_projects_summary_for_manager(manager_id: str) -> List[Dict]:
         })
 
         projects[project]["totalTasks"] += 1
-        if task["status"] in ["Assigned", "In Progress"]:
+        if task.status in ["Assigned", "In Progress"]:
             projects[project]["assignedTasks"] += 1
 
     return list(projects.values())
 
 
-def get_employee_projects(employee_id: str) -> List[Dict]:
-    tasks = get_all_tasks()
+def _employee_projects(tasks: List[TaskRecord]) -> List[Dict]:
     projects = {}
 
     for task in tasks:
-        for emp in task.get("assignedEmployees", []):
-            if emp["employeeId"] == employee_id:
-                project = task.get("metadata", {}).get("projectName")
-                if not project:
-                    continue
-
-                projects.setdefault(project, {
-                    "projectName": project,
-                    "activeTasks": 0
-                })
-
-                if task["status"] in ["Assigned", "In Progress"]:
-                    projects[project]["activeTasks"] += 1
+        project = task.project_name
+        if not project:
+            continue
+
+        projects.setdefault(project, {
+            "projectName": project,
+            "activeTasks": 0
+        })
+
+        if task.status in ["Assigned", "In Progress"]:
+            projects[project]["activeTasks"] += 1
 
     return list(projects.values())
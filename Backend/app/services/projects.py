@@ -1,15 +1,15 @@
 from typing import List, Dict, Optional
 from datetime import datetime
 
-from app.services.project_storage import get_all_projects, create_project
+from app.services.project_storage import (
+    create_project,
+    get_projects_for_manager as load_projects_for_manager
+)
 from app.services.managers import get_manager_by_id
 
 
 def get_projects_for_manager(manager_id: str) -> List[Dict]:
-    return [
-        p for p in get_all_projects()
-        if p["managerId"] == manager_id
-    ]
+    return load_projects_for_manager(manager_id)
 
 
 def create_manager_project(
@@ -22,15 +22,6 @@ def create_manager_project(
     if not manager:
         return None
 
-    # 🔒 Unique project name per manager
-    existing = [
-        p for p in get_all_projects()
-        if p["managerId"] == manager_id
-        and p["projectName"].lower() == project_name.lower()
-    ]
-    if existing:
-        raise ValueError("Project with same name already exists")
-
     project = {
         "projectName": project_name,
         "description": description,
@@ -40,4 +31,5 @@ def create_manager_project(
         "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
 
+    # 🔒 Unique project name per manager (checked by the store)
     return create_project(project)
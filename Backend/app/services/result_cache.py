@@ -0,0 +1,42 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class VersionedLRUCache:
+    """
+    Bounded LRU cache whose entries are tagged with a data version
+    (see task_storage.get_version). A lookup with a different version
+    recomputes the entry, so writes invalidate exactly the keys whose
+    scope they touched -- also when the write happened in another
+    worker process, since versions live in the store.
+
+    Cached values are shared between callers: treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, version: int, compute: Callable[[], Any]) -> Any:
+        # `version` must be read before `compute` runs: a write racing
+        # with it then leaves a stale version behind, never a stale value
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
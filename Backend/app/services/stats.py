@@ -0,0 +1,29 @@
+from typing import Dict
+
+from app.enums import TaskStatus
+from app.services.employees import count_employees
+from app.services.managers import get_all_managers
+from app.services.notifications import count_notifications
+from app.services.task_storage import count_by_status
+
+
+def get_stats() -> Dict:
+    """
+    System-wide counts for health / monitoring.
+
+    Every figure comes from counters the stores maintain on write
+    (task status counters, unread notification counter, list lengths),
+    so the cost does not grow with the data.
+    """
+    task_counts = count_by_status()
+    by_status = {status.value: task_counts.get(status.value, 0) for status in TaskStatus}
+
+    return {
+        "employees": count_employees(),
+        "managers": len(get_all_managers()),
+        "tasks": {
+            "total": sum(task_counts.values()),
+            "byStatus": by_status
+        },
+        "notifications": count_notifications()
+    }
@@ -1,91 +1,144 @@
-import json
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-TASK_FILE = Path("app/storage/tasks.json")
+from app.records import TaskRecord
+from app.services.backends import create_task_store
+from app.services.backends.base import TaskConflictError  # noqa: F401 (re-export)
+
+# JSON journal (default) or SQLite, see app/config.py
+_store = create_task_store()
 
 
 # ==============================
-# INTERNAL HELPERS
+# PUBLIC STORAGE API
 # ==============================
 
-def _load_data() -> Dict:
+def get_all_tasks() -> List[TaskRecord]:
+    """
+    All tasks in creation order.
+    The records may be cached: treat them as read-only.
+    """
+    return _store.get_all_tasks()
+
+
+def get_task_by_id(task_id: int) -> Optional[TaskRecord]:
     """
-    Load task storage from JSON.
-    If file does not exist, initialize structure.
+    Returns a copy, so callers can modify it and pass it to `update_task`.
     """
-    if not TASK_FILE.exists():
-        return {
-            "lastTaskId": 0,
-            "tasks": []
-        }
+    return _store.get_task_by_id(task_id)
 
-    with open(TASK_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
 
+def query_tasks(
+    manager_id: Optional[str] = None,
+    status: Union[str, Iterable[str], None] = None,
+    project_name: Optional[str] = None,
+    employee_id: Union[str, Iterable[str], None] = None
+) -> List[TaskRecord]:
+    """
+    Tasks matching every given filter, in creation order.
 
-def _save_data(data: Dict):
+    Served from indexes: cost is proportional to the matching tasks,
+    not to the number of stored tasks. `status` and `employee_id` may
+    be a single value or several (any of them matches).
+    The records may be cached: treat them as read-only.
     """
-    Persist task storage to JSON.
+    return _store.query_tasks(
+        manager_id=manager_id,
+        status=status,
+        project_name=project_name,
+        employee_id=employee_id
+    )
+
+
+def page_tasks(
+    limit: Optional[int] = None,
+    after: Optional[Tuple[str, int]] = None,
+    manager_id: Optional[str] = None,
+    status: Union[str, Iterable[str], None] = None
+) -> List[TaskRecord]:
     """
-    TASK_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(TASK_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    Tasks newest first, ordered by `TaskRecord.sort_key` (createdAt,
+    then taskId), starting strictly after the `after` key.
 
+    Served from ordered indexes: a page costs the same whatever the
+    number of stored tasks. `limit=None` returns all remaining tasks.
+    The records may be cached: treat them as read-only.
+    """
+    return _store.page_tasks(
+        limit=limit,
+        after=after,
+        manager_id=manager_id,
+        status=status
+    )
 
-# ==============================
-# PUBLIC STORAGE API
-# ==============================
 
-def get_all_tasks() -> List[Dict]:
-    data = _load_data()
-    return data["tasks"]
+def count_by_status(manager_id: Optional[str] = None) -> Dict[str, int]:
+    """
+    Number of tasks per status (of one manager, or of all tasks), from
+    counters maintained on every create / update (no scan). Statuses
+    without tasks are omitted.
+    """
+    return _store.count_by_status(manager_id)
 
 
-def get_task_by_id(task_id: int) -> Optional[Dict]:
-    data = _load_data()
-    for task in data["tasks"]:
-        if task["taskId"] == task_id:
-            return task
-    return None
+def get_version(
+    manager_id: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    project_name: Optional[str] = None
+) -> int:
+    """
+    Data version of the tasks of one manager, employee or project (at
+    most one), or of all tasks. It only grows, and changes whenever one
+    of those tasks is written, so it can back HTTP ETags and caches.
+    """
+    return _store.get_version(
+        manager_id=manager_id,
+        employee_id=employee_id,
+        project_name=project_name
+    )
 
 
 def get_next_task_id() -> int:
     """
     Atomically increments and returns next task ID.
     """
-    data = _load_data()
-    data["lastTaskId"] += 1
-    _save_data(data)
-    return data["lastTaskId"]
+    return _store.get_next_task_id()
 
 
-def create_task(task: Dict) -> Dict:
+def create_task(task: TaskRecord) -> TaskRecord:
     """
     Persist a new task.
     Task ID is assigned here (single source of truth).
     """
-    data = _load_data()
+    return _store.create_task(task)
 
-    task["taskId"] = get_next_task_id()
-    data = _load_data()  # reload after increment
 
-    data["tasks"].append(task)
-    _save_data(data)
-
-    return task
+def create_tasks(tasks: List[TaskRecord]) -> List[TaskRecord]:
+    """
+    Persist several new tasks in a single commit.
+    """
+    return _store.create_tasks(tasks)
 
 
-def update_task(updated_task: Dict) -> Dict:
+def update_task(updated_task: TaskRecord) -> TaskRecord:
     """
     Update existing task.
+    Raises TaskConflictError if its `version` is stale (someone else
+    updated the task after it was read); the new version is set on
+    `updated_task`.
     """
-    data = _load_data()
+    return _store.update_task(updated_task)
 
-    for idx, task in enumerate(data["tasks"]):
-        if task["taskId"] == updated_task["taskId"]:
-            data["tasks"][idx] = updated_task
-            _save_data(data)
-            return updated_task
 
-    raise ValueError(f"Task with ID {updated_task['taskId']} not found")
+def update_tasks(updated_tasks: List[TaskRecord]) -> List[TaskRecord]:
+    """
+    Update several existing tasks in a single commit.
+    Raises ValueError (nothing written) if any task is unknown.
+    """
+    return _store.update_tasks(updated_tasks)
+
+
+def compact():
+    """
+    Fold any pending journal into the main store now.
+    """
+    _store.compact()
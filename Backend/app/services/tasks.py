@@ -1,25 +1,94 @@
-from typing import List, Dict, Optional
+import base64
+import binascii
+import json
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 from app.enums import TaskStatus
+from app.records import Assignee, TaskRecord
 from app.services.managers import get_manager_by_id
 from app.services.employees import (
+    ACTIVE_STATUSES,
+    count_employees,
     get_employees_ranked,
     get_employee_by_id,
-    update_employee_on_assignment
+    update_employees_on_assignment
 )
-from app.services.notifications import create_notification
-from app.services.history import add_task_to_employee_history
+from app.services import dispatcher
 
 # ✅ JSON-based task storage (DB replacement)
 from app.services.task_storage import (
     create_task as save_task,
-    get_all_tasks,
+    create_tasks as save_tasks,
+    count_by_status,
     get_task_by_id as load_task_by_id,
+    page_tasks,
+    query_tasks,
     update_task
 )
 
 
+def _new_task(
+    manager: Dict,
+    title: str,
+    description: str,
+    priority: str = "Medium",
+    deadline: str = None,
+    metadata: Dict = None
+) -> TaskRecord:
+    return TaskRecord(
+        title=title,
+        description=description,
+        priority=priority,
+        deadline=deadline,
+        metadata=metadata or None,
+        status=TaskStatus.PENDING.value,
+        manager_id=manager["managerId"],
+        manager_name=manager["managerName"],
+        created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    )
+
+
+def _assignees(employees: List[Dict]) -> Tuple[Assignee, ...]:
+    return tuple(
+        Assignee(emp["employeeId"], emp["employeeName"]) for emp in employees
+    )
+
+
+def _apply_assignments(manager: Dict, assignments: List[Tuple[TaskRecord, Dict]], assigned_at: str):
+    """
+    Side effects of assigning tasks to employees, per (task, employee).
+    Workloads are updated at once, in one commit (rankings depend on
+    them); notifications and history entries go through the dispatcher.
+    """
+    update_employees_on_assignment([
+        (employee["employeeId"], task.title) for task, employee in assignments
+    ])
+
+    for task, employee in assignments:
+        emp_id = employee["employeeId"]
+
+        # Notification
+        dispatcher.submit(emp_id, "notification", {
+            "employee_id": emp_id,
+            "manager_id": manager["managerId"],
+            "task_id": task.task_id,
+            "message": f"{manager['managerName']} selected you to do '{task.title}' task."
+        })
+
+        # History
+        dispatcher.submit(emp_id, "history", {
+            "op": "add",
+            "employee_id": emp_id,
+            "task_id": task.task_id,
+            "task_title": task.title,
+            "manager_id": manager["managerId"],
+            "manager_name": manager["managerName"],
+            "assigned_at": assigned_at,
+            "status": TaskStatus.ASSIGNED.value
+        })
+
+
 # =====================================================
 # CREATE TASK
 # =====================================================
@@ -31,34 +100,94 @@ def create_task(
     priority: str = "Medium",
     deadline: str = None,
     metadata: Dict = None
-) -> Optional[Dict]:
+) -> Optional[TaskRecord]:
 
     manager = get_manager_by_id(manager_id)
     if not manager:
         return None
 
-    task = {
-        "title": title,
-        "description": description,
-        "priority": priority,
-        "deadline": deadline,
-        "metadata": metadata or {},
-        "status": TaskStatus.PENDING.value,
-        "managerId": manager_id,
-        "managerName": manager["managerName"],
-        "assignedEmployees": [],
-        "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "assignedAt": None
-    }
+    task = _new_task(manager, title, description, priority, deadline, metadata)
 
     return save_task(task)
 
 
+# =====================================================
+# BULK CREATE + ASSIGN
+# =====================================================
+
+def create_and_assign_tasks(manager_id: str, items: List[Dict]) -> Optional[List[TaskRecord]]:
+    """
+    Create N tasks already assigned to their employees.
+
+    Each item: title, description, priority, deadline, metadata,
+    employeeIds. All tasks are persisted in a single storage commit and
+    all workloads in another; notifications / history entries are
+    queued. Unknown employee IDs are skipped, as in
+    `assign_task_to_employees`; a task left without any stays Pending.
+    """
+    manager = get_manager_by_id(manager_id)
+    if not manager:
+        return None
+
+    assigned_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    tasks = []
+    task_employees = []
+
+    for item in items:
+        task = _new_task(
+            manager,
+            title=item["title"],
+            description=item["description"],
+            priority=item.get("priority", "Medium"),
+            deadline=item.get("deadline"),
+            metadata=item.get("metadata")
+        )
+
+        employees = [
+            emp for emp in map(get_employee_by_id, item.get("employeeIds", []))
+            if emp
+        ]
+
+        # No known assignee: the task stays Pending in the queue
+        if employees:
+            task.status = TaskStatus.ASSIGNED.value
+            task.assigned_employees = _assignees(employees)
+            task.assigned_at = assigned_at
+
+        tasks.append(task)
+        task_employees.append(employees)
+
+    save_tasks(tasks)
+
+    _apply_assignments(manager, [
+        (task, employee)
+        for task, employees in zip(tasks, task_employees)
+        for employee in employees
+    ], assigned_at)
+
+    return tasks
+
+
+def record_task_status(employee_id: str, task_id: int, new_status: str, completed_at: str = None):
+    """
+    Update the status of the task in the employee's history. Goes
+    through the dispatcher like the assignment entry, so it is applied
+    after that entry even while the entry is still queued.
+    """
+    dispatcher.submit(employee_id, "history", {
+        "op": "status",
+        "employee_id": employee_id,
+        "task_id": task_id,
+        "new_status": new_status,
+        "completed_at": completed_at
+    })
+
+
 # =====================================================
 # GET TASK BY ID
 # =====================================================
 
-def get_task_by_id(task_id: int) -> Optional[Dict]:
+def get_task_by_id(task_id: int) -> Optional[TaskRecord]:
     return load_task_by_id(task_id)
 
 
@@ -66,31 +195,119 @@ def get_task_by_id(task_id: int) -> Optional[Dict]:
 # GET MANAGER TASK QUEUE
 # =====================================================
 
-def get_manager_task_queue(manager_id: str, status_filter: str = None) -> List[Dict]:
-    tasks = [t for t in get_all_tasks() if t["managerId"] == manager_id]
+def get_manager_task_queue(manager_id: str, status_filter: str = None) -> List[TaskRecord]:
+    return page_tasks(manager_id=manager_id, status=status_filter or None)
 
-    if status_filter:
-        tasks = [t for t in tasks if t["status"] == status_filter]
 
-    tasks.sort(key=lambda x: x["createdAt"], reverse=True)
-    return tasks
+def get_manager_status_counts(manager_id: str) -> Dict[str, int]:
+    """
+    Task count per status (every TaskStatus, zero included) for the
+    manager's queue.
+    """
+    counts = count_by_status(manager_id)
+    return {status.value: counts.get(status.value, 0) for status in TaskStatus}
+
+
+# =====================================================
+# ACTIVE TASKS GROUPED BY EMPLOYEE
+# =====================================================
+
+def get_active_tasks_by_employee(
+    employee_ids: Optional[List[str]] = None,
+    manager_id: Optional[str] = None
+) -> Dict[str, List[TaskRecord]]:
+    """
+    Active (Assigned / In Progress) tasks per assignee, in creation
+    order, from one indexed query instead of one per employee.
+
+    With `employee_ids`, every listed employee gets an entry (possibly
+    empty); with only `manager_id`, every employee holding one of the
+    manager's active tasks does. Both filters can be combined.
+    """
+    tasks = query_tasks(
+        manager_id=manager_id,
+        status=ACTIVE_STATUSES,
+        employee_id=employee_ids
+    )
+
+    groups: Dict[str, List[TaskRecord]] = {
+        employee_id: [] for employee_id in employee_ids or []
+    }
+    for task in tasks:
+        for employee_id in task.employee_ids:
+            if employee_ids is None:
+                groups.setdefault(employee_id, []).append(task)
+            elif employee_id in groups:
+                groups[employee_id].append(task)
+    return groups
+
+
+# =====================================================
+# PAGINATION
+# =====================================================
+
+def encode_cursor(task: TaskRecord) -> str:
+    """
+    Opaque cursor pointing just after `task` in newest-first order.
+    """
+    raw = json.dumps(task.sort_key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Raises ValueError for a malformed cursor.
+    """
+    try:
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(created_at, str) or not isinstance(task_id, int):
+        raise ValueError("Invalid cursor")
+    return created_at, task_id
+
+
+def get_task_page(
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    manager_id: Optional[str] = None,
+    status_filter: Optional[str] = None
+) -> Tuple[List[TaskRecord], Optional[str]]:
+    """
+    One page of tasks, newest first (createdAt, then taskId), and the
+    cursor of the next page (None on the last one).
+    `after` is a cursor from a previous page. Raises ValueError if it
+    is malformed.
+    """
+    tasks = page_tasks(
+        limit=None if limit is None else limit + 1,
+        after=decode_cursor(after) if after else None,
+        manager_id=manager_id,
+        status=status_filter or None
+    )
+
+    if limit is None or len(tasks) <= limit:
+        return tasks, None
+
+    tasks = tasks[:limit]
+    return tasks, encode_cursor(tasks[-1])
 
 
 # =====================================================
 # TASK DETAILS + AVAILABLE EMPLOYEES
 # =====================================================
 
-def get_task_details_with_employees(task_id: int) -> Optional[Dict]:
+def get_task_details_with_employees(task_id: int, ranking_limit: Optional[int] = None) -> Optional[Dict]:
     task = get_task_by_id(task_id)
     if not task:
         return None
 
-    ranked_employees = get_employees_ranked()
+    ranked_employees = get_employees_ranked(ranking_limit)
 
     return {
         "task": task,
         "availableEmployees": ranked_employees,
-        "totalEmployees": len(ranked_employees)
+        "totalEmployees": count_employees()
     }
 
 
@@ -108,56 +325,29 @@ def assign_task_to_employees(
     if not task:
         return None
 
-    if task["managerId"] != manager_id:
+    if task.manager_id != manager_id:
         return None
 
-    if task["status"] != TaskStatus.PENDING.value:
+    if task.status != TaskStatus.PENDING.value:
         return None
 
     manager = get_manager_by_id(manager_id)
-    assigned_employees = []
     assigned_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    for emp_id in employee_ids:
-        employee = get_employee_by_id(emp_id)
-        if not employee:
-            continue
-
-        # Update employee workload
-        update_employee_on_assignment(emp_id, task["title"])
-
-        # Notification
-        create_notification(
-            employee_id=emp_id,
-            manager_id=manager_id,
-            task_id=task_id,
-            message=f"{manager['managerName']} selected you to do '{task['title']}' task."
-        )
-
-        # History
-        add_task_to_employee_history(
-            employee_id=emp_id,
-            task_id=task_id,
-            task_title=task["title"],
-            manager_id=manager_id,
-            manager_name=manager["managerName"],
-            assigned_at=assigned_at,
-            status=TaskStatus.ASSIGNED.value
-        )
+    employees = [emp for emp in map(get_employee_by_id, employee_ids) if emp]
 
-        assigned_employees.append({
-            "employeeId": emp_id,
-            "employeeName": employee["employeeName"]
-        })
-
-    task["status"] = TaskStatus.ASSIGNED.value
-    task["assignedEmployees"] = assigned_employees
-    task["assignedAt"] = assigned_at
+    task.status = TaskStatus.ASSIGNED.value
+    task.assigned_employees = _assignees(employees)
+    task.assigned_at = assigned_at
 
+    # Persist first: a concurrent assignment raises TaskConflictError
+    # before any workload / notification / history side effect
     update_task(task)
 
+    _apply_assignments(manager, [(task, employee) for employee in employees], assigned_at)
+
     return {
         "task": task,
-        "assignedTo": assigned_employees,
-        "notificationsSent": len(assigned_employees)
+        "assignedTo": list(task.assigned_employees),
+        "notificationsSent": len(task.assigned_employees)
     }
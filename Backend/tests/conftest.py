@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Point the app at a scratch copy of the seed storage before anything
+# under `app` is imported (config is read at import time)
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+STORAGE_DIR = Path(tempfile.mkdtemp(prefix="pms-tests-"))
+for name in ("tasks.json", "projects.json"):
+    shutil.copy(BACKEND_DIR / "app" / "storage" / name, STORAGE_DIR / name)
+
+os.environ["PMS_STORAGE_BACKEND"] = "json"
+os.environ["PMS_STORAGE_DIR"] = str(STORAGE_DIR)
+os.environ["PMS_SQLITE_FILE"] = str(STORAGE_DIR / "pms.sqlite3")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.enums import TaskStatus  # noqa: E402
+from app.main import app  # noqa: E402
+from app.records import TaskRecord  # noqa: E402
+
+
+def make_task(title: str = "task", manager_id: str = "MGR001", **fields) -> TaskRecord:
+    """A new (unsaved) pending task."""
+    return TaskRecord(
+        title=title,
+        description="d",
+        priority="Medium",
+        status=TaskStatus.PENDING.value,
+        manager_id=manager_id,
+        manager_name="Manager",
+        created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        **fields
+    )
+
+
+@pytest.fixture
+def client():
+    """Test client with the app lifespan (restore, dispatcher, shutdown)."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def create_task(client):
+    """Create a task through the API and return its id."""
+    def create(title: str = "task", manager_id: str = "MGR001", **body) -> int:
+        response = client.post("/api/tasks/create", json={
+            "managerId": manager_id, "title": title, "description": "d", **body
+        })
+        assert response.status_code == 200, response.text
+        return response.json()["task"]["taskId"]
+    return create
@@ -0,0 +1,44 @@
+from app.services.task_storage import query_tasks
+
+EMPLOYEES = ["EMP001", "EMP002", "EMP003", "EMP004"]
+
+
+def _assign(client, task_id, employee_ids, manager_id="MGR001"):
+    response = client.post(
+        f"/api/tasks/{task_id}/assign",
+        json={"managerId": manager_id, "employeeIds": employee_ids}
+    )
+    assert response.status_code == 200, response.text
+
+
+def test_batch_equals_one_call_per_employee(client, create_task):
+    _assign(client, create_task("batch-1"), ["EMP001", "EMP002"])
+    _assign(client, create_task("batch-2", manager_id="MGR002"), ["EMP002", "EMP003"], "MGR002")
+    done = create_task("batch-3")
+    _assign(client, done, ["EMP001"])
+    assert client.patch(
+        f"/api/tasks/{done}/status", params={"new_status": "Completed"}
+    ).status_code == 200
+
+    batch = client.get(
+        "/api/tasks/employees/active", params={"ids": ",".join(EMPLOYEES + ["EMP001"])}
+    ).json()
+    assert list(batch["tasksByEmployee"]) == EMPLOYEES
+    for employee_id in EMPLOYEES:
+        single = client.get(f"/api/tasks/employee/{employee_id}").json()["tasks"]
+        assert batch["tasksByEmployee"][employee_id] == single, employee_id
+
+
+def test_manager_filter(client, create_task):
+    _assign(client, create_task("batch-mgr", manager_id="MGR002"), ["EMP004"], "MGR002")
+
+    groups = client.get(
+        "/api/tasks/employees/active", params={"managerId": "MGR002"}
+    ).json()["tasksByEmployee"]
+    assert "EMP004" in groups
+    managed = {task.task_id for task in query_tasks(manager_id="MGR002")}
+    for employee_id, tasks in groups.items():
+        single = client.get(f"/api/tasks/employee/{employee_id}").json()["tasks"]
+        assert tasks == [t for t in single if t["taskId"] in managed], employee_id
+
+    assert client.get("/api/tasks/employees/active").status_code == 400
@@ -0,0 +1,45 @@
+from collections import Counter
+
+from app.services import employees, task_storage, tasks
+
+
+def _count_commits(monkeypatch, state):
+    calls = []
+    commit = state.commit
+
+    def counted(records):
+        calls.append(len(records))
+        return commit(records)
+
+    monkeypatch.setattr(state, "commit", counted)
+    return calls
+
+
+def test_import_uses_one_task_commit_and_one_workload_commit(monkeypatch):
+    chosen = ["EMP001", "EMP002", "EMP001", "EMP003"] * 5
+    before = {e: employees.get_employee_by_id(e)["noOfActiveProjects"] for e in set(chosen)}
+    task_commits = _count_commits(monkeypatch, task_storage._store)
+    workload_commits = _count_commits(monkeypatch, employees._state)
+
+    created = tasks.create_and_assign_tasks("MGR001", [
+        {"title": f"bulk-{i}", "description": "d", "employeeIds": [emp]}
+        for i, emp in enumerate(chosen)
+    ])
+
+    assert len(created) == len(chosen)
+    # Every task in one commit (reserving an ID block may add its own)
+    assert task_commits[-1] == len(chosen) and len(task_commits) <= 2
+    # One record per employee, not per row
+    assert workload_commits == [3]
+    for emp, count in Counter(chosen).items():
+        assert employees.get_employee_by_id(emp)["noOfActiveProjects"] == before[emp] + count
+
+
+def test_task_without_a_known_assignee_stays_pending():
+    created = tasks.create_and_assign_tasks("MGR001", [
+        {"title": "nobody", "description": "d", "employeeIds": ["NOPE"]},
+        {"title": "somebody", "description": "d", "employeeIds": ["EMP004"]}
+    ])
+
+    assert [t.status for t in created] == ["Pending", "Assigned"]
+    assert created[0].assigned_employees == () and created[0].assigned_at is None
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+
+from app import config
+from app.main import app
+from app.services import dispatcher, history, notifications
+
+
+def _assign(client, task_id, employee_ids):
+    response = client.post(
+        f"/api/tasks/{task_id}/assign",
+        json={"managerId": "MGR001", "employeeIds": employee_ids}
+    )
+    assert response.status_code == 200, response.text
+
+
+def _history_status(employee_id, task_id):
+    entries = history.get_employee_task_history(employee_id).get("fullHistory", [])
+    return {entry.task_id: entry.status for entry in entries}.get(task_id)
+
+
+def test_status_change_waits_for_the_queued_history_entry(client, create_task, monkeypatch):
+    # Hold history writes back, so the "Assigned" entry is still queued
+    # when the employee updates the task
+    release = threading.Event()
+    apply_history_changes = dispatcher._HANDLERS["history"]
+
+    def held(changes):
+        release.wait(timeout=10)
+        return apply_history_changes(changes)
+
+    monkeypatch.setitem(dispatcher._HANDLERS, "history", held)
+
+    task_id = create_task("race")
+    _assign(client, task_id, ["EMP013"])
+    response = client.patch(
+        f"/api/tasks/{task_id}/employee-status",
+        json={"employeeId": "EMP013", "newStatus": "Completed"}
+    )
+    assert response.status_code == 200
+    assert _history_status("EMP013", task_id) is None
+
+    release.set()
+    client.portal.call(dispatcher.drain)
+    assert _history_status("EMP013", task_id) == "Completed"
+
+
+def test_effects_keep_their_order_per_employee(monkeypatch):
+    # A queue of 1 also makes every assignment wait for room
+    monkeypatch.setattr(config, "DISPATCH_QUEUE_SIZE", 1)
+    monkeypatch.setattr(config, "DISPATCH_BATCH_SIZE", 3)
+    employees = ["EMP007", "EMP008", "EMP009"]
+    before = {e: len(notifications.get_employee_notifications(e)) for e in employees}
+    assigned = {e: [] for e in employees}
+
+    with TestClient(app) as client:
+        for i in range(12):
+            response = client.post("/api/tasks/create", json={
+                "managerId": "MGR001", "title": f"order-{i}", "description": "d"
+            })
+            task_id = response.json()["task"]["taskId"]
+            chosen = [employees[i % 3], employees[(i + 1) % 3]]
+            _assign(client, task_id, chosen)
+            for employee_id in chosen:
+                assigned[employee_id].append(task_id)
+
+    # Leaving the client ran the shutdown: everything queued is applied
+    assert dispatcher._loop is None
+    for employee_id in employees:
+        new = notifications.get_employee_notifications(employee_id)[::-1][before[employee_id]:]
+        assert [n.task_id for n in new] == assigned[employee_id]
+        for task_id in assigned[employee_id]:
+            assert _history_status(employee_id, task_id) == "Assigned"
+
+
+def test_without_a_running_dispatcher_effects_apply_at_once():
+    before = len(notifications.get_employee_notifications("EMP014"))
+    dispatcher.submit("EMP014", "notification", {
+        "employee_id": "EMP014", "manager_id": "MGR001", "task_id": 0, "message": "now"
+    })
+    assert len(notifications.get_employee_notifications("EMP014")) == before + 1
+
+
+def test_a_stuck_batch_does_not_stall_the_loop(monkeypatch):
+    monkeypatch.setattr(config, "DISPATCH_QUEUE_SIZE", 1)
+    release = threading.Event()
+    applied = []
+
+    def stuck(payloads):
+        release.wait(timeout=10)
+        applied.extend(payloads)
+
+    monkeypatch.setitem(dispatcher._HANDLERS, "notification", stuck)
+
+    async def scenario():
+        dispatcher.start()
+        try:
+            # The first effect is picked up and hangs in its thread,
+            # the second fills the queue
+            dispatcher.submit("EMP015", "notification", {"n": 1})
+            await asyncio.sleep(0.05)
+            dispatcher.submit("EMP015", "notification", {"n": 2})
+
+            # The loop keeps running while the batch is stuck...
+            ticks = 0
+            for _ in range(20):
+                await asyncio.sleep(0.005)
+                ticks += 1
+            assert ticks == 20
+            # ...and only requests needing room wait
+            waiting = asyncio.create_task(dispatcher.wait_for_room())
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+
+            release.set()
+            await asyncio.wait_for(waiting, timeout=5)
+            await asyncio.wait_for(dispatcher.drain(), timeout=5)
+        finally:
+            release.set()
+            await dispatcher.stop()
+
+    asyncio.run(scenario())
+    assert applied == [{"n": 1}, {"n": 2}]
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+from app.services import employees
+
+from conftest import BACKEND_DIR
+
+OTHER_WORKER = """
+from app.services import employees
+employees.update_employee_on_assignment("EMP006", "from another worker")
+employees.compact()
+"""
+
+
+def test_ranking_orders_by_workload_and_honours_limit(client):
+    ranking = client.get("/api/employees/ranking").json()["data"]
+    loads = [emp["noOfActiveProjects"] for emp in ranking]
+    assert loads == sorted(loads)
+    assert [e["rank"] for e in ranking] == list(range(1, len(ranking) + 1))
+
+    top = client.get("/api/employees/ranking", params={"limit": 3}).json()["data"]
+    assert top == ranking[:3]
+
+
+def test_held_employee_sees_a_reload_from_another_worker(client):
+    held = employees.get_employee_by_id("EMP006")
+    load = held["noOfActiveProjects"]
+
+    # Compaction elsewhere replaces the snapshot: the next read reloads
+    subprocess.run([sys.executable, "-c", OTHER_WORKER], cwd=BACKEND_DIR, check=True)
+
+    assert employees.get_employee_by_id("EMP006") is held
+    assert held["noOfActiveProjects"] == load + 1
+    assert held["currentTaskDetails"] == "from another worker"
+    ranked = {e["employeeId"]: e for e in employees.get_employees_ranked()}
+    assert ranked["EMP006"]["noOfActiveProjects"] == load + 1
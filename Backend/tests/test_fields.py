@@ -0,0 +1,15 @@
+def test_fields_limit_the_keys_of_each_item(client, create_task):
+    create_task("fields")
+
+    tasks = client.get("/api/tasks/", params={"fields": "taskId,title"}).json()["tasks"]
+    assert tasks and all(set(task) == {"taskId", "title"} for task in tasks)
+
+    employees = client.get(
+        "/api/employees/", params={"fields": "employeeId,taskHistorySummary"}
+    ).json()["data"]
+    assert set(employees[0]) == {"employeeId", "taskHistorySummary"}
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get("/api/tasks/", params={"fields": "taskId,password"})
+    assert response.status_code == 400
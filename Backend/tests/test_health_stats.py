@@ -0,0 +1,63 @@
+from collections import Counter
+
+from app.services import dispatcher, employees, managers, notifications, task_storage
+
+
+def _scanned():
+    everything = notifications.get_all_notifications()
+    unread = sum(1 for n in everything if not n.is_read)
+    by_status = Counter(task.status for task in task_storage.get_all_tasks())
+    return {
+        "employees": len(employees.get_all_employees()),
+        "managers": len(managers.get_all_managers()),
+        "tasks": sum(by_status.values()),
+        "byStatus": by_status,
+        "notifications": {
+            "total": len(everything), "unread": unread, "read": len(everything) - unread
+        }
+    }
+
+
+def _check(client):
+    stats = client.get("/api/health/stats").json()["stats"]
+    expected = _scanned()
+    assert stats["employees"] == expected["employees"]
+    assert stats["managers"] == expected["managers"]
+    assert stats["tasks"]["total"] == expected["tasks"]
+    assert stats["tasks"]["byStatus"] == {
+        status: expected["byStatus"].get(status, 0) for status in stats["tasks"]["byStatus"]
+    }
+    assert stats["notifications"] == expected["notifications"]
+    return stats
+
+
+def test_stats_follow_writes(client, create_task):
+    before = _check(client)
+
+    task_id = create_task("stats")
+    response = client.post(
+        f"/api/tasks/{task_id}/assign",
+        json={"managerId": "MGR001", "employeeIds": ["EMP004", "EMP005"]}
+    )
+    assert response.status_code == 200
+    client.portal.call(dispatcher.drain)
+    after_assign = _check(client)
+    assert after_assign["tasks"]["total"] == before["tasks"]["total"] + 1
+    assert after_assign["notifications"]["unread"] == before["notifications"]["unread"] + 2
+
+    first = notifications.get_employee_notifications("EMP004")[0]
+    second = notifications.get_employee_notifications("EMP005")[0]
+    notifications.mark_notification_read(first.notification_id)
+    notifications.mark_notification_read(first.notification_id)  # no double count
+    notifications.delete_notification(second.notification_id)
+    stats = _check(client)
+    assert stats["notifications"]["unread"] == before["notifications"]["unread"]
+    assert stats["notifications"]["total"] == before["notifications"]["total"] + 1
+
+    health = client.get("/api/health").json()["stats"]
+    assert health["totalTasks"] == stats["tasks"]["total"]
+    assert health["unreadNotifications"] == stats["notifications"]["unread"]
+
+    # Read notifications left behind would be picked up by retention tests
+    notifications.delete_notification(first.notification_id)
+    assert _check(client)["notifications"] == before["notifications"]
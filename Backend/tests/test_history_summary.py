@@ -0,0 +1,61 @@
+from app.services import history
+
+EMPLOYEE_ID = "EMP012"
+
+
+def _add(task_id, status="Assigned"):
+    return {
+        "op": "add", "employee_id": EMPLOYEE_ID, "task_id": task_id,
+        "task_title": f"t{task_id}", "manager_id": "MGR001", "manager_name": "M",
+        "assigned_at": f"2026-01-01 10:00:{task_id % 60:02d}", "status": status
+    }
+
+
+def _status(task_id, new_status):
+    return {"op": "status", "employee_id": EMPLOYEE_ID, "task_id": task_id, "new_status": new_status}
+
+
+def _scanned():
+    full = history.get_employee_task_history(EMPLOYEE_ID)
+    return {
+        "totalTasks": full["totalTasks"],
+        "activeTasks": full["activeCount"],
+        "completedTasks": full["completedCount"]
+    }
+
+
+def test_summary_matches_the_history_after_changes():
+    base = 900_000
+    applied = history.apply_history_changes([
+        _add(base + 1), _add(base + 2), _add(base + 3, status="In Progress"),
+        _status(base + 1, "Completed"),
+        # Re-adding a known task replaces its entry, it is not counted twice
+        _add(base + 2, status="Pending"),
+        _status(base + 99, "Completed"),
+    ])
+    assert applied == [True] * 5 + [False]
+    assert history.get_employee_history_summary(EMPLOYEE_ID) == _scanned()
+
+    history.update_task_status_in_history(EMPLOYEE_ID, base + 3, "Completed", "2026-01-02 10:00:00")
+    summary = history.get_employee_history_summary(EMPLOYEE_ID)
+    assert summary == _scanned()
+
+    entries = {e.task_id: e for e in history.get_employee_task_history(EMPLOYEE_ID)["fullHistory"]}
+    assert [entries[base + i].status for i in (1, 2, 3)] == ["Completed", "Pending", "Completed"]
+    assert entries[base + 3].completed_at == "2026-01-02 10:00:00"
+
+    # The index and counters survive a reload from disk
+    history.restore()
+    assert history.get_employee_history_summary(EMPLOYEE_ID) == summary
+    assert history.apply_history_changes([_status(base + 2, "Assigned")]) == [True]
+    assert history.get_employee_history_summary(EMPLOYEE_ID) == _scanned()
+
+
+def test_employees_list_serves_the_summaries(client):
+    employees = client.get(
+        "/api/employees/", params={"fields": "employeeId,taskHistorySummary"}
+    ).json()["data"]
+    for employee in employees:
+        assert employee["taskHistorySummary"] == history.get_employee_history_summary(
+            employee["employeeId"]
+        )
@@ -0,0 +1,19 @@
+def test_unchanged_queue_gets_304_until_a_task_changes(client, create_task):
+    create_task("etag", manager_id="MGR002")
+    first = client.get("/api/tasks/queue/MGR002")
+    etag = first.headers["ETag"]
+
+    again = client.get("/api/tasks/queue/MGR002", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    # Another manager's change does not invalidate it
+    create_task("other", manager_id="MGR001")
+    assert client.get(
+        "/api/tasks/queue/MGR002", headers={"If-None-Match": etag}
+    ).status_code == 304
+
+    create_task("etag-2", manager_id="MGR002")
+    changed = client.get("/api/tasks/queue/MGR002", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
@@ -0,0 +1,119 @@
+import subprocess
+import sys
+
+import pytest
+
+from app.services.backends.base import TaskConflictError
+from app.services.backends.json_backend import JsonTaskStore
+from app.services.id_allocator import IdAllocator
+
+from conftest import BACKEND_DIR, make_task
+
+
+def test_new_store_replays_the_journal(tmp_path):
+    task_file = tmp_path / "tasks.json"
+    store = JsonTaskStore(task_file)
+    created = store.create_tasks([make_task(f"t{i}") for i in range(5)])
+
+    reopened = JsonTaskStore(task_file)
+    assert [t.to_dict() for t in reopened.get_all_tasks()] == [t.to_dict() for t in created]
+    assert not task_file.exists()
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(tmp_path):
+    task_file = tmp_path / "tasks.json"
+    store = JsonTaskStore(task_file)
+    created = store.create_tasks([make_task(f"t{i}") for i in range(5)])
+    task = store.get_task_by_id(created[0].task_id)
+    task.status = "Completed"
+    store.update_task(task)
+
+    store.compact()
+
+    assert task_file.with_suffix(".journal").read_text() == ""
+    reopened = JsonTaskStore(task_file)
+    assert len(reopened.get_all_tasks()) == 5
+    assert reopened.get_task_by_id(created[0].task_id).status == "Completed"
+    assert reopened.count_by_status() == {"Pending": 4, "Completed": 1}
+
+
+def test_stale_update_is_rejected(tmp_path):
+    store = JsonTaskStore(tmp_path / "tasks.json")
+    task_id = store.create_task(make_task()).task_id
+
+    first = store.get_task_by_id(task_id)
+    second = store.get_task_by_id(task_id)
+    first.status = "Assigned"
+    store.update_task(first)
+
+    second.status = "Completed"
+    with pytest.raises(TaskConflictError):
+        store.update_task(second)
+
+
+def test_id_allocator_reserves_blocks():
+    reserved = []
+
+    def reserve(count):
+        start = sum(reserved) + 1
+        reserved.append(count)
+        return start
+
+    allocator = IdAllocator(reserve, block_size=4)
+    ids = [allocator.next_id() for _ in range(6)] + allocator.next_ids(5)
+
+    # 7 and 8 are left over when 5 are asked for: a gap, never a reuse
+    assert ids == list(range(1, 7)) + list(range(9, 14))
+    assert reserved == [4, 4, 5]
+
+
+WRITER = """
+import sys
+from pathlib import Path
+sys.path.insert(0, "tests")
+from conftest import make_task
+from app.services.backends.json_backend import JsonTaskStore
+store = JsonTaskStore(Path(sys.argv[1]))
+for i in range(20):
+    store.create_task(make_task(f"{sys.argv[2]}-{i}"))
+"""
+
+
+def test_processes_sharing_the_store_never_reuse_ids(tmp_path):
+    task_file = tmp_path / "tasks.json"
+    writers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WRITER, str(task_file), f"w{n}"], cwd=BACKEND_DIR
+        )
+        for n in range(3)
+    ]
+    assert all(writer.wait(timeout=60) == 0 for writer in writers)
+
+    tasks = JsonTaskStore(task_file).get_all_tasks()
+    assert len(tasks) == 60
+    assert len({t.task_id for t in tasks}) == 60
+
+
+def test_tail_read_racing_a_compaction_reloads(tmp_path, monkeypatch):
+    task_file = tmp_path / "tasks.json"
+    reader = JsonTaskStore(task_file)
+    writer = JsonTaskStore(task_file)
+    writer.create_tasks([make_task(f"a{i}") for i in range(3)])
+    reader.get_all_tasks()
+
+    writer.create_tasks([make_task(f"b{i}") for i in range(3)])
+    read_records = reader._journal.read_records
+
+    def compacted_meanwhile(offset=0):
+        # Another process compacts, then appends a longer tail, between
+        # the reader's stat and its read
+        monkeypatch.setattr(reader._journal, "read_records", read_records)
+        writer.compact()
+        writer.create_tasks([make_task(f"c{i}-" + "x" * 200) for i in range(6)])
+        return read_records(offset)
+
+    monkeypatch.setattr(reader._journal, "read_records", compacted_meanwhile)
+
+    assert [t.to_dict() for t in reader.get_all_tasks()] == [
+        t.to_dict() for t in writer.get_all_tasks()
+    ]
@@ -0,0 +1,49 @@
+import app.database as db
+from app.services import notifications
+
+
+def _notify(count, employee_id="EMP006"):
+    return notifications.create_notifications([
+        {"employee_id": employee_id, "manager_id": "MGR001", "task_id": i, "message": f"m{i}"}
+        for i in range(count)
+    ])
+
+
+def test_get_mark_read_and_delete_by_id(client):
+    first, second = _notify(2)
+    url = f"/api/notifications/{first.notification_id}"
+
+    assert client.get(url).json()["notification"] == first.to_dict()
+    assert client.patch(f"{url}/read").status_code == 200
+    assert client.get(url).json()["notification"]["isRead"] is True
+
+    assert client.delete(url).status_code == 200
+    assert client.get(url).status_code == 404
+    assert client.delete(url).status_code == 404
+    assert client.patch(f"{url}/read").status_code == 404
+
+    # Deleted stays deleted once the journal is replayed from disk
+    notifications.restore()
+    assert notifications.get_notification_by_id(first.notification_id) is None
+    assert notifications.get_notification_by_id(second.notification_id) == second
+
+
+def test_reclaim_rebuilds_the_maps_after_bulk_deletes():
+    created = _notify(1100, employee_id="EMP007")
+    kept = _notify(1, employee_id="EMP007")[0]
+    for notification in created:
+        notifications.delete_notification(notification.notification_id)
+
+    before = db.notifications_db
+    snapshot = dict(before)
+    notifications.reclaim()
+
+    assert db.notifications_db is not before
+    assert db.notifications_db == snapshot
+    assert notifications.get_notification_by_id(kept.notification_id) == kept
+    assert notifications.get_employee_notifications("EMP007")[0] == kept
+
+    # Nothing left to give back: the maps are kept
+    rebuilt = db.notifications_db
+    notifications.reclaim()
+    assert db.notifications_db is rebuilt
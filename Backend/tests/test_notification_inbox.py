@@ -0,0 +1,71 @@
+import pytest
+
+from app.services import notifications
+
+EMPLOYEE_ID = "EMP011"
+
+
+@pytest.fixture(autouse=True)
+def empty_inboxes():
+    # Read notifications left behind would be picked up by retention tests
+    yield
+    for employee_id in (EMPLOYEE_ID, "EMP012"):
+        for notification in notifications.get_employee_notifications(employee_id):
+            notifications.delete_notification(notification.notification_id)
+
+
+def _notify(count, employee_id=EMPLOYEE_ID):
+    return notifications.create_notifications([
+        {"employee_id": employee_id, "manager_id": "MGR001", "task_id": i, "message": f"m{i}"}
+        for i in range(count)
+    ])
+
+
+def _scanned(employee_id):
+    mine = [n for n in notifications.get_all_notifications() if n.employee_id == employee_id]
+    unread = [n for n in mine if not n.is_read]
+    return mine, unread
+
+
+def _check(employee_id):
+    mine, unread = _scanned(employee_id)
+    ids = lambda items: [n.notification_id for n in items]  # noqa: E731
+    assert ids(notifications.get_employee_notifications(employee_id)) == ids(mine)
+    assert ids(notifications.get_employee_notifications(employee_id, unread_only=True)) == ids(unread)
+    assert notifications.count_employee_notifications(employee_id) == {
+        "total": len(mine), "unread": len(unread), "read": len(mine) - len(unread)
+    }
+
+
+def test_inbox_counts_follow_writes():
+    created = _notify(5)
+    _notify(2, employee_id="EMP012")
+    _check(EMPLOYEE_ID)
+
+    notifications.mark_notification_read(created[1].notification_id)
+    notifications.delete_notification(created[2].notification_id)
+    notifications.delete_notification(created[3].notification_id)  # unread one
+    _check(EMPLOYEE_ID)
+
+    # Rebuilt from disk, the inboxes are the same
+    notifications.restore()
+    _check(EMPLOYEE_ID)
+    _check("EMP012")
+
+
+def test_mark_all_read_touches_only_that_inbox(client):
+    _notify(3)
+    other = _notify(1, employee_id="EMP012")[0]
+    unread = notifications.count_employee_notifications(EMPLOYEE_ID)["unread"]
+    assert unread >= 3
+
+    body = client.patch(f"/api/notifications/employee/{EMPLOYEE_ID}/read-all").json()
+    assert body["markedCount"] == unread
+    assert client.patch(
+        f"/api/notifications/employee/{EMPLOYEE_ID}/read-all"
+    ).json()["markedCount"] == 0
+
+    stats = client.get(f"/api/notifications/employee/{EMPLOYEE_ID}").json()["stats"]
+    assert stats["unread"] == 0 and stats["read"] == stats["total"]
+    assert not notifications.get_notification_by_id(other.notification_id).is_read
+    _check(EMPLOYEE_ID)
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from app import config
+from app.services import notification_archive, notifications
+
+EMPLOYEE_ID = "EMP012"
+
+
+def _read_notifications(count, employee_id=EMPLOYEE_ID):
+    created = [
+        notifications.create_notification(employee_id, "MGR001", 0, f"n{i}")
+        for i in range(count)
+    ]
+    notifications.mark_all_notifications_read(employee_id)
+    return [n.notification_id for n in created]
+
+
+@pytest.fixture
+def small_inbox(client, monkeypatch):
+    # Only the per-inbox cap applies: keep the 2 newest read notifications
+    monkeypatch.setattr(config, "NOTIFICATION_MAX_PER_INBOX", 2)
+    monkeypatch.setattr(config, "NOTIFICATION_READ_MAX_AGE_DAYS", 0)
+    for notification in notifications.get_employee_notifications(EMPLOYEE_ID):
+        notifications.delete_notification(notification.notification_id)
+    return client
+
+
+def test_archive_cursor_survives_a_later_retention_pass(small_inbox):
+    first_ids = _read_notifications(6)
+    assert notifications.apply_retention() == 4
+    first_archived = first_ids[:4]
+
+    page, cursor, _ = notifications.get_archived_notifications(EMPLOYEE_ID, 2)
+    assert [n.notification_id for n in page] == first_archived[::-1][:2]
+
+    # A new pass puts a new segment in front of the one being paged
+    _read_notifications(3)
+    assert notifications.apply_retention() == 3
+
+    page, cursor, _ = notifications.get_archived_notifications(EMPLOYEE_ID, 2, cursor)
+    assert [n.notification_id for n in page] == first_archived[::-1][2:]
+    remaining = []
+    while cursor is not None:
+        page, cursor, _ = notifications.get_archived_notifications(EMPLOYEE_ID, 2, cursor)
+        remaining += [n.notification_id for n in page]
+    assert not set(remaining) & set(first_archived)
+
+
+def test_archive_endpoint_rejects_a_bad_cursor(small_inbox):
+    _read_notifications(3)
+    notifications.apply_retention()
+
+    for cursor in ("garbage", "999999:0", "1:-1"):
+        response = small_inbox.get(
+            f"/api/notifications/employee/{EMPLOYEE_ID}/archive", params={"cursor": cursor}
+        )
+        assert response.status_code == 400, cursor
+
+
+def test_archive_is_written_without_blocking_notification_writes(small_inbox, monkeypatch):
+    ids = _read_notifications(5)
+    write_segments = notification_archive.write_segments
+    during = {}
+
+    def write_while_others_write(by_employee):
+        # Another thread can still create notifications, and one of the
+        # picked notifications is deleted before the pass commits
+        writer = threading.Thread(
+            target=lambda: during.setdefault(
+                "created", notifications.create_notification(EMPLOYEE_ID, "MGR001", 0, "late")
+            )
+        )
+        writer.start()
+        writer.join(timeout=10)
+        during["blocked"] = writer.is_alive()
+        notifications.delete_notification(ids[0])
+        write_segments(by_employee)
+
+    monkeypatch.setattr(notification_archive, "write_segments", write_while_others_write)
+
+    assert notifications.apply_retention() == 2
+    assert during["blocked"] is False
+    assert notifications.get_notification_by_id(during["created"].notification_id)
+    assert notifications.get_notification_by_id(ids[0]) is None
+
+
+
+def test_passes_fill_the_newest_segment_before_starting_another(small_inbox, monkeypatch):
+    employee_id = "EMP010"
+    monkeypatch.setattr(notification_archive, "SEGMENT_MAX_ITEMS", 4)
+    for count in (3, 4, 5):
+        _read_notifications(count, employee_id)
+        notifications.apply_retention()
+
+    # 12 read, 2 kept: 10 archived into segments of 4, 4 and 2, all in
+    # the employee's own directory
+    index = notification_archive._read_index(employee_id)
+    assert [s["count"] for s in index["segments"]] == [4, 4, 2]
+    assert sorted(p.name for p in notification_archive._employee_dir(employee_id).iterdir()) == [
+        "index.json", "segment-000001.jsonl.gz",
+        "segment-000002.jsonl.gz", "segment-000003.jsonl.gz"
+    ]
+
+    ids, cursor = [], None
+    while True:
+        page, cursor, total = notifications.get_archived_notifications(employee_id, 3, cursor)
+        ids += [n.notification_id for n in page]
+        if cursor is None:
+            break
+    assert total == len(ids) == len(set(ids)) == 10
+    assert ids == sorted(ids, reverse=True)
@@ -0,0 +1,38 @@
+import asyncio
+
+from app.routers.notifications import _notification_events
+from app.services import notification_stream, notifications
+
+
+class _Request:
+    async def is_disconnected(self):
+        return False
+
+
+def _event_id(chunk: str) -> int:
+    return int(chunk.split("\n")[0][len("id: "):])
+
+
+def test_stream_resumes_after_the_last_event_id(client):
+    created = [
+        notifications.create_notification("EMP011", "MGR001", 0, f"n{i}")
+        for i in range(4)
+    ]
+
+    async def first_events(count):
+        events = _notification_events(_Request(), "EMP011", created[1].notification_id)
+        try:
+            assert (await events.__anext__()).startswith("retry:")
+            return [await events.__anext__() for _ in range(count)]
+        finally:
+            await events.aclose()
+
+    events = asyncio.run(first_events(2))
+
+    assert [_event_id(e) for e in events] == [n.notification_id for n in created[2:]]
+    assert all("event: notification" in e for e in events)
+    assert notification_stream.count_subscribers() == 0
+
+
+def test_stream_endpoint_rejects_unknown_employee(client):
+    assert client.get("/api/notifications/employee/NOPE/stream").status_code == 404
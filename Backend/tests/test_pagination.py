@@ -0,0 +1,28 @@
+def _walk(client, path, limit):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"after": cursor} if cursor else {})}
+        body = client.get(path, params=params).json()
+        ids += [task["taskId"] for task in body["tasks"]]
+        cursor = body["nextCursor"]
+        if cursor is None:
+            return ids
+
+
+def test_pages_cover_every_task_once_newest_first(client, create_task):
+    for i in range(7):
+        create_task(f"page-{i}", manager_id="MGR002")
+
+    everything = [t["taskId"] for t in client.get("/api/tasks/queue/MGR002").json()["tasks"]]
+
+    assert _walk(client, "/api/tasks/queue/MGR002", limit=3) == everything
+    assert _walk(client, "/api/tasks/", limit=4) == [
+        t["taskId"] for t in client.get("/api/tasks/").json()["tasks"]
+    ]
+
+
+def test_bad_cursor_is_rejected(client):
+    for cursor in ("not-a-cursor", "e30"):
+        response = client.get("/api/tasks/", params={"limit": 2, "after": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"]["message"] == "Invalid cursor"
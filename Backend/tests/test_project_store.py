@@ -0,0 +1,45 @@
+import pytest
+
+from app.services.backends.json_backend import JsonProjectStore
+from app.services.backends.sqlite_backend import SqliteDatabase, SqliteProjectStore
+
+
+def _stores(tmp_path):
+    return [
+        JsonProjectStore(tmp_path / "projects.json"),
+        SqliteProjectStore(SqliteDatabase(tmp_path / "pms.sqlite3"))
+    ]
+
+
+@pytest.mark.parametrize("index", [0, 1], ids=["json", "sqlite"])
+def test_names_are_unique_per_manager_ignoring_case(tmp_path, index):
+    store = _stores(tmp_path)[index]
+    store.create_project({"managerId": "MGR001", "projectName": "Apollo"})
+
+    with pytest.raises(ValueError):
+        store.create_project({"managerId": "MGR001", "projectName": "APOLLO"})
+    # Another manager may reuse the name
+    store.create_project({"managerId": "MGR002", "projectName": "apollo"})
+
+    assert [p["projectName"] for p in store.get_projects_for_manager("MGR001")] == ["Apollo"]
+    assert [p["projectName"] for p in store.get_projects_for_manager("MGR002")] == ["apollo"]
+    assert store.get_projects_for_manager("MGR003") == []
+    assert len(store.get_all_projects()) == 2
+
+
+def test_json_indexes_follow_other_processes(tmp_path):
+    # Two stores on one file stand in for two worker processes
+    first = JsonProjectStore(tmp_path / "projects.json")
+    second = JsonProjectStore(tmp_path / "projects.json")
+    assert first.get_projects_for_manager("MGR001") == []
+
+    created = second.create_project({"managerId": "MGR001", "projectName": "Apollo"})
+
+    assert [p["projectId"] for p in first.get_projects_for_manager("MGR001")] == [
+        created["projectId"]
+    ]
+    with pytest.raises(ValueError):
+        first.create_project({"managerId": "MGR001", "projectName": "apollo"})
+    assert first.create_project(
+        {"managerId": "MGR001", "projectName": "Gemini"}
+    )["projectId"] == created["projectId"] + 1
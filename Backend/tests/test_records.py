@@ -0,0 +1,44 @@
+import json
+
+from app.records import HistoryEntry, NotificationRecord, TaskRecord, to_json
+
+from conftest import BACKEND_DIR
+
+
+def test_seed_tasks_round_trip():
+    with open(BACKEND_DIR / "app" / "storage" / "tasks.json") as f:
+        tasks = json.load(f)["tasks"]
+    assert tasks
+    for data in tasks:
+        as_dict = TaskRecord.from_dict(data).to_dict()
+        # Keys missing from the file come back with their defaults
+        assert {key: as_dict[key] for key in data} == data
+
+
+def test_notification_and_history_round_trip():
+    notification = {
+        "notificationId": 7, "employeeId": "EMP001", "employeeName": "A",
+        "managerId": "MGR001", "managerName": "M", "taskId": 3,
+        "message": "hi", "isRead": False, "createdAt": "2026-01-01 10:00:00"
+    }
+    entry = {
+        "taskId": 3, "taskTitle": "t", "managerId": "MGR001", "managerName": "M",
+        "assignedAt": "2026-01-01 10:00:00", "status": "Completed",
+        "completedAt": "2026-01-02 10:00:00"
+    }
+    assert NotificationRecord.from_dict(notification).to_dict() == notification
+    assert HistoryEntry.from_dict(entry).to_dict() == entry
+    assert to_json({"items": [HistoryEntry.from_dict(entry)]}) == {"items": [entry]}
+
+
+def test_records_are_slotted_and_share_interned_values():
+    first = TaskRecord.from_dict({
+        "title": "a", "description": "d", "priority": "".join(["Hi", "gh"]),
+        "status": "Pending", "managerId": "MGR001", "managerName": "M"
+    })
+    second = TaskRecord.from_dict({
+        "title": "b", "description": "d", "priority": "".join(["Hi", "gh"]),
+        "status": "Pending", "managerId": "MGR001", "managerName": "M"
+    })
+    assert not hasattr(first, "__dict__")
+    assert first.priority is second.priority
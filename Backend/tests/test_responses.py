@@ -0,0 +1,42 @@
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app import config, responses
+from app.services import notifications
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_dumps_matches_starlette(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    content = {"name": "Zoë ✓", "n": [1, 2.5, None, True], "nested": {"a": "\"q\""}}
+    assert responses.dumps(content) == JSONResponse(content).body
+
+
+@pytest.mark.parametrize("path", ["/api/tasks/", "/api/notifications/", "/api/employees/"])
+def test_streamed_lists_are_byte_identical(client, create_task, monkeypatch, path):
+    create_task("stream")
+    rendered = client.get(path)
+
+    monkeypatch.setattr(config, "STREAM_MIN_ITEMS", 0)
+    monkeypatch.setattr(responses, "STREAM_CHUNK_ITEMS", 2)
+    streamed = client.get(path)
+
+    assert streamed.status_code == rendered.status_code == 200
+    assert streamed.content == rendered.content
+    assert streamed.headers.get("ETag") == rendered.headers.get("ETag")
+    # The same bytes FastAPI's default response would have produced
+    assert rendered.content == JSONResponse(jsonable_encoder(json.loads(rendered.content))).body
+
+
+def test_notification_stats_match_the_list(client):
+    body = client.get("/api/notifications/").json()
+    unread = sum(1 for n in body["notifications"] if not n["isRead"])
+    assert body["stats"] == {
+        "total": len(body["notifications"]), "unread": unread,
+        "read": len(body["notifications"]) - unread
+    }
+    assert body["stats"] == notifications.count_notifications()
@@ -0,0 +1,75 @@
+from dataclasses import replace
+
+import pytest
+
+from app.records import Assignee
+from app.services import project_tasks
+from app.services.backends.json_backend import JsonTaskStore
+from app.services.backends.sqlite_backend import SqliteDatabase, SqliteTaskStore
+from app.services.result_cache import VersionedLRUCache
+
+from conftest import make_task
+
+
+def test_entries_are_recomputed_when_their_version_changes():
+    cache = VersionedLRUCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        def run():
+            calls.append(value)
+            return value
+        return run
+
+    assert cache.get_or_compute("a", 1, compute("a1")) == "a1"
+    assert cache.get_or_compute("a", 1, compute("unused")) == "a1"
+    assert cache.get_or_compute("a", 2, compute("a2")) == "a2"
+    assert calls == ["a1", "a2"]
+
+    # Least recently used goes first
+    cache.get_or_compute("b", 1, compute("b1"))
+    cache.get_or_compute("a", 2, compute("unused"))
+    cache.get_or_compute("c", 1, compute("c1"))
+    assert cache.get_or_compute("a", 2, compute("unused")) == "a2"
+    assert cache.get_or_compute("b", 1, compute("b1 again")) == "b1 again"
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_versions_change_only_for_the_touched_scope(tmp_path, backend):
+    if backend == "json":
+        store = JsonTaskStore(tmp_path / "tasks.json")
+    else:
+        store = SqliteTaskStore(SqliteDatabase(tmp_path / "pms.sqlite3"))
+    task = store.create_task(make_task("a", metadata={"projectName": "P1"}))
+    store.create_task(make_task("b", manager_id="MGR002", metadata={"projectName": "P2"}))
+
+    def versions():
+        return {
+            "MGR001": store.get_version(manager_id="MGR001"),
+            "MGR002": store.get_version(manager_id="MGR002"),
+            "P1": store.get_version(project_name="P1"),
+            "P2": store.get_version(project_name="P2"),
+            "EMP001": store.get_version(employee_id="EMP001"),
+            "EMP002": store.get_version(employee_id="EMP002"),
+        }
+
+    before = versions()
+    store.update_task(replace(
+        store.get_task_by_id(task.task_id),
+        assigned_employees=(Assignee("EMP001", "E"),)
+    ))
+    after = versions()
+    changed = {scope for scope in before if before[scope] != after[scope]}
+    assert changed == {"MGR001", "P1", "EMP001"}
+
+
+def test_project_summary_follows_task_writes(client, create_task):
+    first = project_tasks.get_projects_summary_for_manager("MGR002")
+    # Unchanged data: the cached list itself is served
+    assert project_tasks.get_projects_summary_for_manager("MGR002") is first
+    assert "CacheProbe" not in {p["projectName"] for p in first}
+
+    create_task("cached", manager_id="MGR002", metadata={"projectName": "CacheProbe"})
+
+    after = {p["projectName"]: p for p in project_tasks.get_projects_summary_for_manager("MGR002")}
+    assert after["CacheProbe"]["totalTasks"] == 1
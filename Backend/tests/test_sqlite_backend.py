@@ -0,0 +1,68 @@
+from dataclasses import replace
+
+from app.records import Assignee
+from app.services.backends.json_backend import JsonProjectStore, JsonTaskStore
+from app.services.backends.sqlite_backend import (
+    SqliteDatabase,
+    SqliteProjectStore,
+    SqliteTaskStore,
+    migrate_from_json
+)
+
+from conftest import make_task
+
+
+def _json_store(tmp_path):
+    json_store = JsonTaskStore(tmp_path / "tasks.json")
+    json_store.create_tasks([
+        make_task("a", metadata={"projectName": "P"}),
+        make_task("b", manager_id="MGR002")
+    ])
+    JsonProjectStore(tmp_path / "projects.json").create_project(
+        {"managerId": "MGR001", "projectName": "P"}
+    )
+    return json_store
+
+
+def test_migration_imports_json_once(tmp_path):
+    json_store = _json_store(tmp_path)
+    db = SqliteDatabase(tmp_path / "pms.sqlite3")
+
+    assert migrate_from_json(db, tmp_path / "tasks.json", tmp_path / "projects.json")
+    assert not migrate_from_json(db, tmp_path / "tasks.json", tmp_path / "projects.json")
+
+    store = SqliteTaskStore(db)
+    assert [t.to_dict() for t in store.get_all_tasks()] == [
+        t.to_dict() for t in json_store.get_all_tasks()
+    ]
+    assert [p["projectName"] for p in SqliteProjectStore(db).get_all_projects()] == ["P"]
+
+    # New ids continue after the imported high-water mark
+    assert store.create_task(make_task("c")).task_id > 2
+
+
+def test_triggers_maintain_counts_and_versions(tmp_path):
+    store = SqliteTaskStore(SqliteDatabase(tmp_path / "pms.sqlite3"))
+    task = store.create_task(make_task("a", metadata={"projectName": "P"}))
+    store.create_task(make_task("b", manager_id="MGR002"))
+
+    versions = (
+        store.get_version(manager_id="MGR001"),
+        store.get_version(project_name="P"),
+        store.get_version(employee_id="EMP001"),
+        store.get_version(manager_id="MGR002")
+    )
+
+    store.update_task(replace(
+        store.get_task_by_id(task.task_id),
+        status="Assigned",
+        assigned_employees=(Assignee("EMP001", "Employee"),)
+    ))
+
+    assert store.count_by_status("MGR001") == {"Assigned": 1}
+    assert store.count_by_status() == {"Assigned": 1, "Pending": 1}
+    assert store.get_version(manager_id="MGR001") > versions[0]
+    assert store.get_version(project_name="P") > versions[1]
+    assert store.get_version(employee_id="EMP001") > versions[2]
+    assert store.get_version(manager_id="MGR002") == versions[3]
+    assert [t.task_id for t in store.query_tasks(employee_id="EMP001")] == [task.task_id]
@@ -0,0 +1,55 @@
+import random
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+
+from app.enums import TaskStatus
+from app.services.backends.json_backend import JsonTaskStore
+from app.services.backends.sqlite_backend import SqliteDatabase, SqliteTaskStore
+
+from conftest import make_task
+
+STATUSES = [status.value for status in TaskStatus]
+
+
+def _store(tmp_path, backend):
+    if backend == "json":
+        return JsonTaskStore(tmp_path / "tasks.json")
+    return SqliteTaskStore(SqliteDatabase(tmp_path / "pms.sqlite3"))
+
+
+def _scan(store, manager_id=None):
+    return dict(Counter(
+        task.status for task in store.get_all_tasks()
+        if manager_id is None or task.manager_id == manager_id
+    ))
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_counters_match_a_full_scan_after_updates(tmp_path, backend):
+    rng = random.Random(12)
+    store = _store(tmp_path, backend)
+    store.create_tasks([
+        make_task(f"t{i}", manager_id=rng.choice(["MGR001", "MGR002"])) for i in range(30)
+    ])
+    for task in rng.sample(store.get_all_tasks(), 20):
+        store.update_task(replace(store.get_task_by_id(task.task_id), status=rng.choice(STATUSES)))
+    # Moving a task back and forth leaves the counters where they were
+    task = store.get_task_by_id(1)
+    store.update_tasks([replace(task, status="Completed")])
+    store.update_task(replace(store.get_task_by_id(1), status=task.status))
+
+    for manager_id in (None, "MGR001", "MGR002", "MGR003"):
+        assert store.count_by_status(manager_id) == _scan(store, manager_id), manager_id
+
+
+def test_json_counters_follow_other_processes(tmp_path):
+    first = JsonTaskStore(tmp_path / "tasks.json")
+    second = JsonTaskStore(tmp_path / "tasks.json")
+    first.create_task(make_task("a"))
+    assert second.count_by_status("MGR001") == {"Pending": 1}
+
+    second.update_task(replace(second.get_task_by_id(1), status="Completed"))
+    assert first.count_by_status("MGR001") == {"Completed": 1}
+    assert first.count_by_status() == {"Completed": 1}
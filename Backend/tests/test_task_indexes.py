@@ -0,0 +1,61 @@
+import random
+from dataclasses import replace
+
+from app.enums import TaskStatus
+from app.records import Assignee
+from app.services.backends.json_backend import JsonTaskStore
+
+from conftest import make_task
+
+STATUSES = [status.value for status in TaskStatus]
+EMPLOYEES = ["EMP001", "EMP002", "EMP003"]
+
+
+def _matches(task, manager_id, status, project_name, employee_id):
+    return (
+        (manager_id is None or task.manager_id == manager_id)
+        and (status is None or task.status == status)
+        and (project_name is None or task.project_name == project_name)
+        and (employee_id is None or employee_id in task.employee_ids)
+    )
+
+
+def test_queries_match_a_full_scan_after_updates(tmp_path):
+    rng = random.Random(3)
+    store = JsonTaskStore(tmp_path / "tasks.json")
+    store.create_tasks([
+        make_task(
+            f"t{i}",
+            manager_id=rng.choice(["MGR001", "MGR002"]),
+            metadata={"projectName": rng.choice(["P1", "P2"])}
+        )
+        for i in range(40)
+    ])
+    for task in rng.sample(store.get_all_tasks(), 25):
+        store.update_task(replace(
+            store.get_task_by_id(task.task_id),
+            status=rng.choice(STATUSES),
+            assigned_employees=tuple(Assignee(e, e) for e in rng.sample(EMPLOYEES, 2))
+        ))
+
+    everything = store.get_all_tasks()
+    for filters in [
+        ("MGR001", None, None, None),
+        (None, "Assigned", None, None),
+        ("MGR002", "Completed", "P1", None),
+        (None, None, None, "EMP002"),
+        (None, None, "P2", "EMP003"),
+    ]:
+        expected = [t.task_id for t in everything if _matches(t, *filters)]
+        found = store.query_tasks(*filters[:3], employee_id=filters[3])
+        assert [t.task_id for t in found] == expected, filters
+
+
+def test_queue_status_counts_match_the_tasks(client, create_task):
+    for i in range(3):
+        create_task(f"counts-{i}", manager_id="MGR002")
+
+    body = client.get("/api/tasks/queue/MGR002").json()
+    for status, count in body["statusCounts"].items():
+        assert count == sum(1 for t in body["tasks"] if t["status"] == status)
+    assert sum(body["statusCounts"].values()) == body["count"]
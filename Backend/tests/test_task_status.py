@@ -0,0 +1,27 @@
+from app.services import dispatcher
+
+
+def _workload(client, employee_id):
+    return client.get(f"/api/employees/{employee_id}").json()["data"]["noOfActiveProjects"]
+
+
+def test_status_change_is_persisted_with_its_side_effects(client, create_task):
+    task_id = create_task("status")
+    client.post(f"/api/tasks/{task_id}/assign", json={"managerId": "MGR001", "employeeIds": ["EMP015"]})
+    assigned = _workload(client, "EMP015")
+
+    response = client.patch(f"/api/tasks/{task_id}/status", params={"new_status": "Completed"})
+    assert response.status_code == 200
+
+    assert client.get(f"/api/tasks/{task_id}").json()["data"]["task"]["status"] == "Completed"
+    assert _workload(client, "EMP015") == assigned - 1
+    client.portal.call(dispatcher.drain)
+    history = client.get("/api/employees/EMP015/task-history").json()["taskHistory"]["fullHistory"]
+    assert {e["taskId"]: e["status"] for e in history}[task_id] == "Completed"
+
+
+def test_invalid_status_changes_nothing(client, create_task):
+    task_id = create_task("status-bad")
+    response = client.patch(f"/api/tasks/{task_id}/status", params={"new_status": "Done"})
+    assert response.status_code == 400
+    assert client.get(f"/api/tasks/{task_id}").json()["data"]["task"]["status"] == "Pending"
@@ -0,0 +1,27 @@
+from app.services.backends.json_backend import JsonTaskStore
+
+from conftest import make_task
+
+
+def test_unchanged_store_is_served_from_memory(tmp_path):
+    store = JsonTaskStore(tmp_path / "tasks.json")
+    store.create_tasks([make_task(f"t{i}") for i in range(3)])
+
+    first = store.get_all_tasks()
+    assert all(a is b for a, b in zip(first, store.get_all_tasks()))
+
+
+def test_writes_from_another_instance_are_picked_up(tmp_path):
+    task_file = tmp_path / "tasks.json"
+    reader = JsonTaskStore(task_file)
+    writer = JsonTaskStore(task_file)
+    assert reader.get_all_tasks() == []
+
+    created = writer.create_task(make_task("new"))
+    assert [t.task_id for t in reader.get_all_tasks()] == [created.task_id]
+
+    task = writer.get_task_by_id(created.task_id)
+    task.status = "Completed"
+    writer.update_task(task)
+    writer.compact()
+    assert reader.get_task_by_id(created.task_id).status == "Completed"
@@ -1,4 +1,5 @@
 import apiClient from "./index.js";
+import { API_BASE_URL } from "../utils/constants.js";
 
 export const notificationService = {
   // GET notifications for employee
@@ -12,4 +13,10 @@ export const notificationService = {
   // PATCH mark all as read
   markAllAsRead: (employeeId) =>
     apiClient.patch(`/api/notifications/employee/${employeeId}/read-all`),
+
+  // SSE stream of new notifications (ids above afterId)
+  openStream: (employeeId, afterId) =>
+    new EventSource(
+      `${API_BASE_URL}/api/notifications/employee/${employeeId}/stream?after=${afterId}`
+    ),
 };
@@ -16,6 +16,10 @@ export const taskService = {
   // GET /api/tasks/employee/{employeeId} (Fetch tasks for a specific employee)
   getEmployeeTasks: (employeeId) => apiClient.get(`/api/tasks/employee/${employeeId}/`),
 
+  // GET /api/tasks/employees/active?ids=... (Active tasks of many employees in one call)
+  getEmployeesTasks: (employeeIds) =>
+    apiClient.get("/api/tasks/employees/active", { params: { ids: employeeIds.join(",") } }),
+
   // PATCH /api/tasks/{taskId}/employee-status (Update task status by employee)
   updateTaskStatus: (taskId, employeeId, newStatus) => 
     apiClient.patch(`/api/tasks/${taskId}/employee-status/`, {
@@ -16,31 +16,57 @@ const Header = ({ user, onLogout, activeTab }) => {
   // Fetch Notifications
   // ===============================
   const fetchNotifs = async () => {
-    if (!isEmployee || !user?.id) return;
+    if (!isEmployee || !user?.id) return [];
 
     try {
       setLoading(true);
       const response = await notificationService.getNotifications(user.id);
 
       if (response?.data?.success) {
-        setNotifications(response.data.notifications || []);
+        const items = response.data.notifications || [];
+        setNotifications(items);
         setUnreadCount(response.data.stats?.unread || 0);
+        return items;
       }
     } catch (err) {
       console.error("Failed to fetch notifications", err);
     } finally {
       setLoading(false);
     }
+    return [];
   };
 
-  // Initial load + polling
+  // Initial load, then live updates over SSE (polling only as a fallback)
   useEffect(() => {
-    if (!isEmployee) return;
+    if (!isEmployee || !user?.id) return;
+
+    let source = null;
+    let interval = null;
+    let closed = false;
 
-    fetchNotifs();
-    const interval = setInterval(fetchNotifs, 60000);
+    fetchNotifs().then((items) => {
+      if (closed) return;
 
-    return () => clearInterval(interval);
+      if (typeof EventSource === 'undefined') {
+        interval = setInterval(fetchNotifs, 60000);
+        return;
+      }
+
+      // Resume right after the newest notification already loaded
+      const lastId = Math.max(0, ...items.map(n => n.notificationId));
+      source = notificationService.openStream(user.id, lastId);
+      source.addEventListener('notification', (event) => {
+        const notif = JSON.parse(event.data);
+        setNotifications(prev => [notif, ...prev]);
+        if (!notif.isRead) setUnreadCount(prev => prev + 1);
+      });
+    });
+
+    return () => {
+      closed = true;
+      if (source) source.close();
+      if (interval) clearInterval(interval);
+    };
   }, [user?.id, isEmployee]);
 
   // Close dropdown on outside click
@@ -4,27 +4,7 @@ import { taskService } from '../api/taskApi';
 import EmployeeDetailsModal from '../components/EmployeeDetailsModal/EmployeeDetailsModal';
  
 // --- Horizontal Scrollable Employee Card ---
-const HorizontalEmployeeCard = ({ employee, onAction, onViewDetails }) => {
-  const [tasks, setTasks] = useState([]);
-  const [loading, setLoading] = useState(true);
- 
-  useEffect(() => {
-    const fetchTasks = async () => {
-      try {
-        setLoading(true);
-        const response = await taskService.getEmployeeTasks(employee.id);
-        if (response.data && response.data.success) {
-          setTasks(response.data.tasks || []);
-        }
-      } catch (error) {
-        console.error(`Failed to fetch tasks for ${employee.name}`, error);
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchTasks();
-  }, [employee.id]);
- 
+const HorizontalEmployeeCard = ({ employee, tasks, loading, onAction, onViewDetails }) => {
   const activeTasks = tasks.filter(t => t.status === 'Assigned' || t.status === 'In Progress');
   const activeCount = activeTasks.length;
  
@@ -111,27 +91,7 @@ const HorizontalEmployeeCard = ({ employee, onAction, onViewDetails }) => {
 };
  
 // --- Grid Employee Card (for View All modal) ---
-const GridEmployeeCard = ({ employee, onAction, onViewDetails }) => {
-  const [tasks, setTasks] = useState([]);
-  const [loading, setLoading] = useState(true);
- 
-  useEffect(() => {
-    const fetchTasks = async () => {
-      try {
-        setLoading(true);
-        const response = await taskService.getEmployeeTasks(employee.id);
-        if (response.data && response.data.success) {
-          setTasks(response.data.tasks || []);
-        }
-      } catch (error) {
-        console.error(`Failed to fetch tasks for ${employee.name}`, error);
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchTasks();
-  }, [employee.id]);
- 
+const GridEmployeeCard = ({ employee, tasks, loading, onAction, onViewDetails }) => {
   const activeTasks = tasks.filter(t => t.status === 'Assigned' || t.status === 'In Progress');
   const activeCount = activeTasks.length;
  
@@ -204,7 +164,7 @@ const GridEmployeeCard = ({ employee, onAction, onViewDetails }) => {
 };
  
 // --- View All Employees Modal ---
-const ViewAllEmployeesModal = ({ employees, onClose, onAction, onViewDetails }) => {
+const ViewAllEmployeesModal = ({ employees, tasksByEmployee, tasksLoading, onClose, onAction, onViewDetails }) => {
   return (
     <div className="fixed inset-0 bg-black/60 backdrop-blur-sm flex items-center justify-center z-[100] p-6 animate-fadeIn">
       <div className="bg-[#E8E4F0] rounded-3xl shadow-2xl max-w-7xl w-full max-h-[90vh] overflow-hidden border-2 border-[#9B8AC7]/30">
@@ -234,6 +194,8 @@ const ViewAllEmployeesModal = ({ employees, onClose, onAction, onViewDetails })
               <GridEmployeeCard
                 key={emp.id}
                 employee={emp}
+                tasks={tasksByEmployee[emp.id] || []}
+                loading={tasksLoading}
                 onAction={onAction}
                 onViewDetails={() => {
                   onClose();
@@ -255,12 +217,36 @@ const ManagerDashboard = ({ onOpenImport, onAction, user }) => {
   const [showAllEmployees, setShowAllEmployees] = useState(false);
   const [refreshKey, setRefreshKey] = useState(0);
   const [projects, setProjects] = useState([]);
+  const [tasksByEmployee, setTasksByEmployee] = useState({});
+  const [tasksLoading, setTasksLoading] = useState(true);
  
   useEffect(() => {
     loadAssignmentLogs();
     loadProjects();
   }, [user, refreshKey]);
  
+  // Active tasks of the whole team in one request (not one per card)
+  useEffect(() => {
+    const loadTeamTasks = async () => {
+      if (profileEmployees.length === 0) {
+        setTasksLoading(profilesLoading);
+        return;
+      }
+      try {
+        setTasksLoading(true);
+        const response = await taskService.getEmployeesTasks(profileEmployees.map(emp => emp.id));
+        if (response.data && response.data.success) {
+          setTasksByEmployee(response.data.tasksByEmployee || {});
+        }
+      } catch (error) {
+        console.error("Failed to fetch team tasks", error);
+      } finally {
+        setTasksLoading(false);
+      }
+    };
+    loadTeamTasks();
+  }, [profileEmployees, profilesLoading, refreshKey]);
+ 
   const loadProjects = async () => {
     try {
       setProjects([
@@ -485,6 +471,8 @@ const ManagerDashboard = ({ onOpenImport, onAction, user }) => {
                     <HorizontalEmployeeCard
                       key={emp.id}
                       employee={emp}
+                      tasks={tasksByEmployee[emp.id] || []}
+                      loading={tasksLoading}
                       onAction={onAction}
                       onViewDetails={() => setSelectedEmployeeForDetails(emp)}
                     />
@@ -597,6 +585,8 @@ const ManagerDashboard = ({ onOpenImport, onAction, user }) => {
       {showAllEmployees && (
         <ViewAllEmployeesModal
           employees={sortedEmployees}
+          tasksByEmployee={tasksByEmployee}
+          tasksLoading={tasksLoading}
           onClose={() => setShowAllEmployees(false)}
           onAction={onAction}
           onViewDetails={setSelectedEmployeeForDetails}